@@ -0,0 +1,23 @@
+# ----------------------------------------
+# IMPORTS
+# ----------------------------------------
+
+from .benchmark_methods import BENCHMARK_STAGES, BenchmarkStage, run_benchmarks, find_regressions
+from .corpora import URL_CORPORA
+from .fake_whois import fake_whois, install_fake_whois
+
+# ----------------------------------------
+# PACKAGE MANAGEMENT
+# ----------------------------------------
+
+__all__ = [
+    "BENCHMARK_STAGES",
+    "BenchmarkStage",
+    "run_benchmarks",
+    "find_regressions",
+    "URL_CORPORA",
+    "fake_whois",
+    "install_fake_whois",
+]
+__version__ = "0.0.1"
+__author__ = "HysingerDev"
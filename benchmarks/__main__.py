@@ -0,0 +1,10 @@
+# ----------------------------------------
+# IMPORTS
+# ----------------------------------------
+
+import sys
+
+from benchmarks.benchmark_methods import main
+
+# Entry point -> 'python -m benchmarks [--update-baseline] [--margin 0.5] [--stage NAME]'.
+sys.exit(main())
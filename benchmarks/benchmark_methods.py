@@ -0,0 +1,505 @@
+# ----------------------------------------
+# IMPORTS
+# ----------------------------------------
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from benchmarks.corpora import URL_CORPORA
+from benchmarks.fake_whois import install_fake_whois
+from src.backend.pipeline.character_methods import build_character_histogram, retrieve_character_based_data
+from src.backend.pipeline.final_pipeline import finalised_data_pipeline_for_web
+from src.backend.pipeline.helper_methods import (
+  calculate_shannon_entropy,
+  is_domain_typosquatted,
+  retrieve_remaining_data,
+  typosquatted_domains_index
+)
+from src.backend.pipeline.parsing_methods import canonicalize_url, final_url_parser, parse_url
+from src.backend.pipeline.suffix_methods import warm_tld_extractor
+from src.backend.pipeline.whois_methods import retrieve_extracted_url_data
+
+# Stored reference results -> Regenerate with '--update-baseline' in the same commit as any change
+# that moves a stage past the margin, so the gate passes on every commit of the tree.
+BASELINE_PATH = Path(__file__).parent / "baseline.json"
+
+# Suite runs per measurement, each in a fresh interpreter -> A single process can see single stages
+# slowed by up to 1.5x throughout; the median over processes is far more stable.
+DEFAULT_RUNS = 3
+BASELINE_RUNS = 5
+
+# Relative slowdown (or allocation growth) tolerated before a stage counts as regressed -> Shared hosts
+# slow single stages by up to 1.5x for minutes, a real regression (fx. 2x) stands out from that.
+DEFAULT_MARGIN = 0.5
+
+# Many short rounds per stage & corpus -> On shared hosts whose speed changes several times a second,
+# the fastest round still lands in a quiet period, where a few long rounds may all be slowed down.
+DEFAULT_ROUNDS = 15
+DEFAULT_MIN_ROUND_TIME = 0.02
+
+# Stage & corpus timings needed to estimate the machine speed -> Fewer (fx. a single '--stage') are
+# compared against the unscaled baseline, as their median would absorb their own regression.
+MIN_SPEED_SAMPLES = 10
+
+# Re-measurements of the stages past the margin before the gate fails.
+CONFIRMATION_RUNS = 2
+
+# ----------------------------------------
+# BENCHMARK STAGES
+# ----------------------------------------
+
+# A single timed Pipeline stage -> 'prepare' builds the call arguments outside the timed loop.
+@dataclass(frozen=True)
+class BenchmarkStage:
+  """
+  Pipeline stage timed by the Benchmark Suite - Utility class in Trotline Benchmark Suite.
+
+  Attributes
+  ----------
+  name : str
+    Stage name used in reports & the baseline.
+  function : Callable[..., Any]
+    Stage function to be timed.
+  prepare : Callable[[str], tuple]
+    Builds the positional arguments of one call from a URL-string (not timed).
+  """
+  name: str
+  function: Callable[..., Any]
+  prepare: Callable[[str], tuple]
+
+# Every benchmarked stage, from the smallest helper to the full single-URL Pipeline.
+BENCHMARK_STAGES: Tuple[BenchmarkStage, ...] = (
+  BenchmarkStage("canonicalize_url", canonicalize_url, lambda url: (url,)),
+  BenchmarkStage("parse_url", parse_url, lambda url: (url,)),
+  BenchmarkStage("build_character_histogram", build_character_histogram, lambda url: (url,)),
+  BenchmarkStage("calculate_shannon_entropy", calculate_shannon_entropy, lambda url: (url,)),
+  BenchmarkStage(
+    "is_domain_typosquatted",
+    is_domain_typosquatted,
+    lambda url: (parse_url(url), typosquatted_domains_index, 2)
+  ),
+  BenchmarkStage("final_url_parser", final_url_parser, lambda url: (url,)),
+  BenchmarkStage("retrieve_character_based_data", retrieve_character_based_data, lambda url: (url,)),
+  BenchmarkStage("retrieve_remaining_data", retrieve_remaining_data, lambda url: (url,)),
+  BenchmarkStage("retrieve_extracted_url_data", retrieve_extracted_url_data, lambda url: (url, parse_url(url))),
+  BenchmarkStage("finalised_data_pipeline_for_web", finalised_data_pipeline_for_web, lambda url: (url,)),
+)
+
+# ----------------------------------------
+# BENCHMARK MEASUREMENTS
+# ----------------------------------------
+
+# Time one stage over one corpus -> Best round, in nanoseconds per call.
+def measure_ns_per_op(
+    stage: BenchmarkStage,
+    calls: Sequence[tuple],
+    rounds: int,
+    min_round_time: float
+  ) -> float:
+  """
+  Time the stage over the prepared calls - Utility method in Trotline Benchmark Suite. The number
+  of passes per round is calibrated so every round lasts at least 'min_round_time' seconds; the
+  fastest round is reported, which filters out scheduler & cache noise.
+
+  Parameters
+  ----------
+  stage : BenchmarkStage
+    Stage to be timed.
+  calls : Sequence[tuple]
+    Prepared positional arguments, one tuple per URL.
+  rounds : int
+    Number of timed rounds.
+  min_round_time : float
+    Minimum duration of a round in seconds.
+
+  Returns
+  -------
+  float
+    Nanoseconds per stage call.
+  """
+  function = stage.function
+
+  def run_passes(passes: int) -> int:
+    started_at = time.perf_counter_ns()
+    for _ in range(passes):
+      for arguments in calls:
+        function(*arguments)
+    return time.perf_counter_ns() - started_at
+
+  # Calibrate the passes per round (also serves as warm-up).
+  passes = 1
+  while run_passes(passes) < min_round_time * 1e9:
+    passes *= 2
+
+  best_round = min(run_passes(passes) for _ in range(rounds))
+
+  return best_round / (passes * len(calls))
+
+# Measure the transient memory allocated by one stage call, averaged over the corpus.
+def measure_bytes_per_op(stage: BenchmarkStage, calls: Sequence[tuple]) -> float:
+  """
+  Trace the peak memory allocated while the stage runs, per call - Utility method in Trotline
+  Benchmark Suite. Measured in a separate, untimed pass since tracing slows every allocation.
+
+  Parameters
+  ----------
+  stage : BenchmarkStage
+    Stage to be traced.
+  calls : Sequence[tuple]
+    Prepared positional arguments, one tuple per URL.
+
+  Returns
+  -------
+  float
+    Average peak allocation in bytes per stage call.
+  """
+  allocated_bytes = 0
+
+  tracemalloc.start()
+  try:
+    for arguments in calls:
+      tracemalloc.reset_peak()
+      current_bytes, _ = tracemalloc.get_traced_memory()
+      stage.function(*arguments)
+      _, peak_bytes = tracemalloc.get_traced_memory()
+      allocated_bytes += peak_bytes - current_bytes
+  finally:
+    tracemalloc.stop()
+
+  return allocated_bytes / len(calls)
+
+# Run every selected stage over every corpus.
+def run_benchmarks(
+    stage_names: Optional[Sequence[str]] = None,
+    rounds: int = DEFAULT_ROUNDS,
+    min_round_time: float = DEFAULT_MIN_ROUND_TIME
+  ) -> Dict[str, Dict[str, Dict[str, float]]]:
+  """
+  Benchmark the selected Pipeline stages over the fixed URL corpora with WHOIS routed to the fake
+  registry - Utility method in Trotline Benchmark Suite.
+
+  Parameters
+  ----------
+  stage_names : Sequence[str] | None
+    Names of the stages to be run - every stage if omitted.
+  rounds : int
+    Number of timed rounds per stage & corpus.
+  min_round_time : float
+    Minimum duration of a round in seconds.
+
+  Returns
+  -------
+  dict[str, dict[str, dict[str, float]]]
+    'ns_per_op' & 'bytes_per_op' per stage and corpus.
+  """
+  stages = [stage for stage in BENCHMARK_STAGES if not stage_names or stage.name in stage_names]
+  results: Dict[str, Dict[str, Dict[str, float]]] = {}
+
+  warm_tld_extractor()
+
+  with install_fake_whois():
+    for stage in stages:
+      results[stage.name] = {}
+      for corpus_name, urls in URL_CORPORA.items():
+        calls = [stage.prepare(url) for url in urls]
+        results[stage.name][corpus_name] = {
+          "ns_per_op": round(measure_ns_per_op(stage, calls, rounds, min_round_time), 1),
+          "bytes_per_op": round(measure_bytes_per_op(stage, calls), 1),
+        }
+
+  return results
+
+# Per stage & corpus median of several suite runs.
+def median_results(runs: Sequence[Dict[str, Dict[str, Dict[str, float]]]]) -> Dict[str, Dict[str, Dict[str, float]]]:
+  """
+  Combine several results of 'run_benchmarks' over the same stages into their per metric median -
+  Utility method in Trotline Benchmark Suite.
+
+  Parameters
+  ----------
+  runs : Sequence[dict[str, dict[str, dict[str, float]]]]
+    Results of the individual suite runs.
+
+  Returns
+  -------
+  dict[str, dict[str, dict[str, float]]]
+    Median 'ns_per_op' & 'bytes_per_op' per stage and corpus.
+  """
+  return {
+    stage_name: {
+      corpus_name: {
+        metric: round(statistics.median(run[stage_name][corpus_name][metric] for run in runs), 1)
+        for metric in measurements
+      }
+      for corpus_name, measurements in corpora.items()
+    }
+    for stage_name, corpora in runs[0].items()
+  }
+
+# Run the selected stages in fresh interpreters -> Per stage & corpus median over the processes.
+def run_benchmarks_in_subprocesses(
+    stage_names: Optional[Sequence[str]] = None,
+    rounds: int = DEFAULT_ROUNDS,
+    min_round_time: float = DEFAULT_MIN_ROUND_TIME,
+    runs: int = DEFAULT_RUNS
+  ) -> Dict[str, Dict[str, Dict[str, float]]]:
+  """
+  Benchmark the selected Pipeline stages through 'python -m benchmarks --output' in 'runs' new
+  processes, one after another - Utility method in Trotline Benchmark Suite. Slowdowns that stick to
+  one process are outvoted by the other processes.
+
+  Parameters
+  ----------
+  stage_names : Sequence[str] | None
+    Names of the stages to be run - every stage if omitted.
+  rounds : int
+    Number of timed rounds per stage & corpus.
+  min_round_time : float
+    Minimum duration of a round in seconds.
+  runs : int
+    Number of benchmark processes.
+
+  Returns
+  -------
+  dict[str, dict[str, dict[str, float]]]
+    Median 'ns_per_op' & 'bytes_per_op' per stage and corpus.
+
+  Exceptions
+  ----------
+  RuntimeError
+    Raised if a benchmark process fails.
+  """
+  command = [
+    sys.executable, "-m", "benchmarks", "--rounds", str(rounds), "--min-round-time", str(min_round_time)
+  ]
+  for stage_name in stage_names or ():
+    command += ["--stage", stage_name]
+
+  results: List[Dict[str, Dict[str, Dict[str, float]]]] = []
+  with tempfile.TemporaryDirectory() as directory:
+    for run in range(runs):
+      output_path = Path(directory) / f"results-{run}.json"
+      completed = subprocess.run(
+        command + ["--output", str(output_path)], stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True
+      )
+      if completed.returncode != 0:
+        raise RuntimeError(f"Benchmark process failed with exit code {completed.returncode}: {completed.stderr.strip()}")
+
+      results.append(json.loads(output_path.read_text()))
+
+  return median_results(results)
+
+# ----------------------------------------
+# BENCHMARK BASELINE COMPARISON
+# ----------------------------------------
+
+# Median timing ratio against the baseline -> Speed of this machine & moment relative to the baseline run.
+def estimate_speed_factor(
+    results: Dict[str, Dict[str, Dict[str, float]]],
+    baseline: Dict[str, Dict[str, Dict[str, float]]]
+  ) -> float:
+  """
+  Estimate how much slower (or faster) the current run is than the baseline run as a whole - Utility
+  method in Trotline Benchmark Suite. The median of the per stage & corpus timing ratios follows
+  CPU frequency & host load, while a regression in a few stages barely moves it.
+
+  Parameters
+  ----------
+  results : dict[str, dict[str, dict[str, float]]]
+    Results of the current run.
+  baseline : dict[str, dict[str, dict[str, float]]]
+    Stored baseline results.
+
+  Returns
+  -------
+  float
+    Median ratio of current to baseline 'ns_per_op', never below 1 - 1 if fewer than
+    'MIN_SPEED_SAMPLES' timings are comparable.
+  """
+  ratios = [
+    measurements["ns_per_op"] / baseline[stage_name][corpus_name]["ns_per_op"]
+    for stage_name, corpora in results.items()
+    for corpus_name, measurements in corpora.items()
+    if baseline.get(stage_name, {}).get(corpus_name, {}).get("ns_per_op")
+  ]
+
+  # A faster machine is not scaled down -> Stages must then still beat the stored timings.
+  return max(statistics.median(ratios), 1.0) if len(ratios) >= MIN_SPEED_SAMPLES else 1.0
+
+# Compare the results against the stored baseline -> List every regression beyond the margin.
+def find_regressions(
+    results: Dict[str, Dict[str, Dict[str, float]]],
+    baseline: Dict[str, Dict[str, Dict[str, float]]],
+    margin: float,
+    speed_factor: float = 1.0
+  ) -> List[str]:
+  """
+  Compare every measured stage & corpus against the baseline - Utility method in Trotline
+  Benchmark Suite. Stages or corpora missing from the baseline are not compared. Baseline timings
+  are scaled by 'speed_factor' first, allocations are compared as-is.
+
+  Parameters
+  ----------
+  results : dict[str, dict[str, dict[str, float]]]
+    Current benchmark results.
+  baseline : dict[str, dict[str, dict[str, float]]]
+    Stored baseline results.
+  margin : float
+    Tolerated relative increase (fx. 0.5 = 50% slower or larger).
+  speed_factor : float
+    Result of 'estimate_speed_factor' - above 1 on a slower machine.
+
+  Returns
+  -------
+  list[str]
+    Human readable description of every regression.
+  """
+  regressions = []
+
+  for stage_name, corpora in results.items():
+    for corpus_name, measurements in corpora.items():
+      reference = baseline.get(stage_name, {}).get(corpus_name)
+      if reference is None:
+        continue
+
+      for metric, value in measurements.items():
+        scale = speed_factor if metric == "ns_per_op" else 1.0
+        limit = reference.get(metric, 0) * scale * (1 + margin)
+        if reference.get(metric) and value > limit:
+          regressions.append(
+            f"{stage_name} [{corpus_name}] {metric}: {value:,.1f} > {limit:,.1f} "
+            f"(baseline {reference[metric]:,.1f} x {scale:.2f} + {margin:.0%})"
+          )
+
+  return regressions
+
+# Render the results as a fixed-width table.
+def format_results(results: Dict[str, Dict[str, Dict[str, float]]]) -> str:
+  """
+  Format the benchmark results as a table with one row per stage & corpus - Utility method in
+  Trotline Benchmark Suite.
+
+  Parameters
+  ----------
+  results : dict[str, dict[str, dict[str, float]]]
+    Benchmark results.
+
+  Returns
+  -------
+  str
+    The formatted table.
+  """
+  lines = [f"{'stage':<34}{'corpus':<12}{'ns/op':>14}{'B/op':>12}"]
+
+  for stage_name, corpora in results.items():
+    for corpus_name, measurements in corpora.items():
+      lines.append(
+        f"{stage_name:<34}{corpus_name:<12}"
+        f"{measurements['ns_per_op']:>14,.1f}{measurements['bytes_per_op']:>12,.1f}"
+      )
+
+  return "\n".join(lines)
+
+# Command line entry point -> 'python -m benchmarks'.
+def main(argv: Optional[Sequence[str]] = None) -> int:
+  """
+  Run the Benchmark Suite, print the results and compare them against the baseline - Entry point
+  of the Trotline Benchmark Suite.
+
+  Parameters
+  ----------
+  argv : Sequence[str] | None
+    Command line arguments - 'sys.argv' if omitted.
+
+  Returns
+  -------
+  int
+    Exit code - 1 if any stage regressed past the margin, 0 otherwise.
+  """
+  parser = argparse.ArgumentParser(prog="python -m benchmarks", description="Trotline Pipeline microbenchmarks.")
+  parser.add_argument("--stage", action="append", dest="stages", help="Run only the named stage (repeatable).")
+  parser.add_argument("--rounds", type=int, default=DEFAULT_ROUNDS, help="Timed rounds per stage & corpus.")
+  parser.add_argument("--runs", type=int, default=DEFAULT_RUNS, help="Benchmark processes per measurement.")
+  parser.add_argument("--min-round-time", type=float, default=DEFAULT_MIN_ROUND_TIME, help="Minimum seconds per round.")
+  parser.add_argument("--margin", type=float, default=float(os.getenv("BENCHMARK_MARGIN", DEFAULT_MARGIN)),
+                      help="Tolerated relative regression (default 0.5).")
+  parser.add_argument("--baseline", type=Path, default=BASELINE_PATH, help="Baseline file location.")
+  parser.add_argument("--update-baseline", action="store_true", help="Store the results as the new baseline.")
+  parser.add_argument("--output", type=Path, help="Write the results as JSON instead of comparing them.")
+  arguments = parser.parse_args(argv)
+
+  # Every WHOIS lookup must reach the fake registry -> No in-process or shared caching.
+  os.environ["WHOIS_CACHE_SIZE"] = "0"
+  os.environ.pop("REDIS_URL", None)
+
+  if arguments.output:
+    results = run_benchmarks(arguments.stages, arguments.rounds, arguments.min_round_time)
+    arguments.output.write_text(json.dumps(results, indent=2, sort_keys=True) + "\n")
+    return 0
+
+  if arguments.update_baseline:
+    results = run_benchmarks_in_subprocesses(
+      arguments.stages, arguments.rounds, arguments.min_round_time, max(arguments.runs, BASELINE_RUNS)
+    )
+    print(format_results(results))
+
+    baseline = json.loads(arguments.baseline.read_text()) if arguments.baseline.exists() else {}
+    baseline.update({key: value for key, value in results.items()})
+    baseline["_environment"] = {"python": platform.python_version(), "machine": platform.machine()}
+    arguments.baseline.write_text(json.dumps(baseline, indent=2, sort_keys=True) + "\n")
+    print(f"\nBaseline updated -> {arguments.baseline}")
+    return 0
+
+  results = run_benchmarks_in_subprocesses(arguments.stages, arguments.rounds, arguments.min_round_time, arguments.runs)
+  print(format_results(results))
+
+  if not arguments.baseline.exists():
+    print(f"\nNo baseline found at {arguments.baseline} - run with '--update-baseline' first.")
+    return 0
+
+  baseline = json.loads(arguments.baseline.read_text())
+  speed_factor = estimate_speed_factor(results, baseline)
+
+  # Re-measure regressed stages, keeping the better median -> Noise rarely hits the same stage every
+  # time, while a real regression persists through every confirmation run.
+  for _ in range(CONFIRMATION_RUNS):
+    regressed_stages = [
+      name for name, corpora in results.items()
+      if find_regressions({name: corpora}, baseline, arguments.margin, speed_factor)
+    ]
+    if not regressed_stages:
+      break
+
+    print(f"\nRe-measuring {len(regressed_stages)} stage(s) past the margin: {', '.join(regressed_stages)}")
+    retry_results = run_benchmarks_in_subprocesses(
+      regressed_stages, arguments.rounds, arguments.min_round_time, arguments.runs
+    )
+    for stage_name, corpora in retry_results.items():
+      for corpus_name, measurements in corpora.items():
+        for metric, value in measurements.items():
+          results[stage_name][corpus_name][metric] = min(results[stage_name][corpus_name][metric], value)
+    speed_factor = estimate_speed_factor(results, baseline)
+
+  print(f"\nMachine speed vs baseline: {speed_factor:.2f}x median stage time")
+  regressions = find_regressions(results, baseline, arguments.margin, speed_factor)
+  if regressions:
+    print("\nRegressions:\n" + "\n".join(f"  {regression}" for regression in regressions))
+    return 1
+
+  print(f"\nNo regressions beyond {arguments.margin:.0%} of the baseline.")
+  return 0
+
+if __name__ == "__main__":
+  sys.exit(main())
@@ -0,0 +1,74 @@
+# ----------------------------------------
+# IMPORTS
+# ----------------------------------------
+
+import whois
+import zlib
+
+from contextlib import contextmanager
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Iterator
+from whois.exceptions import WhoisDomainNotFoundError
+
+# ----------------------------------------
+# BENCHMARK WHOIS STUB
+# ----------------------------------------
+
+# Fixed reference date of the fake registry records.
+FAKE_WHOIS_EPOCH = datetime(2020, 1, 1, tzinfo=timezone.utc)
+
+# Deterministic stand-in for 'whois.whois' -> No network access, same record for the same domain.
+def fake_whois(domain: str, timeout: int = 1, **options: Any) -> Dict[str, Any]:
+  """
+  Produce a WHOIS record derived from a checksum of the domain - Utility method in Trotline
+  Benchmark Suite. Every fifth domain (by checksum) is reported as not found, and every third
+  record returns its dates as lists, mirroring registries that report several dates.
+
+  Parameters
+  ----------
+  domain : str
+    Registered domain to be looked up.
+  timeout : int
+    Ignored - present for signature compatibility with 'whois.whois'.
+  **options : Any
+    Ignored - further 'whois.whois' options.
+
+  Returns
+  -------
+  dict[str, Any]
+    Fake WHOIS record with 'creation_date' & 'expiration_date'.
+
+  Exceptions
+  ----------
+  WhoisDomainNotFoundError
+    Raised for domains whose checksum is divisible by five.
+  """
+  checksum = zlib.crc32(domain.encode("utf-8", "surrogatepass"))
+  if checksum % 5 == 0:
+    raise WhoisDomainNotFoundError(f"No match for {domain}")
+
+  creation_date = FAKE_WHOIS_EPOCH - timedelta(days=checksum % 4000)
+  expiration_date = FAKE_WHOIS_EPOCH + timedelta(days=365 * (1 + checksum % 10))
+
+  # Naive dates exercise the timezone handling of the Pipeline.
+  if checksum % 2 == 0:
+    creation_date = creation_date.replace(tzinfo=None)
+
+  if checksum % 3 == 0:
+    return {"creation_date": [creation_date], "expiration_date": [expiration_date]}
+
+  return {"creation_date": creation_date, "expiration_date": expiration_date}
+
+# Temporarily route every WHOIS lookup to the fake registry.
+@contextmanager
+def install_fake_whois() -> Iterator[None]:
+  """
+  Replace 'whois.whois' with 'fake_whois' for the duration of the context - Utility method in
+  Trotline Benchmark Suite.
+  """
+  original_whois = whois.whois
+  whois.whois = fake_whois
+  try:
+    yield
+  finally:
+    whois.whois = original_whois
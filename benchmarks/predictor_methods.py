@@ -0,0 +1,221 @@
+# ----------------------------------------
+# IMPORTS
+# ----------------------------------------
+
+import numpy as np
+import xgboost as xgb
+import argparse
+import os
+import sys
+import time
+
+from pathlib import Path
+from typing import Callable, Dict, Optional, Sequence
+
+from benchmarks.corpora import URL_CORPORA
+from benchmarks.fake_whois import install_fake_whois
+from src.backend.application.utility.tree_methods import FlatTreePredictor
+from src.backend.pipeline.feature_schema import FeatureSchema
+from src.backend.pipeline.final_pipeline import finalised_data_pipeline_for_web
+
+# Batch sizes timed per predictor -> Single requests up to a full micro-batch.
+DEFAULT_BATCH_SIZES = (1, 4, 16, 64)
+
+# ----------------------------------------
+# PREDICTOR BENCHMARK MODEL
+# ----------------------------------------
+
+# Train a Booster of production shape on Pipeline features of the benchmark corpora.
+def train_benchmark_model(rounds: int = 200, max_depth: int = 6, seed: int = 0) -> xgb.Booster:
+  """
+  Train a synthetic binary classifier on the default Pipeline features of every benchmark URL -
+  Utility method in Trotline Benchmark Suite. Labels are random, so the trees carry no meaning,
+  but their count, depth & split features match a production model.
+
+  Parameters
+  ----------
+  rounds : int
+    Number of boosting rounds (trees).
+  max_depth : int
+    Maximum depth of every tree.
+  seed : int
+    Seed of the labels & the training.
+
+  Returns
+  -------
+  xgboost.Booster
+    Trained model with the default feature schema.
+  """
+  schema = FeatureSchema.default()
+  urls = [url for corpus in URL_CORPORA.values() for url in corpus]
+
+  with install_fake_whois():
+    features = np.stack([finalised_data_pipeline_for_web(url, schema) for url in urls])
+
+  labels = np.random.default_rng(seed).integers(0, 2, size=len(urls))
+  training_data = xgb.DMatrix(features, label=labels, missing=np.nan, feature_names=list(schema.names))
+
+  return xgb.train(
+    {"objective": "binary:logistic", "max_depth": max_depth, "eta": 0.1, "seed": seed},
+    training_data,
+    num_boost_round=rounds
+  )
+
+# ----------------------------------------
+# PREDICTOR BENCHMARK MEASUREMENTS
+# ----------------------------------------
+
+# Time one predictor on one batch -> Best round, in microseconds per call.
+def measure_us_per_call(predict: Callable[[np.ndarray], np.ndarray], rows: np.ndarray, rounds: int, min_round_time: float) -> float:
+  """
+  Time the predictor on a fixed batch - Utility method in Trotline Benchmark Suite. The number of
+  calls per round is calibrated so every round lasts at least 'min_round_time' seconds; the fastest
+  round is reported.
+
+  Parameters
+  ----------
+  predict : Callable[[numpy.ndarray], numpy.ndarray]
+    Predictor to be timed.
+  rows : numpy.ndarray
+    Float32 batch passed to every call.
+  rounds : int
+    Number of timed rounds.
+  min_round_time : float
+    Minimum duration of a round in seconds.
+
+  Returns
+  -------
+  float
+    Microseconds per predictor call.
+  """
+  def run_calls(calls: int) -> int:
+    started_at = time.perf_counter_ns()
+    for _ in range(calls):
+      predict(rows)
+    return time.perf_counter_ns() - started_at
+
+  # Calibrate the calls per round (also serves as warm-up).
+  calls = 1
+  while run_calls(calls) < min_round_time * 1e9:
+    calls *= 2
+
+  best_round = min(run_calls(calls) for _ in range(rounds))
+
+  return best_round / (calls * 1000)
+
+# Time every predictor at every batch size.
+def run_predictor_benchmarks(
+    booster: xgb.Booster,
+    batch_sizes: Sequence[int] = DEFAULT_BATCH_SIZES,
+    rounds: int = 5,
+    min_round_time: float = 0.05
+  ) -> Dict[str, Dict[int, float]]:
+  """
+  Compare 'Booster.predict', 'inplace_predict' & the flat NumPy tree evaluator - Utility method in
+  Trotline Benchmark Suite. The flat evaluator must pass its parity check before it is timed.
+
+  Parameters
+  ----------
+  booster : xgboost.Booster
+    Model to be benchmarked.
+  batch_sizes : Sequence[int]
+    Rows per timed call.
+  rounds : int
+    Timed rounds per predictor & batch size.
+  min_round_time : float
+    Minimum seconds per round.
+
+  Returns
+  -------
+  dict[str, dict[int, float]]
+    Microseconds per call, keyed by predictor & batch size.
+
+  Exceptions
+  ----------
+  ValueError
+    Raised if the flat evaluator cannot be built or does not match the model.
+  """
+  flat_predictor = FlatTreePredictor.from_booster(booster)
+  flat_predictor.check_parity(booster)
+
+  rows = flat_predictor.validation_rows(max(batch_sizes))
+  predictors: Dict[str, Callable[[np.ndarray], np.ndarray]] = {
+    "predict(DMatrix)": lambda batch: booster.predict(
+      xgb.DMatrix(batch, missing=np.nan, feature_names=booster.feature_names, feature_types=booster.feature_types)
+    ),
+    "inplace_predict": booster.inplace_predict,
+    "numpy": flat_predictor.predict,
+  }
+
+  return {
+    name: {size: measure_us_per_call(predict, rows[:size], rounds, min_round_time) for size in batch_sizes}
+    for name, predict in predictors.items()
+  }
+
+# Render the results as a fixed-width table.
+def format_predictor_results(results: Dict[str, Dict[int, float]]) -> str:
+  """
+  Format the benchmark results as one row per predictor & one column per batch size - Utility
+  method in Trotline Benchmark Suite.
+
+  Parameters
+  ----------
+  results : dict[str, dict[int, float]]
+    Results of 'run_predictor_benchmarks'.
+
+  Returns
+  -------
+  str
+    Printable table in microseconds per call.
+  """
+  batch_sizes = sorted({size for timings in results.values() for size in timings})
+  lines = [f"{'predictor (us/call)':<22}" + "".join(f"{f'{size} rows':>12}" for size in batch_sizes)]
+
+  for name, timings in results.items():
+    lines.append(f"{name:<22}" + "".join(f"{timings[size]:>12.1f}" for size in batch_sizes))
+
+  return "\n".join(lines)
+
+# Command line entry point -> 'python -m benchmarks.predictor_methods'.
+def main(argv: Optional[Sequence[str]] = None) -> int:
+  """
+  Run the predictor benchmark and print the results - Entry point of the Trotline Benchmark Suite.
+
+  Parameters
+  ----------
+  argv : Sequence[str] | None
+    Command line arguments - 'sys.argv' if omitted.
+
+  Returns
+  -------
+  int
+    Exit code - 1 if the flat evaluator does not match the model, 0 otherwise.
+  """
+  parser = argparse.ArgumentParser(
+    prog="python -m benchmarks.predictor_methods", description="Trotline model predictor microbenchmarks."
+  )
+  parser.add_argument("--model", type=Path, help="Saved XGBoost model - a synthetic model is trained if omitted.")
+  parser.add_argument("--batch-size", type=int, action="append", dest="batch_sizes", help="Rows per call (repeatable).")
+  parser.add_argument("--rounds", type=int, default=5, help="Timed rounds per predictor & batch size.")
+  parser.add_argument("--min-round-time", type=float, default=0.05, help="Minimum seconds per round.")
+  arguments = parser.parse_args(argv)
+
+  # The synthetic model reaches the fake registry only -> No in-process or shared caching.
+  os.environ["WHOIS_CACHE_SIZE"] = "0"
+  os.environ.pop("REDIS_URL", None)
+
+  booster = xgb.Booster(model_file=str(arguments.model)) if arguments.model else train_benchmark_model()
+
+  try:
+    results = run_predictor_benchmarks(
+      booster, arguments.batch_sizes or DEFAULT_BATCH_SIZES, arguments.rounds, arguments.min_round_time
+    )
+  except ValueError as verr:
+    print(f"Flat tree predictor unavailable - {verr}")
+    return 1
+
+  print(format_predictor_results(results))
+  return 0
+
+if __name__ == "__main__":
+  sys.exit(main())
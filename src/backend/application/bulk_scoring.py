@@ -0,0 +1,531 @@
+# ----------------------------------------
+# IMPORTS
+# ----------------------------------------
+
+import numpy as np
+import xgboost as xgb
+import boto3 as b3
+import argparse
+import csv
+import hashlib
+import io
+import itertools
+import json
+import os
+import sys
+import time
+
+from contextlib import nullcontext
+from dotenv import load_dotenv
+from pathlib import Path
+from typing import BinaryIO, Dict, Iterator, List, Optional, Sequence, TextIO, Tuple
+
+from src.backend.application.utility.utility_methods import (
+    MODEL_BUCKET,
+    MODEL_KEY,
+    load_model_with_cache,
+    write_text_atomically
+)
+from src.backend.pipeline.feature_schema import FeatureSchema
+from src.backend.pipeline.final_pipeline import finalised_data_pipeline_for_batch
+from src.backend.pipeline.parallel_methods import ParallelPipelineExecutor
+from src.backend.pipeline.suffix_methods import warm_tld_extractor
+
+# Number of URLs scored & committed per chunk -> Bounds memory use & the work lost on interruption.
+DEFAULT_CHUNK_SIZE = 10000
+
+# Input formats accepted by the bulk scorer, detected from the file extension when 'auto'.
+INPUT_FORMATS = ("csv", "jsonl", "text")
+
+# ----------------------------------------
+# STREAMING INPUT READERS
+# ----------------------------------------
+
+# Line iterator over a binary file tracking the byte offset of everything consumed so far.
+class OffsetLineReader:
+    """
+    Iterate the decoded lines of a binary file while tracking the byte offset just past the last
+    line handed out - the position a resumed run seeks back to.
+
+    Parameters
+    ----------
+    handle : BinaryIO
+        Input file opened in binary mode - iteration starts at its current position.
+    """
+
+    def __init__(self, handle: BinaryIO):
+        self.handle = handle
+        self.offset = handle.tell()
+
+    def __iter__(self) -> "OffsetLineReader":
+        return self
+
+    def __next__(self) -> str:
+        line = self.handle.readline()
+        if not line:
+            raise StopIteration
+
+        self.offset += len(line)
+        return line.decode("utf-8", errors="replace")
+
+# Detect the input format from the file extension.
+def detect_input_format(path: Path) -> str:
+    """
+    Map the input file extension to one of the supported input formats.
+
+    Parameters
+    ----------
+    path : pathlib.Path
+        Input file.
+
+    Returns
+    -------
+    str
+        'csv' for '.csv', 'jsonl' for '.jsonl' & '.ndjson', 'text' otherwise.
+    """
+    suffix = path.suffix.lower()
+    if suffix == ".csv":
+        return "csv"
+    if suffix in (".jsonl", ".ndjson"):
+        return "jsonl"
+
+    return "text"
+
+# Read the CSV header row -> Always located at the start of the file.
+def read_csv_header(path: Path) -> Tuple[List[str], int]:
+    """
+    Read the column names of the CSV input file.
+
+    Parameters
+    ----------
+    path : pathlib.Path
+        CSV input file.
+
+    Returns
+    -------
+    tuple[list[str], int]
+        Column names (empty if the file is empty) and the byte offset of the first record.
+    """
+    with path.open("rb") as handle:
+        reader = OffsetLineReader(handle)
+        header = next(csv.reader(reader), [])
+        return header, reader.offset
+
+# Stream (url, error) records from the input file, starting at the byte offset.
+def iter_input_records(
+        reader: OffsetLineReader,
+        input_format: str,
+        url_field: str,
+        csv_header: Sequence[str] = ()
+    ) -> Iterator[Tuple[Optional[str], Optional[str]]]:
+    """
+    Lazily read one record at a time from the input file - records that carry no usable
+    URL-string are yielded with an error message instead. Blank text & JSONL lines are skipped.
+
+    Parameters
+    ----------
+    reader : OffsetLineReader
+        Line reader positioned at the first record to be read.
+    input_format : str
+        One of 'csv', 'jsonl' or 'text'.
+    url_field : str
+        CSV column or JSONL key holding the URL-string.
+    csv_header : Sequence[str]
+        Column names of the CSV input file.
+
+    Returns
+    -------
+    Iterator[tuple[str | None, str | None]]
+        URL-string & error message per record - exactly one of both is None.
+
+    Exceptions
+    ----------
+    ValueError
+        Raised if the CSV input file has no 'url_field' column.
+    """
+    if input_format == "csv":
+        if url_field not in csv_header:
+            raise ValueError(f"CSV input has no '{url_field}' column - columns {list(csv_header)}")
+        url_position = list(csv_header).index(url_field)
+
+        for row in csv.reader(reader):
+            if url_position < len(row):
+                yield row[url_position], None
+            else:
+                yield None, f"Missing '{url_field}' column"
+        return
+
+    for line in reader:
+        line = line.rstrip("\r\n")
+        if not line.strip():
+            continue
+
+        if input_format == "text":
+            yield line, None
+            continue
+
+        try:
+            record = json.loads(line)
+        except json.JSONDecodeError as err:
+            yield None, f"Invalid JSON - {err}"
+            continue
+
+        url = record.get(url_field) if isinstance(record, dict) else record
+        if isinstance(url, str):
+            yield url, None
+        else:
+            yield None, f"Missing '{url_field}' string"
+
+# ----------------------------------------
+# STREAMING OUTPUT & CHECKPOINTS
+# ----------------------------------------
+
+# Serialise one chunk of results in the output format.
+def format_result_rows(rows: Sequence[Dict[str, object]], output_format: str) -> str:
+    """
+    Render scored records as CSV rows ('index,url,status,error') or JSON lines.
+
+    Parameters
+    ----------
+    rows : Sequence[dict[str, object]]
+        Scored records with 'index', 'url' and either 'status' or 'error'.
+    output_format : str
+        Either 'csv' or 'jsonl'.
+
+    Returns
+    -------
+    str
+        Rendered rows, newline terminated.
+    """
+    if output_format == "jsonl":
+        return "".join(json.dumps(row, ensure_ascii=False) + "\n" for row in rows)
+
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, lineterminator="\n")
+    for row in rows:
+        writer.writerow([row["index"], row["url"] or "", row.get("status", ""), row.get("error", "")])
+
+    return buffer.getvalue()
+
+# Identify the loaded model -> A run is only resumed with the model it was started with.
+def file_digest(path: Path) -> str:
+    """
+    SHA-256 digest of the file, read in fixed-size blocks.
+
+    Parameters
+    ----------
+    path : pathlib.Path
+        File to be hashed.
+
+    Returns
+    -------
+    str
+        Hex digest of the file content.
+    """
+    digest = hashlib.sha256()
+    with path.open("rb") as handle:
+        for block in iter(lambda: handle.read(1024 * 1024), b""):
+            digest.update(block)
+
+    return digest.hexdigest()
+
+# ----------------------------------------
+# BULK SCORING
+# ----------------------------------------
+
+# Score one chunk of records -> Batched feature extraction & a single matrix prediction.
+def score_chunk(
+        records: Sequence[Tuple[Optional[str], Optional[str]]],
+        first_index: int,
+        xgb_model: xgb.Booster,
+        feature_schema: FeatureSchema,
+        executor: Optional[ParallelPipelineExecutor] = None
+    ) -> List[Dict[str, object]]:
+    """
+    Extract the features of every valid record in the chunk with the batch Pipeline (or spread
+    across the worker processes of the executor) and predict them with a single matrix prediction.
+
+    Parameters
+    ----------
+    records : Sequence[tuple[str | None, str | None]]
+        URL-string & error message per record.
+    first_index : int
+        Input position of the first record.
+    xgb_model : xgboost.Booster
+        XGBoost inference model.
+    feature_schema : FeatureSchema
+        Model input schema.
+    executor : ParallelPipelineExecutor | None
+        Process pool for multi-core extraction - the single-process batch Pipeline if omitted.
+
+    Returns
+    -------
+    list[dict[str, object]]
+        One result per record in input order - 'status' for scored URLs, 'error' otherwise.
+    """
+    results = [
+        {"index": first_index + position, "url": url, **({"error": error} if error else {})}
+        for position, (url, error) in enumerate(records)
+    ]
+    valid_positions = [position for position, (url, _) in enumerate(records) if url is not None]
+
+    if valid_positions:
+        urls = [records[position][0] for position in valid_positions]
+        if executor is not None:
+            features = executor.extract_matrix(urls, schema=feature_schema)
+        else:
+            features = finalised_data_pipeline_for_batch(urls, columns=feature_schema.names).to_numpy(dtype=np.float32)
+        predictions = xgb_model.inplace_predict(features)
+
+        for position, prediction in zip(valid_positions, predictions):
+            results[position]["status"] = float(prediction)
+
+    return results
+
+# Stream the input through the Pipeline & model, committing results chunk by chunk.
+def score_file(
+        input_path: Path,
+        output_path: Path,
+        xgb_model: xgb.Booster,
+        model_version: str,
+        input_format: str = "auto",
+        url_field: str = "url",
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        checkpoint_path: Optional[Path] = None,
+        restart: bool = False,
+        progress: Optional[TextIO] = sys.stderr,
+        workers: int = 1
+    ) -> int:
+    """
+    Score every URL of the input file and append the results to the output file in fixed-size
+    chunks. After each chunk the output is flushed to disk and a checkpoint records the input
+    offset & output size, so an interrupted run resumes from its last committed chunk - any
+    partially written output beyond the checkpoint is discarded. Memory use is bounded by the
+    chunk size, independent of the input size.
+
+    Parameters
+    ----------
+    input_path : pathlib.Path
+        CSV, JSONL or plain text (one URL per line) input file.
+    output_path : pathlib.Path
+        Output file - JSON lines if it ends with '.jsonl', CSV otherwise.
+    xgb_model : xgboost.Booster
+        XGBoost inference model.
+    model_version : str
+        Version identifier of the model - a run is only resumed with the same model.
+    input_format : str
+        One of 'csv', 'jsonl', 'text' or 'auto' (detected from the extension).
+    url_field : str
+        CSV column or JSONL key holding the URL-string.
+    chunk_size : int
+        Number of records scored & committed per chunk.
+    checkpoint_path : pathlib.Path | None
+        Checkpoint file - '<output>.checkpoint' if omitted.
+    restart : bool
+        Ignore an existing checkpoint and start from the beginning.
+    progress : TextIO | None
+        Stream receiving a progress line per chunk - silent if None.
+    workers : int
+        Worker processes used for feature extraction - 1 runs the Pipeline in-process.
+
+    Returns
+    -------
+    int
+        Total number of records written to the output file.
+
+    Exceptions
+    ----------
+    ValueError
+        Raised if the checkpoint belongs to a different input, format or model, or if the output
+        file is missing or shorter than the checkpoint.
+    """
+    input_format = detect_input_format(input_path) if input_format == "auto" else input_format
+    output_format = "jsonl" if output_path.suffix.lower() in (".jsonl", ".ndjson") else "csv"
+    checkpoint_path = checkpoint_path or output_path.with_name(output_path.name + ".checkpoint")
+    feature_schema = FeatureSchema.for_booster(xgb_model)
+
+    run_identity = {
+        "input": str(input_path.resolve()),
+        "input_size": input_path.stat().st_size,
+        "input_format": input_format,
+        "url_field": url_field,
+        "model_version": model_version,
+    }
+
+    # Resume from the last committed chunk -> Otherwise start with an empty output file.
+    checkpoint = None
+    if checkpoint_path.exists() and not restart:
+        checkpoint = json.loads(checkpoint_path.read_text())
+        mismatched = [key for key, value in run_identity.items() if checkpoint.get(key) != value]
+        if mismatched:
+            raise ValueError(f"Checkpoint belongs to a different run ({', '.join(mismatched)}) - use --restart")
+
+        # The output must still hold every committed row -> Truncating a shorter file pads it with NUL bytes.
+        if not output_path.exists():
+            raise ValueError(f"Checkpoint found but the output file {output_path} is missing - use --restart")
+        if output_path.stat().st_size < checkpoint["output_bytes"]:
+            raise ValueError(
+                f"Output file {output_path} is shorter than its checkpoint ({output_path.stat().st_size:,} < "
+                f"{checkpoint['output_bytes']:,} bytes) - use --restart"
+            )
+        if checkpoint.get("completed"):
+            if progress:
+                print(f"Already completed - {checkpoint['rows_written']:,} URLs in {output_path}", file=progress)
+            return checkpoint["rows_written"]
+
+    csv_header: List[str] = []
+    input_offset = 0
+    if input_format == "csv":
+        csv_header, input_offset = read_csv_header(input_path)
+
+    if checkpoint:
+        input_offset = checkpoint["input_offset"]
+        rows_written = checkpoint["rows_written"]
+        with output_path.open("r+b") as output_file:
+            output_file.truncate(checkpoint["output_bytes"])
+    else:
+        rows_written = 0
+        with output_path.open("w", encoding="utf-8", newline="") as output_file:
+            if output_format == "csv":
+                output_file.write("index,url,status,error\n")
+
+    started_at = time.monotonic()
+    rows_at_start = rows_written
+    input_size = max(run_identity["input_size"], 1)
+
+    executor = ParallelPipelineExecutor(max_workers=workers) if workers > 1 else None
+
+    with executor or nullcontext(), input_path.open("rb") as input_file, output_path.open("a", encoding="utf-8", newline="") as output_file:
+        input_file.seek(input_offset)
+        reader = OffsetLineReader(input_file)
+        records = iter_input_records(reader, input_format, url_field, csv_header)
+
+        while True:
+            chunk = list(itertools.islice(records, chunk_size))
+            if not chunk:
+                break
+
+            # Score & append the chunk -> Flushed to disk before the checkpoint moves past it.
+            output_file.write(format_result_rows(score_chunk(chunk, rows_written, xgb_model, feature_schema, executor), output_format))
+            output_file.flush()
+            os.fsync(output_file.fileno())
+            rows_written += len(chunk)
+
+            write_text_atomically(checkpoint_path, json.dumps({
+                **run_identity,
+                "input_offset": reader.offset,
+                "output_bytes": os.fstat(output_file.fileno()).st_size,
+                "rows_written": rows_written,
+                "completed": False,
+            }))
+
+            if progress:
+                elapsed = max(time.monotonic() - started_at, 1e-9)
+                print(
+                    f"{rows_written:,} URLs scored - {reader.offset / input_size:.1%} of input - "
+                    f"{(rows_written - rows_at_start) / elapsed:,.0f} URLs/s",
+                    file=progress,
+                    flush=True
+                )
+
+        write_text_atomically(checkpoint_path, json.dumps({
+            **run_identity,
+            "input_offset": reader.offset,
+            "output_bytes": os.fstat(output_file.fileno()).st_size,
+            "rows_written": rows_written,
+            "completed": True,
+        }))
+
+    return rows_written
+
+# Load the model from a local file, or from S3 (AWS) through the local model cache.
+def load_scoring_model(model_path: Optional[Path], cache_dir: str) -> Tuple[xgb.Booster, str]:
+    """
+    Load the XGBoost inference model for bulk scoring.
+
+    Parameters
+    ----------
+    model_path : pathlib.Path | None
+        Local model file - the production model is fetched from S3 if omitted.
+    cache_dir : str
+        Local model cache directory used for the S3 model.
+
+    Returns
+    -------
+    tuple[xgboost.Booster, str]
+        XGBoost inference model and its version (file digest or S3 ETag).
+    """
+    if model_path is not None:
+        return xgb.Booster(model_file=str(model_path)), file_digest(model_path)
+
+    s3_client = b3.client(
+        "s3",
+        aws_access_key_id=os.getenv("AWS_ACCESS_KEY_ID"),
+        aws_secret_access_key=os.getenv("AWS_SECRET_ACCESS_KEY"),
+        region_name=os.getenv("AWS_REGION_NAME")
+    )
+    return load_model_with_cache(s3_client, bucket=MODEL_BUCKET, key=MODEL_KEY, cache_dir=cache_dir)
+
+# Command line entry point -> 'trotline-score INPUT OUTPUT'.
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """
+    Bulk-score a URL file from the command line. Re-running the same command resumes an
+    interrupted run from its last committed chunk.
+
+    Parameters
+    ----------
+    argv : Sequence[str] | None
+        Command line arguments - 'sys.argv' if omitted.
+
+    Returns
+    -------
+    int
+        Exit code.
+    """
+    parser = argparse.ArgumentParser(
+        prog="trotline-score",
+        description="Stream a CSV, JSONL or text file of URLs through the Trotline Pipeline & model."
+    )
+    parser.add_argument("input", type=Path, help="Input file - CSV, JSONL or one URL per line.")
+    parser.add_argument("output", type=Path, help="Output file - JSONL if it ends with '.jsonl', CSV otherwise.")
+    parser.add_argument("--format", dest="input_format", choices=("auto",) + INPUT_FORMATS, default="auto",
+                        help="Input format (default: detected from the extension).")
+    parser.add_argument("--url-field", default="url", help="CSV column or JSONL key holding the URL (default 'url').")
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE, help="URLs scored per committed chunk.")
+    parser.add_argument("--model", type=Path, help="Local model file - the production model is fetched from S3 if omitted.")
+    parser.add_argument("--checkpoint", type=Path, help="Checkpoint file (default '<output>.checkpoint').")
+    parser.add_argument("--restart", action="store_true", help="Ignore an existing checkpoint and start over.")
+    parser.add_argument("--workers", type=int, default=1, help="Worker processes for feature extraction (default 1).")
+    parser.add_argument("--quiet", action="store_true", help="Do not report progress.")
+    arguments = parser.parse_args(argv)
+
+    load_dotenv()
+    warm_tld_extractor()
+
+    xgb_model, model_version = load_scoring_model(arguments.model, os.getenv("MODEL_CACHE_DIR", ".model_cache"))
+
+    try:
+        rows_written = score_file(
+            input_path=arguments.input,
+            output_path=arguments.output,
+            xgb_model=xgb_model,
+            model_version=model_version,
+            input_format=arguments.input_format,
+            url_field=arguments.url_field,
+            chunk_size=arguments.chunk_size,
+            checkpoint_path=arguments.checkpoint,
+            restart=arguments.restart,
+            progress=None if arguments.quiet else sys.stderr,
+            workers=arguments.workers
+        )
+    except ValueError as err:
+        print(f"trotline-score: {err}", file=sys.stderr)
+        return 2
+
+    if not arguments.quiet:
+        print(f"Done - {rows_written:,} URLs written to {arguments.output}", file=sys.stderr)
+
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
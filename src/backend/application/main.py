@@ -3,16 +3,27 @@
 # ----------------------------------------
 
 import boto3 as b3
-import xgboost as xgb
 import os
 
 from fastapi import FastAPI
 from dotenv import load_dotenv
-from contextlib import contextmanager
-from botocore.response import StreamingBody
+from contextlib import asynccontextmanager
 
-from src.backend.application.routers import data_web
-from src.backend.application.utility import from_reponse_to_model
+from src.backend.application.routers import data_web, metrics, stats
+from src.backend.application.utility import (
+    MODEL_BUCKET,
+    MODEL_KEY,
+    load_model_with_cache,
+    PredictionBatcher,
+    load_flat_tree_predictor,
+    get_verdict_cache
+)
+from src.backend.application.utility.tree_methods import DEFAULT_FLAT_TREE_MAX_ROWS
+from src.backend.pipeline.final_pipeline import shutdown_pipeline_executors
+from src.backend.pipeline.suffix_methods import warm_tld_extractor
+from src.backend.pipeline.feature_schema import FeatureSchema
+from src.backend.pipeline.feature_registry import get_feature_plan
+from src.backend.pipeline.metrics_methods import metrics_enabled
 
 # ----------------------------------------
 # FASTAPI APPLICATION SETUP
@@ -22,8 +33,11 @@ from src.backend.application.utility import from_reponse_to_model
 load_dotenv()
 
 # Lifespan functions -> XGBoost model configured on 'Startup'.
-@contextmanager
-def lifespan(app: FastAPI):
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Build the offline suffix extractor -> The first request never pays initialization cost.
+    warm_tld_extractor()
+
     # Load S3 Database session (AWS) -> Add to app.state
     s3_client = b3.client(
         "s3",
@@ -32,21 +46,50 @@ def lifespan(app: FastAPI):
         region_name=os.getenv("AWS_REGION_NAME")
     )
 
-    # Load model data from session (AWS) S3.
-    model_response: StreamingBody = s3_client.get_object(
-        Bucket="arn:aws:s3:eu-north-1:212282292075:accesspoint/xgb-model",
-        Key="XGBoost-model.ubj"
+    # Load model data from session (AWS) S3 -> Reuses the local cache while the ETag matches.
+    xgb_model, model_version = load_model_with_cache(
+        s3_client,
+        bucket=MODEL_BUCKET,
+        key=MODEL_KEY,
+        cache_dir=os.getenv("MODEL_CACHE_DIR", ".model_cache")
     )
 
-    # Convert StreamingBody-object to finalised XGBoost model.
-    xgb_model: xgb.Booster = from_reponse_to_model(model_response)
+    # Check the Pipeline output against the model input -> Fails startup on mismatch.
+    feature_schema = FeatureSchema.for_booster(xgb_model)
+
+    # Plan the Pipeline stages required by the model features -> Unused stages (fx. WHOIS) never run.
+    feature_plan = get_feature_plan(feature_schema.names)
 
     # Load all session data into app.state configuration -> Lifespan.
     app.state.model = xgb_model
+    app.state.model_version = model_version
+    app.state.feature_schema = feature_schema
+    app.state.feature_plan = feature_plan
     app.state.s3 = s3_client
 
+    # Verdicts are keyed by model version -> Verdicts of a previous model are never served.
+    app.state.verdict_cache = get_verdict_cache()
+    app.state.verdict_cache.bind_model(model_version)
+
+    # Flat NumPy tree evaluator (MODEL_PREDICTOR=numpy) -> Enabled only if it matches the model.
+    flat_predictor = load_flat_tree_predictor(xgb_model)
+
+    # Micro-batching scheduler -> Concurrent single-URL requests share one matrix prediction.
+    app.state.batcher = PredictionBatcher(
+        model=xgb_model,
+        max_batch_size=int(os.getenv("BATCHER_MAX_BATCH_SIZE", "64")),
+        max_wait_ms=float(os.getenv("BATCHER_MAX_WAIT_MS", "2")),
+        flat_predictor=flat_predictor,
+        flat_max_rows=int(os.getenv("FLAT_TREE_MAX_ROWS", str(DEFAULT_FLAT_TREE_MAX_ROWS)))
+    )
+
     yield       # Lifespan seperator
 
+    # Release the prediction, verdict cache & WHOIS executor threads on 'Shutdown'.
+    app.state.batcher.close()
+    app.state.verdict_cache.close()
+    shutdown_pipeline_executors()
+
 summary = """
 Trotline is a phishing URL detection service built with FastAPI, 
 powered by an XGBoost model. It analyzes URLs using a robust set of engineered numerical
@@ -70,6 +113,11 @@ app = FastAPI(
 
 # FastAPI Routes (Data).
 app.include_router(data_web.router)         # Route to Web-oriented API Endpoints. 
+app.include_router(stats.router)            # Route to internal Stats Endpoints.
+
+# Prometheus scrape target -> Not served when 'METRICS_ENABLED' is turned off.
+if metrics_enabled():
+    app.include_router(metrics.router)      # Route to Prometheus Metrics Endpoint.
 
 @app.get("/")
 async def root():
@@ -2,13 +2,167 @@
 # IMPORTS
 # ----------------------------------------
 
-import pandas as pd
-import xgboost as xgb
+import numpy as np
+import asyncio
+import json
+import os
 
-from fastapi import APIRouter, Request
+from typing import Any, AsyncIterator, Callable, List, Dict, Optional, Set, Tuple, Union
+from fastapi import APIRouter, Depends, Request
 from fastapi.exceptions import HTTPException
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel
+from starlette.requests import ClientDisconnect
+from starlette.types import Receive, Scope, Send
 
-from src.backend.pipeline.final_pipeline import finalised_data_pipeline_for_web
+from src.backend.pipeline.final_pipeline import finalised_data_pipeline_for_web_async
+from src.backend.pipeline.feature_schema import FeatureSchema
+from src.backend.pipeline.parsing_methods import canonicalize_url
+from src.backend.pipeline.metrics_methods import REQUESTS_IN_FLIGHT, track_in_flight
+from src.backend.application.utility import PredictionBatcher, VerdictCache
+
+# ----------------------------------------
+# REQUEST & RESPONSE MODELS
+# ----------------------------------------
+
+# Maximum number of URLs accepted by a single Batch request.
+# Larger submissions must be split client-side into multiple requests.
+MAX_BATCH_SIZE = 1000
+
+# URLs scored concurrently by a single Stream request -> 'STREAM_MAX_IN_FLIGHT' overrides it.
+# Results waiting to be sent count towards it, so server memory stays bounded per connection.
+DEFAULT_STREAM_IN_FLIGHT = 256
+
+# Maximum size of a single NDJSON line -> Longer lines are answered with an error and skipped.
+MAX_STREAM_LINE_BYTES = 64 * 1024
+
+# Request body for the Batch scoring endpoint.
+class BatchURLRequest(BaseModel):
+    urls: List[str]
+
+# NDJSON response owning no part of the request -> The endpoint itself reads the body & disconnects.
+class NDJSONStreamingResponse(StreamingResponse):
+    """
+    Streaming response sending one JSON document per line. Unlike 'StreamingResponse', it does not
+    listen for the client disconnect while sending - that listener consumes the ASGI 'receive'
+    channel, and with it the request body the Stream endpoint is still reading.
+    """
+    media_type = "application/x-ndjson"
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        try:
+            await self.stream_response(send)
+        except OSError:
+            raise ClientDisconnect()
+
+        if self.background is not None:
+            await self.background()
+
+# Decode a single line of the Stream request body into its URL-string.
+def parse_stream_line(line: bytes) -> Tuple[Optional[str], Optional[str]]:
+    """
+    Decode one NDJSON line of the Stream request body. A line holds either a JSON string, a JSON
+    object with an 'url' key, or the bare URL-string itself.
+
+    Parameters
+    ----------
+    line : bytes
+        Line of the request body without its line terminator.
+
+    Returns
+    -------
+    tuple[str | None, str | None]
+        The URL-string, or None and the message describing why the line was rejected.
+    """
+    try:
+        text = line.decode("utf-8").strip()
+    except UnicodeDecodeError:
+        return None, "Invalid line - Line must be UTF-8 encoded"
+
+    if not text.startswith(("{", "\"", "[")):
+        return text, None
+
+    try:
+        record: Any = json.loads(text)
+    except ValueError as verr:
+        return None, f"Invalid line - {verr}"
+
+    if isinstance(record, dict):
+        record = record.get("url")
+    if not isinstance(record, str):
+        return None, "Invalid data type - URL data must be of Type: str"
+
+    return record, None
+
+# Split the Stream request body into URL records as its chunks arrive.
+async def read_stream_records(request: Request) -> AsyncIterator[Tuple[Optional[str], Optional[str]]]:
+    """
+    Read the request body chunk by chunk and yield one record per non-empty line, without ever
+    holding more than a single line (at most 'MAX_STREAM_LINE_BYTES') of the body in memory.
+
+    Parameters
+    ----------
+    request : fastapi.Request
+        Stream request with an NDJSON or chunked plain-text body.
+
+    Yields
+    ------
+    tuple[str | None, str | None]
+        The URL-string, or None and the message describing why the line was rejected.
+
+    Exceptions
+    ----------
+    ClientDisconnect
+        Raised if the client disconnects before the body is complete.
+    """
+    buffer = bytearray()
+    oversized = False
+
+    async for chunk in request.stream():
+        buffer += chunk
+
+        while (newline := buffer.find(b"\n")) != -1:
+            line = bytes(buffer[:newline])
+            del buffer[:newline + 1]
+
+            # Tail of an oversized line -> Already answered when the line overflowed the buffer.
+            if oversized:
+                oversized = False
+            elif len(line) > MAX_STREAM_LINE_BYTES:
+                yield None, f"Line too long - maximum of {MAX_STREAM_LINE_BYTES} bytes per line"
+            elif line.strip():
+                yield parse_stream_line(line)
+
+        if len(buffer) > MAX_STREAM_LINE_BYTES:
+            buffer.clear()
+            if not oversized:
+                oversized = True
+                yield None, f"Line too long - maximum of {MAX_STREAM_LINE_BYTES} bytes per line"
+
+    if buffer.strip() and not oversized:
+        yield parse_stream_line(bytes(buffer))
+
+# Build a route dependency counting the endpoint's requests in flight (no-op if metrics are off).
+def requests_in_flight(endpoint: str) -> Callable[[], AsyncIterator[None]]:
+    """
+    Create a FastAPI dependency that tracks the endpoint's requests in flight in the
+    'trotline_requests_in_flight' gauge for the lifetime of each request.
+
+    Parameters
+    ----------
+    endpoint : str
+        Endpoint name recorded as the 'endpoint' label.
+
+    Returns
+    -------
+    Callable[[], AsyncIterator[None]]
+        Dependency to be added to the route's 'dependencies'.
+    """
+    async def track_request() -> AsyncIterator[None]:
+        with track_in_flight(REQUESTS_IN_FLIGHT, (endpoint,)):
+            yield
+
+    return track_request
 
 # ----------------------------------------
 # FASTAPI DATA ENDPOINTS -> WEB APP
@@ -24,7 +178,8 @@ router = APIRouter(
 @router.put(
     "/{url_string}",
     tags=["data", "url", "phishing"],
-    responses={404: {"Description": "Operation not found!"}}
+    responses={404: {"Description": "Operation not found!"}},
+    dependencies=[Depends(requests_in_flight("web"))]
 )
 async def retrieve_url_status_web(url_string: str, request: Request):
     """
@@ -55,19 +210,280 @@ async def retrieve_url_status_web(url_string: str, request: Request):
             detail="Invalid data type - URL data must be of Type: str"
         )
 
-    # Retrieve the Model connection from internal FastAPI.
-    xgb_model: xgb.Booster = request.app.state.model
+    # Retrieve the Model batching scheduler, its input schema & verdict cache from internal FastAPI.
+    batcher: PredictionBatcher = request.app.state.batcher
+    feature_schema: FeatureSchema = request.app.state.feature_schema
+    verdict_cache: VerdictCache = request.app.state.verdict_cache
+
+    # 0. Step -> Serve repeated URLs straight from the verdict cache (skips Pipeline & model).
+    canonical_url = canonicalize_url(url=url_string)
+    cached_status = await verdict_cache.get_async(canonical_url)
+    if cached_status is not None:
+        return {"url": url_string, "status": cached_status, "cached": True}
     
     # 1. Step -> Convert the URL-String using 'Finalized_data_pipeline'.
-    url_data: pd.Series = finalised_data_pipeline_for_web(url=url_string)
+    try:
+        url_data, whois_complete = await finalised_data_pipeline_for_web_async(
+            url=url_string,
+            schema=feature_schema,
+            return_whois_complete=True
+        )
+    except ValueError as verr:
+        raise HTTPException(
+            status_code=422,
+            detail=f"Invalid URL - {verr}"
+        )
     # Check if the data was converted correctly.
-    if not isinstance(url_data, pd.Series):
+    if not isinstance(url_data, np.ndarray) or url_data.shape != (len(feature_schema),):
         raise HTTPException(
             status_code=422,
             detail="Corrupted data - URL data was processed incorrectly"
         )
     
-    # 2. Step -> Make URL prediction using XGBoost model.
-    prediction = xgb_model.predict(url_data)
+    # 2. Step -> Make URL prediction using XGBoost model, batched with concurrent requests.
+    prediction = await batcher.predict(url_data)
+
+    # Verdicts scored without the WHOIS dates (budget ran out or lookup failed) are not reused ->
+    # The next request is scored with the dates of the background lookup or a new one.
+    if whois_complete:
+        verdict_cache.set(canonical_url, prediction)
+
+    return {"url": url_string, "status": prediction, "cached": False}
+
+
+@router.post(
+    "/batch",
+    tags=["data", "url", "phishing", "batch"],
+    responses={
+        404: {"Description": "Operation not found!"},
+        413: {"Description": f"Batch exceeds the maximum of {MAX_BATCH_SIZE} URLs!"}
+    },
+    dependencies=[Depends(requests_in_flight("batch"))]
+)
+async def retrieve_url_status_web_batch(body: BatchURLRequest, request: Request):
+    """
+    Parse a batch of URL-strings recieved from external HTTP Request using internal Pipeline
+    functions and feed the combined numerical data to internal XGBoost inference model using a
+    single matrix prediction. URLs sharing a canonical form are processed once. A batch may
+    contain at most 'MAX_BATCH_SIZE' (1000) URLs.
+
+    Parameters
+    ----------
+    body : BatchURLRequest
+        JSON request body containing the list of URL-strings to be tested.
+    request : fastapi.Request
+        Internal connection allowing access to fastapi state.
+
+    Returns
+    -------
+    dict[str, Union[int, list]]
+        JSON formatted response to HTTP Request - one result per URL in submitted order, flagged
+        'cached' if served from the verdict cache. URLs that could not be processed carry an
+        'error' message instead of a 'status' score.
+
+    Exceptions
+    ----------
+    HTTPException
+        Raised if the batch is empty or exceeds the maximum batch size.
+    """
+    # Safety check for batch size -> must contain between 1 and MAX_BATCH_SIZE URLs.
+    if not body.urls:
+        raise HTTPException(
+            status_code=422,
+            detail="Empty batch - at least one URL must be provided"
+        )
+    if len(body.urls) > MAX_BATCH_SIZE:
+        raise HTTPException(
+            status_code=413,
+            detail=f"Batch too large - maximum of {MAX_BATCH_SIZE} URLs per request"
+        )
+
+    # Retrieve the Model batching scheduler, its input schema & verdict cache from internal FastAPI.
+    batcher: PredictionBatcher = request.app.state.batcher
+    feature_schema: FeatureSchema = request.app.state.feature_schema
+    verdict_cache: VerdictCache = request.app.state.verdict_cache
+
+    results: List[Dict[str, Union[str, int, float, bool]]] = [
+        {"index": index, "url": url_string} for index, url_string in enumerate(body.urls)
+    ]
+
+    # Group the submitted positions by canonical URL -> Equivalent URLs are processed only once.
+    canonical_groups: Dict[str, List[int]] = {}
+    for index, url_string in enumerate(body.urls):
+        canonical_groups.setdefault(canonicalize_url(url=url_string), []).append(index)
+
+    # 0. Step -> Serve repeated URLs straight from the verdict cache (skips Pipeline & model).
+    uncached_groups: List[Tuple[str, List[int]]] = []
+    cached_statuses = await asyncio.gather(
+        *(verdict_cache.get_async(canonical_url) for canonical_url in canonical_groups)
+    )
+    for (canonical_url, positions), cached_status in zip(canonical_groups.items(), cached_statuses):
+        if cached_status is None:
+            uncached_groups.append((canonical_url, positions))
+            continue
+
+        for position in positions:
+            results[position]["status"] = cached_status
+            results[position]["cached"] = True
+
+    # 1. Step -> Convert one URL-string per uncached group concurrently into its row of a
+    # preallocated matrix. Failures are recorded per URL instead of failing the entire batch.
+    url_matrix = feature_schema.new_matrix(len(uncached_groups))
+    pipeline_outputs = await asyncio.gather(
+        *(
+            finalised_data_pipeline_for_web_async(
+                url=body.urls[positions[0]], schema=feature_schema, out=url_matrix[row], return_whois_complete=True
+            )
+            for row, (_, positions) in enumerate(uncached_groups)
+        ),
+        return_exceptions=True
+    )
+
+    row_positions: List[int] = []
+    whois_complete_rows: Set[int] = set()
+
+    for row, ((_, positions), pipeline_output) in enumerate(zip(uncached_groups, pipeline_outputs)):
+        if isinstance(pipeline_output, Exception):
+            for position in positions:
+                results[position]["error"] = f"Pipeline failure - {pipeline_output}"
+            continue
+
+        row_positions.append(row)
+        if pipeline_output[1]:
+            whois_complete_rows.add(row)
+
+    # 2. Step -> Make a single matrix prediction for all successfully processed URLs, on the
+    # prediction thread -> Up to 'MAX_BATCH_SIZE' rows never stall the event loop.
+    if row_positions:
+        predictions = await batcher.predict_matrix(url_matrix[row_positions], caller="batch")
+
+        for row, prediction in zip(row_positions, predictions):
+            canonical_url, positions = uncached_groups[row]
+            if row in whois_complete_rows:
+                verdict_cache.set(canonical_url, float(prediction))
+            for position in positions:
+                results[position]["status"] = float(prediction)
+                results[position]["cached"] = False
+
+    return {"count": len(results), "results": results}
+
+
+@router.post(
+    "/stream",
+    tags=["data", "url", "phishing", "stream"],
+    responses={
+        200: {"content": {"application/x-ndjson": {}}},
+        404: {"Description": "Operation not found!"}
+    },
+    response_class=NDJSONStreamingResponse
+)
+async def retrieve_url_status_web_stream(request: Request):
+    """
+    Score an NDJSON (or chunked plain-text) stream of URL-strings, one per line, while the body
+    is still being uploaded. Each URL is scored on its own - a slow WHOIS lookup never holds back
+    the URLs behind it - and its result is sent as one NDJSON line as soon as it is ready. Lines
+    arrive in completion order and carry the 'index' of their (non-empty) input line, so clients
+    can restore the submitted order. At most 'STREAM_MAX_IN_FLIGHT' (256) URLs are in flight or
+    waiting to be sent per request, keeping server memory constant for arbitrarily long streams.
+
+    Parameters
+    ----------
+    request : fastapi.Request
+        Internal connection allowing access to fastapi state & the streamed request body.
+
+    Returns
+    -------
+    NDJSONStreamingResponse
+        One line per URL - '{"index", "url", "status", "cached"}', or '{"index", "url", "error"}'
+        for lines that could not be processed.
+    """
+    # Retrieve the Model batching scheduler, its input schema & verdict cache from internal FastAPI.
+    batcher: PredictionBatcher = request.app.state.batcher
+    feature_schema: FeatureSchema = request.app.state.feature_schema
+    verdict_cache: VerdictCache = request.app.state.verdict_cache
+
+    window = asyncio.Semaphore(int(os.getenv("STREAM_MAX_IN_FLIGHT", str(DEFAULT_STREAM_IN_FLIGHT))))
+    results: asyncio.Queue[Optional[Dict[str, Union[str, int, float, bool, None]]]] = asyncio.Queue()
+    scoring: Set[asyncio.Task] = set()
+    predictions: Dict[str, asyncio.Task] = {}
+
+    # 1. + 2. Step -> Pipeline & model prediction, shared by equivalent URLs scored concurrently.
+    async def predict_url(url_string: str) -> Tuple[float, bool]:
+        url_data, whois_complete = await finalised_data_pipeline_for_web_async(
+            url=url_string, schema=feature_schema, return_whois_complete=True
+        )
+        return await batcher.predict(url_data), whois_complete
+
+    async def score_url(index: int, url_string: str) -> None:
+        result: Dict[str, Union[str, int, float, bool, None]] = {"index": index, "url": url_string}
+
+        # 0. Step -> Serve repeated URLs straight from the verdict cache (skips Pipeline & model).
+        canonical_url = canonicalize_url(url=url_string)
+        cached_status = await verdict_cache.get_async(canonical_url)
+        if cached_status is not None:
+            result.update(status=cached_status, cached=True)
+            results.put_nowait(result)
+            return
+
+        prediction = predictions.get(canonical_url)
+        if prediction is None:
+            prediction = asyncio.create_task(predict_url(url_string))
+            predictions[canonical_url] = prediction
+            prediction.add_done_callback(lambda _: predictions.pop(canonical_url, None))
+
+        try:
+            status, whois_complete = await asyncio.shield(prediction)
+        except Exception as err:
+            result["error"] = f"Pipeline failure - {err}"
+        else:
+            if whois_complete:
+                verdict_cache.set(canonical_url, status)
+            result.update(status=status, cached=False)
+
+        results.put_nowait(result)
+
+    # Read the body line by line -> Every URL waits for a free slot in the window, never for the others.
+    async def schedule_urls() -> None:
+        index = 0
+        try:
+            async for url_string, error in read_stream_records(request):
+                await window.acquire()
+                if error is not None:
+                    results.put_nowait({"index": index, "url": url_string, "error": error})
+                else:
+                    task = asyncio.create_task(score_url(index, url_string))
+                    scoring.add(task)
+                    task.add_done_callback(scoring.discard)
+                index += 1
+
+            # Body complete -> Stop scoring if the client leaves before every result is sent.
+            watcher = asyncio.create_task(watch_disconnect(asyncio.current_task()))
+            try:
+                await asyncio.gather(*scoring)
+            finally:
+                watcher.cancel()
+        except ClientDisconnect:
+            pass
+        finally:
+            results.put_nowait(None)
+
+    async def watch_disconnect(scheduler: asyncio.Task) -> None:
+        while (await request.receive())["type"] != "http.disconnect":
+            pass
+        scheduler.cancel()
+
+    # Send results in completion order -> Each sent line frees its slot in the window.
+    async def send_results() -> AsyncIterator[str]:
+        # Tracked here, not as a route dependency -> The stream outlives the endpoint call.
+        with track_in_flight(REQUESTS_IN_FLIGHT, ("stream",)):
+            scheduler = asyncio.create_task(schedule_urls())
+            try:
+                while (result := await results.get()) is not None:
+                    window.release()
+                    yield json.dumps(result) + "\n"
+            finally:
+                scheduler.cancel()
+                for task in (*scoring, *predictions.values()):
+                    task.cancel()
 
-    return {"url": url_string, "status": prediction}
+    return NDJSONStreamingResponse(send_results())
@@ -0,0 +1,38 @@
+# ----------------------------------------
+# IMPORTS
+# ----------------------------------------
+
+from fastapi import APIRouter
+from fastapi.responses import PlainTextResponse
+
+from src.backend.pipeline.metrics_methods import METRICS_REGISTRY
+
+# ----------------------------------------
+# FASTAPI METRICS ENDPOINTS
+# ----------------------------------------
+
+# Setup Metrics-related APIrouter -> Prometheus scrape target.
+router = APIRouter(
+    tags=["metrics"],
+    responses={404: {"description": "Not found!"}}
+)
+
+@router.get(
+    "/metrics",
+    response_class=PlainTextResponse,
+    responses={404: {"Description": "Operation not found!"}}
+)
+async def retrieve_metrics():
+    """
+    Report the Pipeline stage latencies, WHOIS outcomes, model prediction latencies and requests
+    in flight in the Prometheus text exposition format.
+
+    Returns
+    -------
+    PlainTextResponse
+        Prometheus text document.
+    """
+    return PlainTextResponse(
+        METRICS_REGISTRY.render(),
+        media_type="text/plain; version=0.0.4; charset=utf-8"
+    )
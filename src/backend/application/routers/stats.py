@@ -0,0 +1,101 @@
+# ----------------------------------------
+# IMPORTS
+# ----------------------------------------
+
+from fastapi import APIRouter, Request
+
+from src.backend.pipeline.whois_methods import get_whois_cache
+
+# ----------------------------------------
+# FASTAPI STATS ENDPOINTS
+# ----------------------------------------
+
+# Setup Stats-related APIrouter -> Exposes internal counters for tuning.
+router = APIRouter(
+    prefix="/stats",
+    tags=["stats"],
+    responses={404: {"description": "Not found!"}}
+)
+
+@router.get(
+    "/whois-cache",
+    tags=["stats", "whois"],
+    responses={404: {"Description": "Operation not found!"}}
+)
+async def retrieve_whois_cache_stats():
+    """
+    Report the hit & miss counters of the WHOIS cache in front of the registry lookups.
+
+    Returns
+    -------
+    dict[str, int]
+        JSON formatted WHOIS cache counters.
+    """
+    return get_whois_cache().stats()
+
+
+@router.get(
+    "/batcher",
+    tags=["stats", "model"],
+    responses={404: {"Description": "Operation not found!"}}
+)
+async def retrieve_batcher_stats(request: Request):
+    """
+    Report the batch-size & wait-time distributions of the micro-batching inference scheduler.
+
+    Parameters
+    ----------
+    request : fastapi.Request
+        Internal connection allowing access to fastapi state.
+
+    Returns
+    -------
+    dict[str, Union[int, float, dict]]
+        JSON formatted scheduler configuration & distributions.
+    """
+    return request.app.state.batcher.stats()
+
+
+@router.get(
+    "/verdict-cache",
+    tags=["stats", "model"],
+    responses={404: {"Description": "Operation not found!"}}
+)
+async def retrieve_verdict_cache_stats(request: Request):
+    """
+    Report the hit & miss counters of the verdict cache in front of the Pipeline & model.
+
+    Parameters
+    ----------
+    request : fastapi.Request
+        Internal connection allowing access to fastapi state.
+
+    Returns
+    -------
+    dict[str, Union[int, str, None]]
+        JSON formatted verdict cache counters & bound model version.
+    """
+    return request.app.state.verdict_cache.stats()
+
+
+@router.get(
+    "/feature-plan",
+    tags=["stats", "model"],
+    responses={404: {"Description": "Operation not found!"}}
+)
+async def retrieve_feature_plan_stats(request: Request):
+    """
+    Report the Pipeline execution plan built from the model features - the cost classes of the
+    planned features and the Pipeline stages they require or skip.
+
+    Parameters
+    ----------
+    request : fastapi.Request
+        Internal connection allowing access to fastapi state.
+
+    Returns
+    -------
+    dict[str, Union[int, str, list, dict]]
+        JSON formatted execution plan summary.
+    """
+    return request.app.state.feature_plan.stats()
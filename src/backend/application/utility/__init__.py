@@ -2,14 +2,25 @@
 # IMPORTS
 # ----------------------------------------
 
-from .utility_methods import from_reponse_to_model
+from .utility_methods import from_reponse_to_model, load_model_with_cache, MODEL_BUCKET, MODEL_KEY
+from .batching_methods import PredictionBatcher
+from .tree_methods import FlatTreePredictor, load_flat_tree_predictor
+from .verdict_methods import VerdictCache, get_verdict_cache
 
 # ----------------------------------------
 # PACKAGE MANAGEMENT
 # ----------------------------------------
 
 __all__ = [
-    "from_reponse_to_model"
+    "from_reponse_to_model",
+    "load_model_with_cache",
+    "MODEL_BUCKET",
+    "MODEL_KEY",
+    "PredictionBatcher",
+    "FlatTreePredictor",
+    "load_flat_tree_predictor",
+    "VerdictCache",
+    "get_verdict_cache",
 ]
 __version__ = "0.0.1"
 __author__ = "HysingerDev"
\ No newline at end of file
@@ -0,0 +1,189 @@
+# ----------------------------------------
+# IMPORTS
+# ----------------------------------------
+
+import numpy as np
+import xgboost as xgb
+import asyncio
+import time
+
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Set, Tuple, Union
+
+from src.backend.pipeline.metrics_methods import BATCHER_BATCH_SIZE, BATCHER_WAIT_MILLISECONDS, time_prediction
+from .tree_methods import DEFAULT_FLAT_TREE_MAX_ROWS, FlatTreePredictor
+
+# ----------------------------------------
+# MICRO-BATCHING INFERENCE SCHEDULER
+# ----------------------------------------
+
+# Collects feature rows from concurrent requests and runs one matrix prediction per batch.
+class PredictionBatcher:
+    """
+    In-process micro-batching scheduler for XGBoost inference. Rows submitted by concurrent
+    requests are collected for at most 'max_wait_ms' (or until 'max_batch_size' rows are
+    waiting), predicted with a single 'inplace_predict' call on a dedicated thread, and each
+    score is handed back to its waiting request. Batches of at most 'flat_max_rows' rows are
+    evaluated inline by the flat NumPy tree evaluator if one is given - skipping the thread hop
+    & the XGBoost call overhead that dominate single-row latency.
+
+    Parameters
+    ----------
+    model : xgboost.Booster
+        XGBoost inference model.
+    max_batch_size : int
+        Maximum number of rows per prediction.
+    max_wait_ms : float
+        Maximum time in milliseconds the first row of a batch waits for others to join.
+    flat_predictor : FlatTreePredictor | None
+        Verified NumPy evaluator of the model (see 'load_flat_tree_predictor') - None to predict
+        every batch with XGBoost.
+    flat_max_rows : int
+        Largest batch evaluated by 'flat_predictor'.
+    """
+
+    def __init__(
+        self,
+        model: xgb.Booster,
+        max_batch_size: int = 64,
+        max_wait_ms: float = 2.0,
+        flat_predictor: Optional[FlatTreePredictor] = None,
+        flat_max_rows: int = DEFAULT_FLAT_TREE_MAX_ROWS
+    ):
+        if flat_max_rows < 0:
+            raise ValueError(f"'flat_max_rows' must be non-negative - Current value {flat_max_rows}")
+
+        self.model = model
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait_ms / 1000
+        self.flat_predictor = flat_predictor
+        self.flat_max_rows = flat_max_rows
+
+        # Registered with the '/metrics' endpoint -> 'stats' is a view over the same distributions.
+        self.batch_sizes = BATCHER_BATCH_SIZE
+        self.wait_times_ms = BATCHER_WAIT_MILLISECONDS
+
+        self._pending: List[Tuple[np.ndarray, asyncio.Future, float]] = []
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._tasks: Set[asyncio.Task] = set()
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="trotline-predict")
+
+    async def predict(self, row: np.ndarray) -> float:
+        """
+        Submit a single feature row and wait for its prediction.
+
+        Parameters
+        ----------
+        row : numpy.ndarray
+            Float32 feature row in model input order.
+
+        Returns
+        -------
+        float
+            Model prediction for the row.
+        """
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((row, future, time.perf_counter()))
+
+        if len(self._pending) >= self.max_batch_size:
+            self._dispatch()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.max_wait, self._dispatch)
+
+        return await future
+
+    async def predict_matrix(self, rows: np.ndarray, caller: str = "batch") -> np.ndarray:
+        """
+        Predict an already assembled feature matrix on the prediction thread - the event loop
+        keeps serving concurrent requests (and the batch timer) while XGBoost runs.
+
+        Parameters
+        ----------
+        rows : numpy.ndarray
+            Float32 feature matrix in model input order.
+        caller : str
+            Label of the prediction metrics (fx. 'batch').
+
+        Returns
+        -------
+        numpy.ndarray
+            Model prediction per row.
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, self._predict, rows, caller)
+
+    def stats(self) -> Dict[str, Union[int, float, Dict]]:
+        """
+        Snapshot of the scheduler configuration and its batch-size & wait-time distributions.
+
+        Returns
+        -------
+        dict[str, int | float | dict]
+            JSON-serialisable scheduler statistics.
+        """
+        return {
+            "max_batch_size": self.max_batch_size,
+            "max_wait_ms": self.max_wait * 1000,
+            "pending": len(self._pending),
+            "predictor": "numpy" if self.flat_predictor is not None else "xgboost",
+            "flat_max_rows": self.flat_max_rows if self.flat_predictor is not None else 0,
+            "batch_size": self.batch_sizes.snapshot(),
+            "wait_time_ms": self.wait_times_ms.snapshot(),
+        }
+
+    def close(self) -> None:
+        """
+        Release the prediction thread - Called on application shutdown.
+        """
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def _dispatch(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+        # Hand every full (or timed out) batch to its own prediction task.
+        while self._pending:
+            batch = self._pending[:self.max_batch_size]
+            del self._pending[:self.max_batch_size]
+
+            task = asyncio.ensure_future(self._run_batch(batch))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _run_batch(self, batch: List[Tuple[np.ndarray, asyncio.Future, float]]) -> None:
+        started_at = time.perf_counter()
+        self.batch_sizes.observe(len(batch))
+        for _, _, enqueued_at in batch:
+            self.wait_times_ms.observe((started_at - enqueued_at) * 1000)
+
+        rows = np.stack([row for row, _, _ in batch])
+
+        try:
+            # Micro-batches are cheaper to evaluate inline than to hand to the prediction thread.
+            if self.flat_predictor is not None and len(rows) <= self.flat_max_rows:
+                predictions = self._predict_flat(rows)
+            else:
+                loop = asyncio.get_running_loop()
+                predictions = await loop.run_in_executor(self._executor, self._predict, rows)
+        except Exception as err:
+            for _, future, _ in batch:
+                if not future.done():
+                    future.set_exception(err)
+            return
+
+        for (_, future, _), prediction in zip(batch, predictions):
+            if not future.done():
+                future.set_result(float(prediction))
+
+    def _predict(self, rows: np.ndarray, caller: str = "batcher") -> np.ndarray:
+        with time_prediction(caller, len(rows)):
+            return self.model.inplace_predict(rows)
+
+    def _predict_flat(self, rows: np.ndarray) -> np.ndarray:
+        with time_prediction("batcher", len(rows)):
+            return self.flat_predictor.predict(rows)
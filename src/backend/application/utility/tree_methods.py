@@ -0,0 +1,427 @@
+# ----------------------------------------
+# IMPORTS
+# ----------------------------------------
+
+import numpy as np
+import xgboost as xgb
+import json
+import logging
+import os
+
+from typing import Any, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# ----------------------------------------
+# FLAT TREE PREDICTOR CONFIGURATION
+# ----------------------------------------
+
+# Predictors selectable through the 'MODEL_PREDICTOR' environment variable.
+MODEL_PREDICTORS = ("xgboost", "numpy")
+
+# Largest micro-batch evaluated by the NumPy predictor -> Larger batches go to XGBoost.
+DEFAULT_FLAT_TREE_MAX_ROWS = 4
+
+# Synthetic validation rows used by the startup parity check.
+DEFAULT_VALIDATION_ROWS = 4096
+
+# Maximum deviation from 'Booster.predict' tolerated by the parity check (float32 summation order).
+PARITY_TOLERANCE = 1e-5
+
+# Link functions of the supported objectives -> Margin space of 'base_score' & output transform.
+OBJECTIVE_LINKS = {
+    "binary:logistic": "logit",
+    "reg:logistic": "logit",
+    "binary:logitraw": "identity",
+    "reg:squarederror": "identity",
+    "reg:pseudohubererror": "identity",
+    "reg:absoluteerror": "identity",
+    "count:poisson": "log",
+    "reg:gamma": "log",
+    "reg:tweedie": "log",
+}
+
+# Retrieve the predictor selected for single-row & small-batch inference.
+def get_model_predictor_name() -> str:
+    """
+    Retrieve the predictor selected by the 'MODEL_PREDICTOR' environment variable - 'xgboost'
+    (default) or 'numpy' for the flat NumPy tree evaluator.
+
+    Returns
+    -------
+    str
+        Name of the selected predictor.
+
+    Exceptions
+    ----------
+    ValueError
+        Raised if the environment variable names an unknown predictor.
+    """
+    predictor_name = os.getenv("MODEL_PREDICTOR", MODEL_PREDICTORS[0]).strip().lower()
+
+    if predictor_name not in MODEL_PREDICTORS:
+        raise ValueError(f"Unknown model predictor - expected one of {list(MODEL_PREDICTORS)}, got '{predictor_name}'")
+
+    return predictor_name
+
+# ----------------------------------------
+# FLAT TREE PREDICTOR
+# ----------------------------------------
+
+# Every tree of the Booster flattened into shared NumPy arrays -> No DMatrix or C-API call per row.
+class FlatTreePredictor:
+    """
+    Pure NumPy evaluator of a gradient boosted tree ensemble for single rows & small batches.
+    The trees of the Booster are flattened into node arrays (split feature, threshold, children,
+    default direction & leaf value) indexed by a global node id. A prediction evaluates the split
+    of every node at once, then walks all trees in parallel - one indexing step per tree level.
+    Splits follow XGBoost exactly - float32 'value < threshold' goes left, missing (NaN) values
+    follow the default direction of the node.
+
+    Parameters
+    ----------
+    feature : numpy.ndarray
+        Split feature per node (ignored for leaves).
+    threshold : numpy.ndarray
+        Float32 split threshold per node (ignored for leaves).
+    left : numpy.ndarray
+        Global id of the left child per node - -1 for leaves.
+    right : numpy.ndarray
+        Global id of the right child per node - -1 for leaves.
+    default_right : numpy.ndarray
+        Whether missing values follow the right child per node.
+    leaf_value : numpy.ndarray
+        Float32 leaf value per node (ignored for split nodes).
+    roots : numpy.ndarray
+        Global id of the root node per tree, in boosting order.
+    num_features : int
+        Number of model input features.
+    base_score : float
+        Base prediction in output space.
+    link : str
+        Link function of the objective - one of the 'OBJECTIVE_LINKS' values.
+    """
+
+    def __init__(
+        self,
+        feature: np.ndarray,
+        threshold: np.ndarray,
+        left: np.ndarray,
+        right: np.ndarray,
+        default_right: np.ndarray,
+        leaf_value: np.ndarray,
+        roots: np.ndarray,
+        num_features: int,
+        base_score: float,
+        link: str
+    ):
+        node_count = len(feature)
+        node_ids = np.arange(node_count, dtype=np.intp)
+        is_split = np.asarray(left) != -1
+        feature = np.where(is_split, feature, 0).astype(np.intp)
+
+        # Renumber the nodes -> Split nodes grouped by feature first, leaves last. A row is then
+        # expanded to one value per split node with 'numpy.repeat' instead of a random gather.
+        order = np.lexsort((node_ids, feature, ~is_split))
+        position = np.empty(node_count, dtype=np.intp)
+        position[order] = node_ids
+        split_nodes = order[:int(is_split.sum())]
+
+        self.num_features = num_features
+        self.base_score = base_score
+        self.link = link
+        self.base_margin = np.float32(self._to_margin(base_score))
+        self.node_count = node_count
+        self.depth = tree_depth(np.asarray(left), np.asarray(right), np.asarray(roots))
+
+        self._split_counts = np.bincount(feature[split_nodes], minlength=num_features)
+        self._threshold = np.asarray(threshold, dtype=np.float32)[split_nodes]
+        self._default_right = np.asarray(default_right, dtype=bool)[split_nodes]
+        self._left = position[np.asarray(left)[split_nodes]]
+        self._right = position[np.asarray(right)[split_nodes]]
+        self._leaves = node_ids[len(split_nodes):]
+        self._leaf_value = np.where(is_split, 0, leaf_value).astype(np.float32)[order]
+        self._roots = position[np.asarray(roots, dtype=np.intp)]
+
+    def __len__(self) -> int:
+        return len(self._roots)
+
+    def __repr__(self) -> str:
+        return f"FlatTreePredictor({len(self)} trees, {self.node_count} nodes, depth={self.depth})"
+
+    @classmethod
+    def from_booster(cls, booster: xgb.Booster) -> "FlatTreePredictor":
+        """
+        Flatten the trees of a loaded Booster (fx. from 'from_reponse_to_model') using its JSON
+        model dump - Called on application startup.
+
+        Parameters
+        ----------
+        booster : xgboost.Booster
+            Loaded XGBoost inference model.
+
+        Returns
+        -------
+        FlatTreePredictor
+            Predictor equivalent to the Booster.
+
+        Exceptions
+        ----------
+        ValueError
+            Raised if the model uses features the evaluator does not support (fx. 'dart' boosters,
+            multi-class objectives or categorical splits).
+        """
+        learner = json.loads(booster.save_raw(raw_format="json"))["learner"]
+        model_parameters = learner["learner_model_param"]
+        gradient_booster = learner["gradient_booster"]
+        objective = learner["objective"]["name"]
+
+        if gradient_booster["name"] != "gbtree":
+            raise ValueError(f"Unsupported booster - expected 'gbtree', got '{gradient_booster['name']}'")
+        if objective not in OBJECTIVE_LINKS:
+            raise ValueError(f"Unsupported objective - expected one of {list(OBJECTIVE_LINKS)}, got '{objective}'")
+        if int(model_parameters.get("num_class", 0)) > 1 or int(model_parameters.get("num_target", 1)) > 1:
+            raise ValueError("Unsupported model - only single-output models can be flattened")
+
+        trees = gradient_booster["model"]["trees"]
+        if not trees:
+            raise ValueError("Unsupported model - the Booster contains no trees")
+
+        columns: Dict[str, List[Any]] = {
+            "feature": [], "threshold": [], "left": [], "right": [], "default_right": [], "leaf_value": []
+        }
+        roots: List[int] = []
+        offset = 0
+
+        for tree in trees:
+            if any(tree["split_type"]):
+                raise ValueError(f"Unsupported split - tree {tree['id']} contains categorical splits")
+
+            left = np.asarray(tree["left_children"], dtype=np.intp)
+            right = np.asarray(tree["right_children"], dtype=np.intp)
+
+            # Split conditions hold the thresholds of split nodes & the values of leaves.
+            columns["feature"].append(tree["split_indices"])
+            columns["threshold"].append(tree["split_conditions"])
+            columns["left"].append(np.where(left == -1, -1, left + offset))
+            columns["right"].append(np.where(right == -1, -1, right + offset))
+            columns["default_right"].append(np.logical_not(tree["default_left"]))
+            columns["leaf_value"].append(tree["split_conditions"])
+
+            roots.append(offset)
+            offset += len(left)
+
+        # The 'base_score' is stored in output space, either bare ('5E-1') or as a list ('[5E-1]').
+        base_score = float(str(model_parameters["base_score"]).strip("[]").split(",")[0])
+
+        return cls(
+            **{name: np.concatenate(values) for name, values in columns.items()},
+            roots=np.asarray(roots),
+            num_features=int(model_parameters["num_feature"]),
+            base_score=base_score,
+            link=OBJECTIVE_LINKS[objective]
+        )
+
+    def predict(self, rows: np.ndarray) -> np.ndarray:
+        """
+        Predict a single row or a small batch of rows.
+
+        Parameters
+        ----------
+        rows : numpy.ndarray
+            Float32 feature row of shape (n_features,) or rows of shape (n_rows, n_features) in
+            model input order - NaN encodes missing values.
+
+        Returns
+        -------
+        numpy.ndarray
+            Float32 predictions of shape (n_rows,) - equal to 'Booster.predict'.
+
+        Exceptions
+        ----------
+        ValueError
+            Raised if the rows do not have the model feature count.
+        """
+        rows = np.atleast_2d(np.asarray(rows, dtype=np.float32))
+        if rows.ndim != 2 or rows.shape[1] != self.num_features:
+            raise ValueError(f"Rows must have {self.num_features} features - Current shape {rows.shape}")
+
+        row_count = len(rows)
+        split_count = len(self._threshold)
+        offsets = np.arange(row_count, dtype=np.intp)[:, None] * self.node_count
+
+        # Evaluate every split at once -> NaN fails '>=' & takes the default direction of the node.
+        values = np.repeat(rows, self._split_counts, axis=1)
+        go_right = values >= self._threshold
+        go_right |= np.isnan(values) & self._default_right
+
+        # Next node per node of every row -> Leaves point at themselves.
+        next_nodes = np.empty((row_count, self.node_count), dtype=np.intp)
+        np.add(np.where(go_right, self._right, self._left), offsets, out=next_nodes[:, :split_count])
+        np.add(self._leaves, offsets, out=next_nodes[:, split_count:])
+        next_nodes = next_nodes.ravel()
+
+        # Walk every tree of every row in parallel -> One step per tree level.
+        nodes = self._roots + offsets
+        for _ in range(self.depth):
+            nodes = next_nodes[nodes]
+
+        # Accumulate the leaves onto the base margin tree by tree -> Same float32 rounding as XGBoost.
+        contributions = np.empty((row_count, len(self._roots) + 1), dtype=np.float32)
+        contributions[:, 0] = self.base_margin
+        contributions[:, 1:] = self._leaf_value[nodes - offsets]
+        margins = np.cumsum(contributions, axis=1, dtype=np.float32)[:, -1]
+
+        return self._transform(margins)
+
+    def check_parity(self, booster: xgb.Booster, rows: Optional[np.ndarray] = None) -> float:
+        """
+        Compare the predictions against 'Booster.predict' - Run before the predictor is enabled.
+
+        Parameters
+        ----------
+        booster : xgboost.Booster
+            The Booster the predictor was built from.
+        rows : numpy.ndarray | None
+            Validation rows - synthetic rows covering every split threshold if omitted.
+
+        Returns
+        -------
+        float
+            Largest absolute difference between the two predictions.
+
+        Exceptions
+        ----------
+        ValueError
+            Raised if any prediction differs by more than 'PARITY_TOLERANCE'.
+        """
+        if rows is None:
+            rows = self.validation_rows()
+        rows = np.asarray(rows, dtype=np.float32)
+
+        expected = booster.predict(
+            xgb.DMatrix(rows, missing=np.nan, feature_names=booster.feature_names, feature_types=booster.feature_types)
+        )
+        actual = np.concatenate([self.predict(rows[start:start + 64]) for start in range(0, len(rows), 64)])
+
+        difference = float(np.max(np.abs(actual - expected), initial=0.0))
+        if not difference <= PARITY_TOLERANCE:
+            raise ValueError(
+                f"Flat tree predictor does not match the model - maximum difference {difference} > {PARITY_TOLERANCE}"
+            )
+
+        return difference
+
+    def validation_rows(self, count: int = DEFAULT_VALIDATION_ROWS, missing_rate: float = 0.1, seed: int = 0) -> np.ndarray:
+        """
+        Build synthetic validation rows exercising every split - values are drawn from the split
+        thresholds of their feature, exactly and one float32 step to either side, or missing.
+
+        Parameters
+        ----------
+        count : int
+            Number of rows.
+        missing_rate : float
+            Share of missing (NaN) values.
+        seed : int
+            Seed of the random generator.
+
+        Returns
+        -------
+        numpy.ndarray
+            Float32 rows of shape (count, n_features).
+        """
+        generator = np.random.default_rng(seed)
+        rows = np.zeros((count, self.num_features), dtype=np.float32)
+        feature_thresholds = np.split(self._threshold, np.cumsum(self._split_counts)[:-1])
+
+        for feature, thresholds in enumerate(feature_thresholds):
+            if not len(thresholds):
+                continue
+
+            thresholds = np.unique(thresholds)
+            candidates = np.concatenate([
+                thresholds,
+                np.nextafter(thresholds, np.float32(-np.inf)),
+                np.nextafter(thresholds, np.float32(np.inf)),
+            ])
+            rows[:, feature] = generator.choice(candidates, size=count)
+
+        rows[generator.random(rows.shape) < missing_rate] = np.nan
+
+        return rows
+
+    def _to_margin(self, score: float) -> float:
+        if self.link == "logit":
+            score = min(max(score, 1e-16), 1 - 1e-16)
+            return float(np.log(score / (1 - score)))
+        if self.link == "log":
+            return float(np.log(max(score, 1e-16)))
+        return score
+
+    def _transform(self, margins: np.ndarray) -> np.ndarray:
+        if self.link == "logit":
+            return np.float32(1) / (np.float32(1) + np.exp(-margins))
+        if self.link == "log":
+            return np.exp(margins)
+        return margins
+
+# Depth of the deepest tree -> Number of walking steps needed to reach every leaf.
+def tree_depth(left: np.ndarray, right: np.ndarray, roots: np.ndarray) -> int:
+    """
+    Measure the depth of the deepest tree of a flattened ensemble.
+
+    Parameters
+    ----------
+    left : numpy.ndarray
+        Global id of the left child per node - -1 for leaves.
+    right : numpy.ndarray
+        Global id of the right child per node - -1 for leaves.
+    roots : numpy.ndarray
+        Global id of the root node per tree.
+
+    Returns
+    -------
+    int
+        Number of splits on the longest path from a root to a leaf.
+    """
+    depth = 0
+    level = np.asarray(roots, dtype=np.intp)
+
+    while True:
+        level = np.concatenate([left[level], right[level]])
+        level = level[level != -1]
+        if not len(level):
+            return depth
+        depth += 1
+
+# Build the NumPy predictor at startup if selected -> Falls back to XGBoost unless the parity check passes.
+def load_flat_tree_predictor(booster: xgb.Booster) -> Optional[FlatTreePredictor]:
+    """
+    Build the flat NumPy tree evaluator for the loaded Booster if 'MODEL_PREDICTOR' selects it, and
+    verify it against 'Booster.predict' on the synthetic validation rows before enabling it.
+
+    Parameters
+    ----------
+    booster : xgboost.Booster
+        Loaded XGBoost inference model.
+
+    Returns
+    -------
+    FlatTreePredictor | None
+        The verified predictor - None if XGBoost is selected, or the model cannot be flattened or
+        fails the parity check.
+    """
+    if get_model_predictor_name() != "numpy":
+        return None
+
+    try:
+        predictor = FlatTreePredictor.from_booster(booster)
+        difference = predictor.check_parity(booster)
+    except ValueError as verr:
+        logger.warning("Flat tree predictor disabled - %s", verr)
+        return None
+
+    logger.info("Flat tree predictor enabled - %r, maximum parity difference %.3g", predictor, difference)
+
+    return predictor
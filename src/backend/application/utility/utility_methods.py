@@ -3,9 +3,24 @@
 # ----------------------------------------
 
 import xgboost as xgb
+import logging
+import os
+import tempfile
 
+from pathlib import Path
+from typing import Any, Optional, Tuple
+from botocore.exceptions import BotoCoreError, ClientError
 from botocore.response import StreamingBody
 
+logger = logging.getLogger(__name__)
+
+# Size of the chunks streamed from S3 (AWS) to the local model cache.
+MODEL_DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+
+# Location of the production XGBoost model on S3 (AWS).
+MODEL_BUCKET = "arn:aws:s3:eu-north-1:212282292075:accesspoint/xgb-model"
+MODEL_KEY = "XGBoost-model.ubj"
+
 # ----------------------------------------
 # UTILITY & HELPER METHODS
 # ----------------------------------------
@@ -45,5 +60,127 @@ def from_reponse_to_model(body: StreamingBody) -> xgb.Booster:
 
     return xgb_model
 
+# Load the XGBoost model through a local on-disk cache validated against the S3 (AWS) ETag.
+# Falls back to the last cached model if S3 cannot be reached.
+def load_model_with_cache(s3_client: Any, bucket: str, key: str, cache_dir: str) -> Tuple[xgb.Booster, str]:
+    """
+    Validate the locally cached model file against the S3 (AWS) object ETag with a HEAD request,
+    stream the object to disk only when it changed, and load the XGBoost inference model from the
+    cached file path.
+
+    Parameters
+    ----------
+    s3_client : botocore.client.S3
+        AWS S3 client session.
+    bucket : str
+        Bucket (or access point ARN) holding the model object.
+    key : str
+        Key of the model object.
+    cache_dir : str
+        Local directory holding the cached model & its ETag.
+
+    Returns
+    -------
+    tuple[xgboost.Booster, str]
+        XGBoost inference model and its version (S3 ETag) - used to identify the loaded model.
+
+    Exceptions
+    ----------
+    ModuleNotFoundError
+        Raised if S3 cannot be reached and no cached model is available.
+    """
+    cache_path = Path(cache_dir)
+    cache_path.mkdir(parents=True, exist_ok=True)
+
+    model_path = cache_path / Path(key).name
+    etag_path = model_path.with_name(model_path.name + ".etag")
+
+    cached_etag: Optional[str] = None
+    if model_path.exists() and etag_path.exists():
+        cached_etag = etag_path.read_text().strip()
+
+    try:
+        # HEAD request -> Compare the remote ETag with the cached one.
+        head_response = s3_client.head_object(Bucket=bucket, Key=key)
+        remote_etag: str = head_response["ETag"].strip('"')
+
+        if remote_etag != cached_etag:
+            download_model_to_file(s3_client, bucket, key, remote_etag, model_path)
+            write_text_atomically(etag_path, remote_etag)
+    except (BotoCoreError, ClientError) as err:
+        if cached_etag is None:
+            raise ModuleNotFoundError(f"XGBoost Model unavailable - S3 unreachable and no cached model: {err}")
+
+        logger.warning("S3 unreachable (%s) - loading last cached model version %s", err, cached_etag)
+        remote_etag = cached_etag
+
+    # Load the finalized inference model directly from the cached file.
+    xgb_model = xgb.Booster(model_file=str(model_path))
+
+    return xgb_model, remote_etag
 
+# Stream the S3 (AWS) model object to the local cache without holding it in memory.
+def download_model_to_file(s3_client: Any, bucket: str, key: str, etag: str, model_path: Path) -> Path:
+    """
+    Stream the model object in fixed-size chunks into a temporary file next to the cached model
+    and atomically move it into place once complete.
+
+    Parameters
+    ----------
+    s3_client : botocore.client.S3
+        AWS S3 client session.
+    bucket : str
+        Bucket (or access point ARN) holding the model object.
+    key : str
+        Key of the model object.
+    etag : str
+        Expected ETag - the download fails if the object changed since the HEAD request.
+    model_path : pathlib.Path
+        Destination of the cached model file.
+
+    Returns
+    -------
+    pathlib.Path
+        Location of the cached model file.
+
+    Exceptions
+    ----------
+    ModuleNotFoundError
+        Raised if the S3 object contains no binary data.
+    """
+    model_response = s3_client.get_object(Bucket=bucket, Key=key, IfMatch=f'"{etag}"')
+    model_body: StreamingBody = model_response["Body"]
+
+    file_descriptor, temporary_name = tempfile.mkstemp(dir=model_path.parent, suffix=".part")
+    try:
+        with os.fdopen(file_descriptor, "wb") as model_file:
+            for chunk in model_body.iter_chunks(chunk_size=MODEL_DOWNLOAD_CHUNK_SIZE):
+                model_file.write(chunk)
+
+            if model_file.tell() == 0:
+                raise ModuleNotFoundError("XGBoost Model file not loaded correctly!")
+
+        os.replace(temporary_name, model_path)
+    except BaseException:
+        Path(temporary_name).unlink(missing_ok=True)
+        raise
+
+    return model_path
+
+# Replace a small text file atomically -> Concurrent workers never read a partial file.
+def write_text_atomically(path: Path, text: str) -> None:
+    """
+    Write the text into a temporary file next to the destination and move it into place.
+
+    Parameters
+    ----------
+    path : pathlib.Path
+        Destination file.
+    text : str
+        Content to be written.
+    """
+    file_descriptor, temporary_name = tempfile.mkstemp(dir=path.parent, suffix=".part")
+    with os.fdopen(file_descriptor, "w") as text_file:
+        text_file.write(text)
 
+    os.replace(temporary_name, path)
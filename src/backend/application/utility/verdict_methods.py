@@ -0,0 +1,198 @@
+# ----------------------------------------
+# IMPORTS
+# ----------------------------------------
+
+import asyncio
+import hashlib
+import os
+
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Optional
+
+from src.backend.pipeline.cache_methods import TieredTTLCache
+
+# Threads running the Redis calls of the verdict cache -> Keeps the network off the event loop.
+VERDICT_REDIS_WORKERS = 4
+
+# ----------------------------------------
+# VERDICT CACHE
+# ----------------------------------------
+
+# Full-result cache for scored URLs -> Keyed by canonical URL & model version.
+class VerdictCache:
+    """
+    Cache of model verdicts for recently scored URLs, backed by an in-process LRU and an optional
+    shared Redis tier. URLs are looked up by their canonical form (see 'canonicalize_url'), so
+    equivalent spellings of one URL share a verdict. Every key embeds the loaded model version, so
+    verdicts of a previous model are never served - binding a new version also drops the
+    in-process entries. Async callers use 'get_async' & 'set', which only touch the Redis tier
+    from a small thread pool - a slow or unreachable Redis never stalls the event loop.
+
+    Parameters
+    ----------
+    cache : TieredTTLCache
+        Two-tier cache holding the verdicts.
+    """
+
+    def __init__(self, cache: TieredTTLCache):
+        self.cache = cache
+        self.model_version: Optional[str] = None
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    def bind_model(self, model_version: str) -> None:
+        """
+        Associate the cache with the loaded model - Called whenever a model is (re)loaded.
+
+        Parameters
+        ----------
+        model_version : str
+            Version identifier of the loaded model (fx. its S3 ETag).
+        """
+        if model_version != self.model_version:
+            self.cache.clear()
+            self.model_version = model_version
+
+    def key(self, canonical_url: str) -> str:
+        """
+        Cache key of the canonical URL-string for the bound model version.
+
+        Parameters
+        ----------
+        canonical_url : str
+            Canonical form of the URL-string.
+
+        Returns
+        -------
+        str
+            Model version & digest of the canonical URL-string.
+        """
+        url_digest = hashlib.sha256(canonical_url.encode("utf-8", "surrogatepass")).hexdigest()
+        return f"{self.model_version}:{url_digest}"
+
+    def get(self, canonical_url: str) -> Optional[float]:
+        """
+        Look up the cached verdict of the URL-string.
+
+        Parameters
+        ----------
+        canonical_url : str
+            Canonical form of the URL-string.
+
+        Returns
+        -------
+        float | None
+            The cached model prediction, or None if the URL has not been scored recently.
+        """
+        found, status = self.cache.get(self.key(canonical_url))
+        return status if found else None
+
+    async def get_async(self, canonical_url: str) -> Optional[float]:
+        """
+        Look up the cached verdict of the URL-string without blocking the event loop - the Redis
+        tier is queried on the cache threads after an in-process miss.
+
+        Parameters
+        ----------
+        canonical_url : str
+            Canonical form of the URL-string.
+
+        Returns
+        -------
+        float | None
+            The cached model prediction, or None if the URL has not been scored recently.
+        """
+        key = self.key(canonical_url)
+        found, status = self.cache.get_local(key)
+
+        if not found:
+            if self.cache.shared:
+                loop = asyncio.get_running_loop()
+                found, status = await loop.run_in_executor(self._get_executor(), self.cache.get_shared, key)
+            else:
+                found, status = self.cache.get_shared(key)
+
+        return status if found else None
+
+    def set(self, canonical_url: str, status: float) -> None:
+        """
+        Store the verdict of the URL-string - Never blocks, the Redis tier is written in the
+        background on the cache threads.
+
+        Parameters
+        ----------
+        canonical_url : str
+            Canonical form of the URL-string.
+        status : float
+            Model prediction for the URL-string.
+        """
+        key = self.key(canonical_url)
+        self.cache.set_local(key, status)
+
+        if self.cache.shared:
+            self._get_executor().submit(self.cache.set_shared, key, status)
+
+    def stats(self) -> Dict[str, Optional[int | str]]:
+        """
+        Snapshot of the cache counters and the bound model version.
+
+        Returns
+        -------
+        dict[str, int | str | None]
+            Hit, miss, Redis-hit and Redis-error counters, in-process size and model version.
+        """
+        return {**self.cache.stats(), "model_version": self.model_version}
+
+    def close(self) -> None:
+        """
+        Release the cache threads - Called on application shutdown. Pending Redis writes are dropped.
+        """
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        # Built lazily -> A cache without Redis tier never starts a thread.
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=VERDICT_REDIS_WORKERS, thread_name_prefix="trotline-verdict")
+        return self._executor
+
+# Shared verdict cache instance -> Built lazily so environment variables are read after startup.
+_verdict_cache: Optional[VerdictCache] = None
+
+# Retrieve (or build) the verdict cache.
+def get_verdict_cache() -> VerdictCache:
+    """
+    Retrieve the process-wide verdict cache, building it on first use from environment variables.
+
+    Environment
+    -----------
+    VERDICT_CACHE_SIZE : int
+        Maximum number of verdicts held in-process (default 100000).
+    VERDICT_CACHE_TTL : float
+        Seconds a verdict is reused (default 3600 - one hour).
+    REDIS_URL : str
+        Optional Redis connection URL for the tier shared between workers.
+    REDIS_TIMEOUT_MS : float
+        Milliseconds a Redis call may take before it counts as a miss (default 250).
+
+    Returns
+    -------
+    VerdictCache
+        The verdict cache instance.
+    """
+    global _verdict_cache
+
+    if _verdict_cache is None:
+        verdict_ttl = float(os.getenv("VERDICT_CACHE_TTL", "3600"))
+        _verdict_cache = VerdictCache(
+            TieredTTLCache(
+                namespace="verdict",
+                max_size=int(os.getenv("VERDICT_CACHE_SIZE", "100000")),
+                ttl=verdict_ttl,
+                negative_ttl=verdict_ttl,
+                redis_url=os.getenv("REDIS_URL"),
+                redis_timeout=float(os.getenv("REDIS_TIMEOUT_MS", "250")) / 1000
+            )
+        )
+
+    return _verdict_cache
@@ -2,14 +2,41 @@
 # IMPORTS
 # ----------------------------------------
 
-from .final_pipeline import finalised_data_pipeline_for_web
+from .final_pipeline import (
+  FEATURE_COLUMNS,
+  EXTENDED_FEATURE_COLUMNS,
+  finalised_data_pipeline_for_web,
+  finalised_data_pipeline_for_web_async,
+  finalised_data_pipeline_for_py,
+  finalised_data_pipeline_for_batch,
+)
+from .parsing_methods import ParsedURL, parse_url, canonicalize_url
+from .feature_schema import FeatureSchema, FeatureSpec
+from .feature_registry import FeaturePlan, get_feature_plan
+from .parallel_methods import ParallelPipelineExecutor
+from .store_methods import FeatureStore, pipeline_fingerprint
 
 # ----------------------------------------
 # PACKAGE MANAGEMENT
 # ----------------------------------------
 
 __all__ = [
+    "FEATURE_COLUMNS",
+    "EXTENDED_FEATURE_COLUMNS",
     "finalised_data_pipeline_for_web",
+    "finalised_data_pipeline_for_web_async",
+    "finalised_data_pipeline_for_py",
+    "finalised_data_pipeline_for_batch",
+    "ParsedURL",
+    "parse_url",
+    "canonicalize_url",
+    "FeatureSchema",
+    "FeatureSpec",
+    "FeaturePlan",
+    "get_feature_plan",
+    "ParallelPipelineExecutor",
+    "FeatureStore",
+    "pipeline_fingerprint",
 ]
 __version__ = "0.0.1"
 __author__ = "HysingerDev"
\ No newline at end of file
@@ -0,0 +1,260 @@
+# ----------------------------------------
+# IMPORTS
+# ----------------------------------------
+
+import json
+import threading
+import time
+import redis
+
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+# Default connect & read timeout of the Redis tier -> A slow Redis costs a cache miss, not a stalled request.
+DEFAULT_REDIS_TIMEOUT = 0.25
+
+# Seconds the Redis tier is skipped after a failure -> An unreachable Redis costs one timeout per window.
+REDIS_RETRY_AFTER = 5.0
+
+# ----------------------------------------
+# PIPELINE CACHE METHODS
+# ----------------------------------------
+
+# Two-tier cache -> In-process LRU with TTL in front of an optional shared Redis tier.
+# Negative results (lookups that produced no data) are stored with a shorter TTL.
+class TieredTTLCache:
+  """
+  Thread-safe, two-tier key-value cache used to avoid repeating slow Pipeline operations -
+  Utility class in Trotline finalised Data Pipeline. The first tier is an in-process LRU with
+  per-entry expiry, the second an optional Redis instance shared by several workers. Redis
+  failures and timeouts count as misses, and the Redis tier is skipped for 'REDIS_RETRY_AFTER'
+  seconds after each failure.
+
+  Parameters
+  ----------
+  namespace : str
+    Prefix for Redis keys, separating caches that share one Redis instance.
+  max_size : int
+    Maximum number of entries held by the in-process tier.
+  ttl : float
+    Time-to-live in seconds for positive results.
+  negative_ttl : float
+    Time-to-live in seconds for negative results.
+  redis_url : str | None
+    Connection URL for the shared Redis tier - in-process tier only if omitted.
+  redis_timeout : float
+    Connect & read timeout in seconds of every Redis call.
+  """
+
+  def __init__(
+      self,
+      namespace: str,
+      max_size: int,
+      ttl: float,
+      negative_ttl: float,
+      redis_url: Optional[str] = None,
+      redis_timeout: float = DEFAULT_REDIS_TIMEOUT
+    ):
+    self.namespace = namespace
+    self.max_size = max_size
+    self.ttl = ttl
+    self.negative_ttl = negative_ttl
+
+    self._entries: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+    self._lock = threading.Lock()
+    self._redis = redis.Redis.from_url(
+      redis_url, socket_timeout=redis_timeout, socket_connect_timeout=redis_timeout
+    ) if redis_url else None
+    self._redis_down_until = 0.0
+
+    self.hits = 0
+    self.misses = 0
+    self.redis_hits = 0
+    self.redis_errors = 0
+
+  @property
+  def shared(self) -> bool:
+    """
+    Whether the cache has a Redis tier - its calls block on the network.
+    """
+    return self._redis is not None
+
+  def get(self, key: str) -> Tuple[bool, Any]:
+    """
+    Look up the key in the in-process tier, then in the Redis tier.
+
+    Parameters
+    ----------
+    key : str
+      Cache key to be looked up.
+
+    Returns
+    -------
+    tuple[bool, Any]
+      Whether the key was found, and the cached value (None if not found).
+    """
+    found, value = self.get_local(key)
+    if found:
+      return True, value
+
+    return self.get_shared(key)
+
+  def get_local(self, key: str) -> Tuple[bool, Any]:
+    """
+    Look up the key in the in-process tier only - Never blocks. Misses are not counted, so a
+    miss must be followed by 'get_shared'.
+
+    Parameters
+    ----------
+    key : str
+      Cache key to be looked up.
+
+    Returns
+    -------
+    tuple[bool, Any]
+      Whether the key was found, and the cached value (None if not found).
+    """
+    now = time.monotonic()
+
+    with self._lock:
+      entry = self._entries.get(key)
+      if entry is not None:
+        expires_at, value = entry
+        if expires_at > now:
+          self._entries.move_to_end(key)
+          self.hits += 1
+          return True, value
+        del self._entries[key]
+
+    return False, None
+
+  def get_shared(self, key: str) -> Tuple[bool, Any]:
+    """
+    Look up the key in the Redis tier, promoting hits into the in-process tier - Blocks on the
+    network if the cache is 'shared'. Redis failures count as misses.
+
+    Parameters
+    ----------
+    key : str
+      Cache key to be looked up.
+
+    Returns
+    -------
+    tuple[bool, Any]
+      Whether the key was found, and the cached value (None if not found).
+    """
+    if self._redis_available():
+      try:
+        payload, ttl = self._redis.pipeline().get(self._redis_key(key)).ttl(self._redis_key(key)).execute()
+      except redis.RedisError:
+        payload, ttl = None, -1
+        self._redis_failed()
+
+      if payload is not None:
+        value = json.loads(payload)
+        self._store_local(key, value, ttl if ttl > 0 else self.negative_ttl)
+        with self._lock:
+          self.hits += 1
+          self.redis_hits += 1
+        return True, value
+
+    with self._lock:
+      self.misses += 1
+
+    return False, None
+
+  def set(self, key: str, value: Any, negative: bool = False) -> None:
+    """
+    Store a JSON-serialisable value in both tiers.
+
+    Parameters
+    ----------
+    key : str
+      Cache key to store the value under.
+    value : Any
+      JSON-serialisable value to be cached.
+    negative : bool
+      Whether the value is a negative result -> Stored with the shorter negative TTL.
+    """
+    self.set_local(key, value, negative)
+    self.set_shared(key, value, negative)
+
+  def set_local(self, key: str, value: Any, negative: bool = False) -> None:
+    """
+    Store a value in the in-process tier only - Never blocks.
+
+    Parameters
+    ----------
+    key : str
+      Cache key to store the value under.
+    value : Any
+      JSON-serialisable value to be cached.
+    negative : bool
+      Whether the value is a negative result -> Stored with the shorter negative TTL.
+    """
+    self._store_local(key, value, self.negative_ttl if negative else self.ttl)
+
+  def set_shared(self, key: str, value: Any, negative: bool = False) -> None:
+    """
+    Store a value in the Redis tier only - Blocks on the network if the cache is 'shared'.
+    Redis failures are counted and otherwise ignored.
+
+    Parameters
+    ----------
+    key : str
+      Cache key to store the value under.
+    value : Any
+      JSON-serialisable value to be cached.
+    negative : bool
+      Whether the value is a negative result -> Stored with the shorter negative TTL.
+    """
+    if self._redis_available():
+      ttl = self.negative_ttl if negative else self.ttl
+      try:
+        self._redis.set(self._redis_key(key), json.dumps(value), ex=max(1, int(ttl)))
+      except redis.RedisError:
+        self._redis_failed()
+
+  def clear(self) -> None:
+    """
+    Drop every entry held by the in-process tier and reset the counters.
+    """
+    with self._lock:
+      self._entries.clear()
+      self.hits = self.misses = self.redis_hits = self.redis_errors = 0
+
+  def stats(self) -> Dict[str, int]:
+    """
+    Snapshot of the cache counters.
+
+    Returns
+    -------
+    dict[str, int]
+      Hit, miss, Redis-hit and Redis-error counters plus the current in-process size.
+    """
+    with self._lock:
+      return {
+        "hits": self.hits,
+        "misses": self.misses,
+        "redis_hits": self.redis_hits,
+        "redis_errors": self.redis_errors,
+        "size": len(self._entries),
+      }
+
+  def _store_local(self, key: str, value: Any, ttl: float) -> None:
+    with self._lock:
+      self._entries[key] = (time.monotonic() + ttl, value)
+      self._entries.move_to_end(key)
+      while len(self._entries) > self.max_size:
+        self._entries.popitem(last=False)
+
+  def _redis_available(self) -> bool:
+    return self._redis is not None and time.monotonic() >= self._redis_down_until
+
+  def _redis_failed(self) -> None:
+    with self._lock:
+      self.redis_errors += 1
+      self._redis_down_until = time.monotonic() + REDIS_RETRY_AFTER
+
+  def _redis_key(self, key: str) -> str:
+    return f"trotline:{self.namespace}:{key}"
@@ -2,61 +2,163 @@
 # IMPORTS
 # ----------------------------------------
 
-from collections import Counter
-from typing import Dict, Union
+import numpy as np
+import pandas as pd
+import re
+
+from typing import Dict, NamedTuple, Optional, Union
+
+# ----------------------------------------
+# PIPELINE CHARACTER CONSTANTS
+# ----------------------------------------
+
+# Special characters counted by the Pipeline -> Feature name mapped to the counted character.
+# Shared by the single-URL and batch methods to guarantee identical feature output.
+special_characters_map = {
+    "nb_dots": ".",
+    "nb_hyphens": "-",
+    "nb_at": "@",
+    "nb_qm": "?",
+    "nb_and": "&",
+    "nb_or": "|",
+    "nb_eq": "=",
+    "nb_underscore": "_",
+    "nb_tilde": "~",
+    "nb_percent": "%",
+    "nb_slash": "/",
+    "nb_star": "*",
+    "nb_colon": ":",
+    "nb_comma": ",",
+    "nb_apostrophe": "'",
+    "nb_pound": "#",
+    "nb_semicolumn": ";",
+    "nb_dollar": "$",
+    "nb_space": " ",
+}
+
+# ASCII code points of the counted special characters & digits -> Histogram lookup indexes.
+special_character_codes = np.array([ord(char) for char in special_characters_map.values()])
+digit_codes = np.arange(ord("0"), ord("9") + 1)
+
+# Longest URL-string accepted by the character statistics -> Guards against pathological inputs.
+MAX_URL_LENGTH = 32768
+
+# ----------------------------------------
+# PIPELINE CHARACTER HISTOGRAM
+# ----------------------------------------
+
+# Reject URL-strings beyond 'MAX_URL_LENGTH' before any Pipeline stage runs.
+def check_url_length(text: str) -> None:
+  """
+  Check the specified URL-string against the maximum supported length - Utility method in Trotline
+  finalised Data Pipeline.
+
+  Parameters
+  ----------
+  text : str
+    URL-string to be checked.
+
+  Exceptions
+  ----------
+  ValueError
+    Raised if the URL-string exceeds 'MAX_URL_LENGTH' characters.
+  """
+  if len(text) > MAX_URL_LENGTH:
+    raise ValueError(f"URL exceeds the maximum length of {MAX_URL_LENGTH} characters - Current length {len(text)}")
+
+# Character histogram shared by every character-based Pipeline stage.
+class CharacterHistogram(NamedTuple):
+  """
+  Character counts of a URL-string collected in a single scan - Utility class in Trotline
+  finalised Data Pipeline.
+
+  Attributes
+  ----------
+  length : int
+    Number of characters in the URL-string.
+  ascii_counts : numpy.ndarray
+    Occurrences per ASCII code point (128 entries).
+  distinct_counts : numpy.ndarray
+    Occurrences of every distinct character, including non-ASCII characters.
+  """
+  length: int
+  ascii_counts: np.ndarray
+  distinct_counts: np.ndarray
+
+# Scan the URL-string once and count every character.
+def build_character_histogram(text: str) -> CharacterHistogram:
+  """
+  Count every character of the specified URL-string in a single vectorized pass - byte-level
+  'bincount' for ASCII strings, code point counting otherwise - Utility method in Trotline
+  finalised Data Pipeline.
+
+  Parameters
+  ----------
+  text : str
+    URL-string to be counted.
+
+  Returns
+  -------
+  CharacterHistogram
+    Character counts shared by the entropy & special character stages.
+
+  Exceptions
+  ----------
+  ValueError
+    Raised if the URL-string exceeds 'MAX_URL_LENGTH' characters.
+  """
+  check_url_length(text=text)
+
+  if text.isascii():
+    codes = np.frombuffer(text.encode("ascii"), dtype=np.uint8)
+    ascii_counts = np.bincount(codes, minlength=128)
+    distinct_counts = ascii_counts[ascii_counts > 0]
+  else:
+    codes = np.frombuffer(text.encode("utf-32-le", "surrogatepass"), dtype=np.uint32)
+    ascii_counts = np.bincount(codes[codes < 128], minlength=128)
+    distinct_counts = np.unique(codes, return_counts=True)[1]
+
+  return CharacterHistogram(length=len(text), ascii_counts=ascii_counts, distinct_counts=distinct_counts)
 
 # ----------------------------------------
 # PIPELINE CHARACTER & DIGITS METHODS
 # ----------------------------------------
 
 # Count the apperance of special character instances in the specified URL.
-def categorize_special_chars(text: str) -> Dict[str, int]:
+def categorize_special_chars(text: str, histogram: Optional[CharacterHistogram] = None) -> Dict[str, int]:
   """
-  Utilise Python native 'Counter' to count the instances of special chars & digits in the specified
-  URL-string - Utility method in Trotline finalised Data Pipeline.
+  Utilise the shared character histogram to count the instances of special chars & digits in the
+  specified URL-string - Utility method in Trotline finalised Data Pipeline.
   
   Parameters
   ----------
   text : str
     URL-string to be parses & data extracted from.
+  histogram : CharacterHistogram | None
+    Precomputed histogram of the URL-string - built from the text if omitted.
 
   Returns
   -------
   Dict[str, int]
     Dictionary of special chars + digits and the number of individual occurences.
   """
+  if histogram is None:
+    histogram = build_character_histogram(text=text)
 
-  counter = Counter(text)
+  special_chars = dict(zip(special_characters_map, histogram.ascii_counts[special_character_codes].tolist()))
+  special_chars["nb_digits"] = int(histogram.ascii_counts[digit_codes].sum())
 
   return {
       "nb_www": text.count("www"),
-      "special_chars": {
-        "nb_dots": counter["."],
-        "nb_hyphens": counter["-"],
-        "nb_at": counter["@"],
-        "nb_qm": counter["?"],
-        "nb_and": counter["&"],
-        "nb_or": counter["|"],
-        "nb_eq": counter["="],
-        "nb_underscore": counter["_"],
-        "nb_tilde": counter["~"],
-        "nb_percent": counter["%"],
-        "nb_slash": counter["/"],
-        "nb_star": counter["*"],
-        "nb_colon": counter[":"],
-        "nb_comma": counter[","],
-        "nb_apostrophe": counter["'"],
-        "nb_pound": counter["#"],
-        "nb_semicolumn": counter[";"],
-        "nb_dollar": counter["$"],
-        "nb_space": counter[" "],
-        "nb_digits": sum(counter[digit] for digit in "0123456789"),
-      }
+      "special_chars": special_chars
   }
 
 # Finalized Wrapper method for extracting, processing and formulating Character-based data.
 # Returns a Python Dict-object.
-def retrieve_character_based_data(url: str) -> Dict[str, Union[float, int]]:
+def retrieve_character_based_data(
+    url: str,
+    histogram: Optional[CharacterHistogram] = None
+  ) -> Dict[str, Union[float, int]]:
   """
   Wrapper method for extracting character-based numerical data from specified URL-string - 
   Utility method in Trotline finalised Data Pipeline.
@@ -65,6 +167,8 @@ def retrieve_character_based_data(url: str) -> Dict[str, Union[float, int]]:
   ----------
   url: str
     URL-string to be parses & data extracted from.
+  histogram : CharacterHistogram | None
+    Precomputed histogram of the URL-string - built from the URL if omitted.
 
   Returns
   -------
@@ -72,22 +176,64 @@ def retrieve_character_based_data(url: str) -> Dict[str, Union[float, int]]:
     Dictionary format of extracted character-based data.
   """
   # Extract the necessary numerical data from URL
-  url_length = len(url)
+  if histogram is None:
+    histogram = build_character_histogram(text=url)
+  url_length = histogram.length
 
   # Extract character data from URL
-  special_chars_data = categorize_special_chars(text=url)           # Char instances
+  special_chars_data = categorize_special_chars(text=url, histogram=histogram)   # Char instances
   special_char_instances = special_chars_data.pop("special_chars")  # Inside values
   special_chars_num = sum(special_char_instances.values())          # Num of Chars
 
   # Extract digit data from URL
   digits_num = special_char_instances["nb_digits"]                  # Num of Digits
 
-  # Calculate the ratios for Special Chars & Digits
+  # Calculate the ratios for Special Chars & Digits -> Missing for empty URL-strings.
   special_chars_data["url_length"] = url_length
-  special_chars_data["special_chars_ratio"] = float(special_chars_num / url_length)
-  special_chars_data["digits_ratio"] = float(digits_num / url_length)
+  special_chars_data["special_chars_ratio"] = float(special_chars_num / url_length) if url_length else None
+  special_chars_data["digits_ratio"] = float(digits_num / url_length) if url_length else None
 
   # Concatenate the 2 dicts into a single instance
   results = special_chars_data | special_char_instances
 
-  return results
\ No newline at end of file
+  return results
+
+# Vectorized counterpart of 'retrieve_character_based_data' for entire URL collections.
+# Returns a pandas DataFrame-object with one row per URL.
+def retrieve_character_based_data_batch(urls: pd.Series) -> pd.DataFrame:
+  """
+  Vectorized wrapper method for extracting character-based numerical data from a collection of
+  URL-strings using pandas string operations - Utility method in Trotline finalised Data Pipeline.
+
+  Parameters
+  ----------
+  urls : pandas.Series
+    Series of URL-strings to be parsed & data extracted from.
+
+  Returns
+  -------
+  pandas.DataFrame
+    DataFrame of extracted character-based data - one row per URL, same index as the input.
+  """
+  url_strings = urls.str
+  url_length = url_strings.len()
+
+  # Count the instances of every special char & digit in a single column operation each.
+  special_chars = pd.DataFrame(
+    {name: url_strings.count(re.escape(char)) for name, char in special_characters_map.items()},
+    index=urls.index
+  )
+  special_chars["nb_digits"] = url_strings.count("[0-9]")
+
+  # Calculate the ratios for Special Chars & Digits
+  results = pd.DataFrame(
+    {
+      "nb_www": url_strings.count("www"),
+      "url_length": url_length,
+      "special_chars_ratio": special_chars.sum(axis=1) / url_length,
+      "digits_ratio": special_chars["nb_digits"] / url_length,
+    },
+    index=urls.index
+  )
+
+  return pd.concat([results, special_chars], axis=1)
@@ -42,4 +42,40 @@ typosquatted_domains_set = {
     "uber", "lyft", "doordash", "airbnb", "booking", "hulu", "disneyplus", "primevideo",
     "paramountplus", "skype", "slack", "zoom", "salesforce", "workforce", "citibank",
     "barclays", "tmobile", "vodafone", "cloudflare", "aws", "azure",
-}
\ No newline at end of file
+}
+
+# Set of query parameters that only track campaigns & clicks -> Ignored by URL canonicalization.
+# Parameters starting with 'utm_' are always treated as tracking parameters.
+tracking_query_parameters_set = {
+    "utm_source", "utm_medium", "utm_campaign", "utm_term", "utm_content", "utm_id",
+    "gclid", "gclsrc", "dclid", "fbclid", "msclkid", "yclid", "twclid", "ttclid", "igshid",
+    "mc_cid", "mc_eid", "_hsenc", "_hsmi", "mkt_tok", "oly_anon_id", "oly_enc_id", "vero_id",
+    "wickedid", "_ga", "_gl", "s_cid", "ref_src",
+}
+
+# WHOIS server per top-level domain -> Used by the native WHOIS client, others are resolved via IANA.
+# Multi-label keys (fx. 'co.uk') take precedence over their top-level domain.
+whois_servers_dict = {
+    "com": "whois.verisign-grs.com", "net": "whois.verisign-grs.com",
+    "org": "whois.publicinterestregistry.org", "info": "whois.nic.info", "biz": "whois.nic.biz",
+    "io": "whois.nic.io", "co": "whois.nic.co", "me": "whois.nic.me", "tv": "whois.nic.tv",
+    "cc": "ccwhois.verisign-grs.com", "us": "whois.nic.us", "uk": "whois.nic.uk",
+    "de": "whois.denic.de", "fr": "whois.nic.fr", "nl": "whois.domain-registry.nl", "eu": "whois.eu",
+    "ru": "whois.tcinet.ru", "su": "whois.tcinet.ru", "xn--p1ai": "whois.tcinet.ru",
+    "jp": "whois.jprs.jp", "cn": "whois.cnnic.cn", "br": "whois.registro.br", "au": "whois.auda.org.au",
+    "ca": "whois.cira.ca", "it": "whois.nic.it", "se": "whois.iis.se", "nu": "whois.iis.nu",
+    "no": "whois.norid.no", "dk": "whois.punktum.dk", "fi": "whois.fi", "pl": "whois.dns.pl",
+    "ch": "whois.nic.ch", "li": "whois.nic.li", "at": "whois.nic.at", "be": "whois.dns.be",
+    "in": "whois.registry.in", "xyz": "whois.nic.xyz", "top": "whois.nic.top", "club": "whois.nic.club",
+    "online": "whois.nic.online", "site": "whois.nic.site", "shop": "whois.nic.shop",
+    "app": "whois.nic.google", "dev": "whois.nic.google", "pw": "whois.nic.pw", "la": "whois.nic.la",
+    "to": "whois.tonic.to", "sh": "whois.nic.sh", "vip": "whois.nic.vip", "live": "whois.nic.live",
+}
+
+# Query syntax of WHOIS servers that do not accept the bare domain.
+whois_query_formats_dict = {
+    "whois.verisign-grs.com": "domain {domain}",
+    "ccwhois.verisign-grs.com": "domain {domain}",
+    "whois.denic.de": "-T dn,ace {domain}",
+    "whois.jprs.jp": "{domain}/e",
+}
@@ -0,0 +1,422 @@
+# ----------------------------------------
+# IMPORTS
+# ----------------------------------------
+
+from dataclasses import dataclass
+from operator import itemgetter
+from typing import Any, Awaitable, Callable, Dict, FrozenSet, Iterable, List, Mapping, Optional, Sequence, Tuple, Union
+
+from src.backend.pipeline.helper_methods import (
+  calculate_shannon_entropy,
+  find_typosquatted_brand,
+  suspicious_keywords_matcher,
+  typosquatted_domains_index
+)
+from src.backend.pipeline.character_methods import (
+  build_character_histogram,
+  check_url_length,
+  retrieve_character_based_data,
+  special_characters_map
+)
+from src.backend.pipeline.whois_methods import get_whois_info, get_whois_info_async
+from src.backend.pipeline.parsing_methods import ParsedURL, final_url_parser, parse_url
+from src.backend.pipeline.feature_schema import FEATURE_CATALOGUE
+from src.backend.pipeline.metrics_methods import time_stage
+
+# ----------------------------------------
+# PIPELINE FEATURE REGISTRY CONSTANTS
+# ----------------------------------------
+
+# Cost classes from cheapest to most expensive -> String operations, matching indexes, network I/O.
+COST_CLASSES = ("cheap", "index", "network")
+
+# Values supplied by the caller of an execution plan rather than computed by it.
+PLAN_INPUTS = ("url", "whois_budget")
+
+# Resource holding the WHOIS dates -> The only network-bound stage of the Pipeline.
+WHOIS_RESOURCE = "whois_dates"
+
+# ----------------------------------------
+# PIPELINE FEATURE DECLARATIONS
+# ----------------------------------------
+
+# Intermediate result computed at most once per URL and shared by every feature depending on it.
+@dataclass(frozen=True)
+class PipelineResource:
+  """
+  Declaration of an intermediate Pipeline result (fx. the parsed URL or the WHOIS dates) -
+  Utility class in Trotline finalised Data Pipeline.
+
+  Attributes
+  ----------
+  name : str
+    Resource name - referenced by the dependencies of features & other resources.
+  dependencies : tuple[str, ...]
+    Plan inputs or resources passed positionally to 'compute'.
+  compute : Callable[..., Any]
+    Method computing the resource from its dependencies.
+  stage : str
+    Pipeline stage the computation is timed as.
+  compute_async : Callable[..., Awaitable[Any]] | None
+    Coroutine method computing the resource on the event loop - 'compute' runs inline if omitted.
+  """
+  name: str
+  dependencies: Tuple[str, ...]
+  compute: Callable[..., Any]
+  stage: str
+  compute_async: Optional[Callable[..., Awaitable[Any]]] = None
+
+  def __call__(self, values: Mapping[str, Any]) -> Any:
+    with time_stage(self.stage):
+      return self.compute(*(values[name] for name in self.dependencies))
+
+  async def call_async(self, values: Mapping[str, Any]) -> Any:
+    if self.compute_async is None:
+      return self(values)
+
+    with time_stage(self.stage):
+      return await self.compute_async(*(values[name] for name in self.dependencies))
+
+# Declaration of a single Pipeline feature & the intermediate results it is derived from.
+@dataclass(frozen=True)
+class FeatureDefinition:
+  """
+  Name, dependencies & cost class of one Pipeline feature - Utility class in Trotline finalised
+  Data Pipeline. The value is derived from the shared resources, never recomputed per feature.
+
+  Attributes
+  ----------
+  name : str
+    Feature name - matches the 'FeatureSpec' & Booster feature name.
+  dependencies : tuple[str, ...]
+    Plan inputs or resources passed positionally to 'compute'.
+  cost : str
+    Cost class of the feature - one of 'COST_CLASSES'.
+  compute : Callable[..., Any]
+    Method deriving the feature value from its dependencies.
+  """
+  name: str
+  dependencies: Tuple[str, ...]
+  cost: str
+  compute: Callable[..., Any]
+
+# Declare a feature read straight from the Dict-object output of a resource.
+def resource_feature(name: str, resource: str, cost: str) -> FeatureDefinition:
+  """
+  Declare a feature whose value is stored under its own name in a Dict-object resource - Utility
+  method in Trotline finalised Data Pipeline.
+
+  Parameters
+  ----------
+  name : str
+    Feature name.
+  resource : str
+    Name of the Dict-object resource.
+  cost : str
+    Cost class of the feature.
+
+  Returns
+  -------
+  FeatureDefinition
+    The feature declaration.
+  """
+  return FeatureDefinition(name, (resource,), cost, itemgetter(name))
+
+# Typosquatting lookup over the protected brands -> Shared by the typosquatting features.
+def match_typosquatted_brand(parsed_url: ParsedURL) -> Tuple[Optional[str], Optional[int]]:
+  """
+  Find the protected brand closest to the parsed URL domain within the typosquatting threshold
+  (2 edits) - Utility method in Trotline finalised Data Pipeline.
+
+  Parameters
+  ----------
+  parsed_url : ParsedURL
+    Shared parsed view of the URL.
+
+  Returns
+  -------
+  tuple[str | None, int | None]
+    The closest brand & its distance, or (None, None) if the domain is not typosquatted.
+  """
+  return find_typosquatted_brand(hostname=parsed_url, domains=typosquatted_domains_index, threshold=2)
+
+# Intermediate results of the Pipeline -> Order matches the stages of 'finalised_data_pipeline_for_web'.
+PIPELINE_RESOURCES = (
+  PipelineResource("parsed_url", ("url",), parse_url, "parse_url"),
+  PipelineResource("histogram", ("url",), build_character_histogram, "character_histogram"),
+  PipelineResource("url_data", ("url", "parsed_url"), final_url_parser, "final_url_parser"),
+  PipelineResource(WHOIS_RESOURCE, ("parsed_url", "whois_budget"), get_whois_info, "whois", get_whois_info_async),
+  PipelineResource("typosquat_match", ("parsed_url",), match_typosquatted_brand, "typosquatting"),
+  PipelineResource("character_data", ("url", "histogram"), retrieve_character_based_data, "character_features"),
+  PipelineResource("keyword_data", ("url",), suspicious_keywords_matcher.match_url, "remaining_features"),
+)
+
+# Every feature the Pipeline is able to produce -> Covers 'FEATURE_CATALOGUE'.
+FEATURE_DEFINITIONS = (
+  # Parsed URL data
+  resource_feature("length_hostname", "url_data", "cheap"),
+  resource_feature("length_path", "url_data", "cheap"),
+  resource_feature("length_query", "url_data", "cheap"),
+  resource_feature("is_https", "url_data", "cheap"),
+  resource_feature("nb_subdomains", "url_data", "cheap"),
+  resource_feature("contains_sus_domain_ext", "url_data", "cheap"),
+  # WHOIS & Typosquatting data
+  FeatureDefinition("is_typosquatted", ("typosquat_match",), "index", lambda match: match[0] is not None),
+  FeatureDefinition("typosquat_distance", ("typosquat_match",), "index", itemgetter(1)),
+  FeatureDefinition("whois_valid", (WHOIS_RESOURCE,), "network", lambda dates: bool(dates[0] and dates[1])),
+  FeatureDefinition("days_since_whois_reg", (WHOIS_RESOURCE,), "network", itemgetter(0)),
+  FeatureDefinition("days_until_whois_exp", (WHOIS_RESOURCE,), "network", itemgetter(1)),
+  # Character-based data
+  resource_feature("nb_www", "character_data", "cheap"),
+  resource_feature("url_length", "character_data", "cheap"),
+  resource_feature("special_chars_ratio", "character_data", "cheap"),
+  resource_feature("digits_ratio", "character_data", "cheap"),
+  *(resource_feature(name, "character_data", "cheap") for name in special_characters_map),
+  resource_feature("nb_digits", "character_data", "cheap"),
+  # Remaining data
+  FeatureDefinition(
+    "domain_entropy", ("url", "histogram"), "cheap",
+    lambda url, histogram: calculate_shannon_entropy(text=url, histogram=histogram)
+  ),
+  FeatureDefinition("contains_sus_keyword", ("keyword_data",), "index", lambda data: data["nb_sus_keywords"] > 0),
+  resource_feature("nb_sus_keywords", "keyword_data", "index"),
+  resource_feature("nb_distinct_sus_keywords", "keyword_data", "index"),
+  resource_feature("sus_keyword_in_host", "keyword_data", "index"),
+  resource_feature("sus_keyword_in_path", "keyword_data", "index"),
+  resource_feature("sus_keyword_in_query", "keyword_data", "index"),
+)
+
+# Registries by name -> Resolved by the execution plans.
+RESOURCE_REGISTRY: Dict[str, PipelineResource] = {resource.name: resource for resource in PIPELINE_RESOURCES}
+FEATURE_REGISTRY: Dict[str, FeatureDefinition] = {feature.name: feature for feature in FEATURE_DEFINITIONS}
+
+# Every catalogued feature must be computable -> Fails at import instead of on the first request.
+if set(FEATURE_REGISTRY) != set(FEATURE_CATALOGUE):
+  raise ValueError(
+    f"Feature registry does not match the catalogue - {sorted(set(FEATURE_REGISTRY) ^ set(FEATURE_CATALOGUE))}"
+  )
+
+# ----------------------------------------
+# PIPELINE EXECUTION PLAN
+# ----------------------------------------
+
+# Minimal, ordered set of Pipeline stages producing a given list of features.
+class FeaturePlan:
+  """
+  Execution plan computing only the named features and the resources they depend on - Utility
+  class in Trotline finalised Data Pipeline. Resources run at most once per URL, in dependency
+  order, so a model without WHOIS features never performs a WHOIS lookup.
+
+  Parameters
+  ----------
+  names : Sequence[str]
+    Features to be computed (fx. the Booster 'feature_names').
+
+  Exceptions
+  ----------
+  ValueError
+    Raised if a name is not produced by the Pipeline.
+  """
+
+  def __init__(self, names: Sequence[str]):
+    unknown_names = [name for name in names if name not in FEATURE_REGISTRY]
+    if unknown_names:
+      raise ValueError(f"Features not produced by the Pipeline - {unknown_names}")
+
+    self.features: Tuple[FeatureDefinition, ...] = tuple(FEATURE_REGISTRY[name] for name in dict.fromkeys(names))
+    self.resources: Tuple[PipelineResource, ...] = self._order_resources(
+      name for feature in self.features for name in feature.dependencies
+    )
+    self.resource_names: FrozenSet[str] = frozenset(resource.name for resource in self.resources)
+    self.cost: str = max(
+      (feature.cost for feature in self.features), key=COST_CLASSES.index, default=COST_CLASSES[0]
+    )
+
+    # Per-feature argument getters -> Single-dependency features receive the resource itself.
+    self._collectors = tuple(
+      (feature.name, feature.compute, itemgetter(*feature.dependencies), len(feature.dependencies) > 1)
+      for feature in self.features
+    )
+
+  def __repr__(self) -> str:
+    return f"FeaturePlan({len(self.features)} features, cost={self.cost!r})"
+
+  def requires(self, resource: str) -> bool:
+    """
+    Check whether the plan computes the specified resource.
+
+    Parameters
+    ----------
+    resource : str
+      Resource name (fx. 'WHOIS_RESOURCE').
+
+    Returns
+    -------
+    bool
+      Returns True if at least one planned feature depends on the resource.
+    """
+    return resource in self.resource_names
+
+  def prepare(self, url: str, whois_budget: Optional[float] = None) -> Dict[str, Any]:
+    """
+    Validate the URL-string and create the per-URL values holding the plan inputs.
+
+    Parameters
+    ----------
+    url : str
+      URL-string suspected of being malicious/scam.
+    whois_budget : float | None
+      Seconds to wait for an uncached WHOIS lookup - waits for completion if omitted.
+
+    Returns
+    -------
+    dict[str, Any]
+      Plan inputs - filled with the resources by 'resolve'.
+
+    Exceptions
+    ----------
+    ValueError
+      Raised if the URL-string exceeds 'MAX_URL_LENGTH' characters.
+    """
+    check_url_length(text=url)
+
+    return {"url": url, "whois_budget": whois_budget}
+
+  def resolve(self, values: Dict[str, Any], names: Optional[Iterable[str]] = None) -> Dict[str, Any]:
+    """
+    Compute the missing resources in dependency order and store them in the values.
+
+    Parameters
+    ----------
+    values : dict[str, Any]
+      Per-URL values created by 'prepare' - resources already present are not recomputed.
+    names : Iterable[str] | None
+      Resources to be computed (with their dependencies) - every planned resource if omitted.
+
+    Returns
+    -------
+    dict[str, Any]
+      The updated values.
+    """
+    resources = self.resources if names is None else self._order_resources(names)
+
+    for resource in resources:
+      if resource.name not in values:
+        values[resource.name] = resource(values)
+
+    return values
+
+  def collect(self, values: Mapping[str, Any]) -> Dict[str, Any]:
+    """
+    Derive the planned features from the resolved values.
+
+    Parameters
+    ----------
+    values : Mapping[str, Any]
+      Per-URL values holding every planned resource.
+
+    Returns
+    -------
+    dict[str, Any]
+      Feature values by name - None for missing values.
+    """
+    results: Dict[str, Any] = {}
+
+    for name, compute, arguments, unpack in self._collectors:
+      results[name] = compute(*arguments(values)) if unpack else compute(arguments(values))
+
+    return results
+
+  def run(self, url: str, whois_budget: Optional[float] = None, **resolved: Any) -> Dict[str, Any]:
+    """
+    Compute the planned features of a single URL-string.
+
+    Parameters
+    ----------
+    url : str
+      URL-string suspected of being malicious/scam.
+    whois_budget : float | None
+      Seconds to wait for an uncached WHOIS lookup - waits for completion if omitted.
+    **resolved : Any
+      Resources computed beforehand (fx. 'parsed_url') - reused instead of recomputed.
+
+    Returns
+    -------
+    dict[str, Any]
+      Feature values by name - None for missing values.
+    """
+    values = self.prepare(url, whois_budget=whois_budget)
+    values.update(resolved)
+
+    return self.collect(self.resolve(values))
+
+  def stats(self) -> Dict[str, Union[int, str, List[str], Dict[str, int]]]:
+    """
+    Report the planned features, their cost classes & the resources they require.
+
+    Returns
+    -------
+    dict[str, Union[int, str, list, dict]]
+      Feature counts per cost class, overall cost class & resources in execution order.
+    """
+    return {
+      "features": len(self.features),
+      "cost": self.cost,
+      "costs": {cost: sum(feature.cost == cost for feature in self.features) for cost in COST_CLASSES},
+      "resources": [resource.name for resource in self.resources],
+      "skipped_resources": [name for name in RESOURCE_REGISTRY if name not in self.resource_names],
+    }
+
+  def _order_resources(self, names: Iterable[str]) -> Tuple[PipelineResource, ...]:
+    # Depth-first walk over the dependencies -> Every resource follows the resources it needs.
+    ordered: Dict[str, PipelineResource] = {}
+
+    def visit(name: str) -> None:
+      if name in PLAN_INPUTS or name in ordered:
+        return
+      resource = RESOURCE_REGISTRY[name]
+      for dependency in resource.dependencies:
+        visit(dependency)
+      ordered[name] = resource
+
+    for name in names:
+      visit(name)
+
+    return tuple(ordered.values())
+
+# ----------------------------------------
+# PIPELINE EXECUTION PLAN CACHE
+# ----------------------------------------
+
+# Execution plans by feature names -> Built once per model input layout & process.
+_feature_plans: Dict[Tuple[str, ...], FeaturePlan] = {}
+
+# Retrieve (or build) the execution plan for the specified features.
+def get_feature_plan(names: Sequence[str]) -> FeaturePlan:
+  """
+  Retrieve the execution plan computing the named features, building it on first use - Utility
+  method in Trotline finalised Data Pipeline. Called on application startup with the Booster
+  'feature_names', and by the Pipeline with the names of its feature schema.
+
+  Parameters
+  ----------
+  names : Sequence[str]
+    Features to be computed.
+
+  Returns
+  -------
+  FeaturePlan
+    The shared execution plan.
+
+  Exceptions
+  ----------
+  ValueError
+    Raised if a name is not produced by the Pipeline.
+  """
+  names = tuple(names)
+  plan = _feature_plans.get(names)
+
+  if plan is None:
+    plan = _feature_plans[names] = FeaturePlan(names)
+
+  return plan
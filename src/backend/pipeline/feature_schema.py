@@ -0,0 +1,269 @@
+# ----------------------------------------
+# IMPORTS
+# ----------------------------------------
+
+import numpy as np
+import xgboost as xgb
+
+from dataclasses import dataclass
+from typing import Any, Dict, Mapping, Optional, Sequence, Tuple
+
+# ----------------------------------------
+# PIPELINE FEATURE SPECIFICATIONS
+# ----------------------------------------
+
+# Declaration of a single numerical feature produced by the Pipeline.
+@dataclass(frozen=True)
+class FeatureSpec:
+  """
+  Name, semantic type and missing-value encoding of one Pipeline feature - Utility class in
+  Trotline finalised Data Pipeline. Every feature is stored as float32 in the model input.
+
+  Attributes
+  ----------
+  name : str
+    Feature name - matches the Booster feature name.
+  dtype : str
+    Semantic type of the value - 'int', 'bool' (encoded as 0/1) or 'float'.
+  missing : float
+    Encoding of missing (None) values - NaN, handled natively by XGBoost.
+  """
+  name: str
+  dtype: str
+  missing: float = float("nan")
+
+# Default model input features -> Order matches the merge order of the single-URL Pipeline.
+DEFAULT_FEATURE_SPECS = (
+  # Parsed URL data
+  FeatureSpec("length_hostname", "int"),
+  FeatureSpec("length_path", "int"),
+  FeatureSpec("length_query", "int"),
+  FeatureSpec("is_https", "bool"),
+  FeatureSpec("nb_subdomains", "int"),
+  FeatureSpec("contains_sus_domain_ext", "bool"),
+  # WHOIS & Typosquatting data
+  FeatureSpec("is_typosquatted", "bool"),
+  FeatureSpec("whois_valid", "bool"),
+  FeatureSpec("days_since_whois_reg", "int"),
+  FeatureSpec("days_until_whois_exp", "int"),
+  # Character-based data
+  FeatureSpec("nb_www", "int"),
+  FeatureSpec("url_length", "int"),
+  FeatureSpec("special_chars_ratio", "float"),
+  FeatureSpec("digits_ratio", "float"),
+  FeatureSpec("nb_dots", "int"),
+  FeatureSpec("nb_hyphens", "int"),
+  FeatureSpec("nb_at", "int"),
+  FeatureSpec("nb_qm", "int"),
+  FeatureSpec("nb_and", "int"),
+  FeatureSpec("nb_or", "int"),
+  FeatureSpec("nb_eq", "int"),
+  FeatureSpec("nb_underscore", "int"),
+  FeatureSpec("nb_tilde", "int"),
+  FeatureSpec("nb_percent", "int"),
+  FeatureSpec("nb_slash", "int"),
+  FeatureSpec("nb_star", "int"),
+  FeatureSpec("nb_colon", "int"),
+  FeatureSpec("nb_comma", "int"),
+  FeatureSpec("nb_apostrophe", "int"),
+  FeatureSpec("nb_pound", "int"),
+  FeatureSpec("nb_semicolumn", "int"),
+  FeatureSpec("nb_dollar", "int"),
+  FeatureSpec("nb_space", "int"),
+  FeatureSpec("nb_digits", "int"),
+  # Remaining data
+  FeatureSpec("domain_entropy", "float"),
+  FeatureSpec("contains_sus_keyword", "bool"),
+)
+
+# Additional features computed by the Pipeline but not part of the default model input.
+EXTENDED_FEATURE_SPECS = (
+  # WHOIS & Typosquatting data
+  FeatureSpec("typosquat_distance", "int"),
+  # Remaining data
+  FeatureSpec("nb_sus_keywords", "int"),
+  FeatureSpec("nb_distinct_sus_keywords", "int"),
+  FeatureSpec("sus_keyword_in_host", "bool"),
+  FeatureSpec("sus_keyword_in_path", "bool"),
+  FeatureSpec("sus_keyword_in_query", "bool"),
+)
+
+# Every feature the Pipeline is able to produce, by name.
+FEATURE_CATALOGUE: Dict[str, FeatureSpec] = {
+  spec.name: spec for spec in DEFAULT_FEATURE_SPECS + EXTENDED_FEATURE_SPECS
+}
+
+# ----------------------------------------
+# PIPELINE FEATURE SCHEMA
+# ----------------------------------------
+
+# Fixed, ordered model input layout -> Fills float32 rows directly from Pipeline Dict-objects.
+class FeatureSchema:
+  """
+  Explicit model input schema listing feature names, order, types and missing-value encoding -
+  Utility class in Trotline finalised Data Pipeline. Pipeline outputs are written straight into
+  preallocated float32 rows in schema order.
+
+  Parameters
+  ----------
+  specs : Sequence[FeatureSpec]
+    Features in model input order.
+  """
+
+  dtype = np.float32
+
+  def __init__(self, specs: Sequence[FeatureSpec]):
+    self.specs: Tuple[FeatureSpec, ...] = tuple(specs)
+    self.names: Tuple[str, ...] = tuple(spec.name for spec in self.specs)
+    self.index: Dict[str, int] = {name: position for position, name in enumerate(self.names)}
+    self._missing = np.array([spec.missing for spec in self.specs], dtype=self.dtype)
+
+  def __len__(self) -> int:
+    return len(self.specs)
+
+  def __repr__(self) -> str:
+    return f"FeatureSchema({len(self)} features)"
+
+  @classmethod
+  def default(cls) -> "FeatureSchema":
+    """
+    Schema of the default model input features.
+
+    Returns
+    -------
+    FeatureSchema
+      Schema over 'DEFAULT_FEATURE_SPECS'.
+    """
+    return cls(DEFAULT_FEATURE_SPECS)
+
+  @classmethod
+  def from_names(cls, names: Sequence[str]) -> "FeatureSchema":
+    """
+    Schema over the named features, in the given order.
+
+    Parameters
+    ----------
+    names : Sequence[str]
+      Feature names in model input order.
+
+    Returns
+    -------
+    FeatureSchema
+      Schema over the named features.
+
+    Exceptions
+    ----------
+    ValueError
+      Raised if a name is not produced by the Pipeline.
+    """
+    unknown_names = [name for name in names if name not in FEATURE_CATALOGUE]
+    if unknown_names:
+      raise ValueError(f"Features not produced by the Pipeline - {unknown_names}")
+
+    return cls([FEATURE_CATALOGUE[name] for name in names])
+
+  @classmethod
+  def for_booster(cls, booster: xgb.Booster) -> "FeatureSchema":
+    """
+    Schema matching the input of the loaded Booster - Called on application startup.
+    Boosters saved with feature names select (and order) the features by name; Boosters without
+    names are checked against the default schema by feature count.
+
+    Parameters
+    ----------
+    booster : xgboost.Booster
+      Loaded XGBoost inference model.
+
+    Returns
+    -------
+    FeatureSchema
+      Schema matching the Booster input.
+
+    Exceptions
+    ----------
+    ValueError
+      Raised if the Booster expects features the Pipeline cannot produce.
+    """
+    if booster.feature_names:
+      schema = cls.from_names(booster.feature_names)
+    else:
+      schema = cls.default()
+
+    schema.validate_booster(booster)
+
+    return schema
+
+  def validate_booster(self, booster: xgb.Booster) -> None:
+    """
+    Check the schema against the Booster feature names & count.
+
+    Parameters
+    ----------
+    booster : xgboost.Booster
+      Loaded XGBoost inference model.
+
+    Exceptions
+    ----------
+    ValueError
+      Raised if the feature names, their order or the feature count differ.
+    """
+    if booster.feature_names and tuple(booster.feature_names) != self.names:
+      raise ValueError(
+        f"Feature schema does not match the model - expected {list(booster.feature_names)}, got {list(self.names)}"
+      )
+    if booster.num_features() != len(self):
+      raise ValueError(
+        f"Feature schema does not match the model - expected {booster.num_features()} features, got {len(self)}"
+      )
+
+  def new_row(self) -> np.ndarray:
+    """
+    Allocate a single float32 row filled with the missing-value encoding.
+
+    Returns
+    -------
+    numpy.ndarray
+      Row of shape (n_features,).
+    """
+    return self._missing.copy()
+
+  def new_matrix(self, rows: int) -> np.ndarray:
+    """
+    Allocate a float32 matrix filled with the missing-value encoding.
+
+    Parameters
+    ----------
+    rows : int
+      Number of rows (URLs).
+
+    Returns
+    -------
+    numpy.ndarray
+      Matrix of shape (rows, n_features).
+    """
+    return np.tile(self._missing, (rows, 1))
+
+  def fill_row(self, features: Mapping[str, Any], out: Optional[np.ndarray] = None) -> np.ndarray:
+    """
+    Write the Pipeline feature values into a float32 row in schema order.
+
+    Parameters
+    ----------
+    features : Mapping[str, Any]
+      Pipeline output - extra keys are ignored, absent or None values are encoded as missing.
+    out : numpy.ndarray | None
+      Preallocated row (fx. a row of a batch matrix) - a new row is allocated if omitted.
+
+    Returns
+    -------
+    numpy.ndarray
+      The filled row.
+    """
+    if out is None:
+      out = self.new_row()
+
+    for position, spec in enumerate(self.specs):
+      value = features.get(spec.name)
+      out[position] = spec.missing if value is None else value
+
+    return out
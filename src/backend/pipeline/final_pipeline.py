@@ -2,64 +2,214 @@
 # IMPORTS
 # ----------------------------------------
 
+import numpy as np
 import pandas as pd
+import asyncio
+import os
 
-from typing import Dict, Any
+from typing import Dict, Any, Optional, Sequence, Tuple, Union
 
 from src.backend.pipeline.helper_methods import retrieve_remaining_data
-from src.backend.pipeline.character_methods import retrieve_character_based_data
-from src.backend.pipeline.whois_methods import retrieve_extracted_url_data
-from src.backend.pipeline.parsing_methods import final_url_parser
+from src.backend.pipeline.character_methods import (
+  MAX_URL_LENGTH,
+  build_character_histogram,
+  retrieve_character_based_data,
+  retrieve_character_based_data_batch
+)
+from src.backend.pipeline.whois_methods import (
+  get_whois_budget_settings,
+  is_whois_complete,
+  retrieve_extracted_url_data,
+  shutdown_whois_lookups
+)
+from src.backend.pipeline.feature_registry import (
+  FEATURE_REGISTRY,
+  RESOURCE_REGISTRY,
+  WHOIS_RESOURCE,
+  get_feature_plan
+)
+from src.backend.pipeline.parsing_methods import final_url_parser, final_url_parser_batch, parse_url
+from src.backend.pipeline.feature_schema import (
+  DEFAULT_FEATURE_SPECS,
+  EXTENDED_FEATURE_SPECS,
+  FeatureSchema
+)
+from src.backend.pipeline.metrics_methods import PIPELINE_IN_FLIGHT, time_stage, track_in_flight
+
+# ----------------------------------------
+# FINAL PIPELINE CONSTANTS
+# ----------------------------------------
+
+# Fixed column order of the numerical features produced by the Pipeline.
+# Derived from the feature schema declarations -> Single source of truth for names & order.
+FEATURE_COLUMNS = tuple(spec.name for spec in DEFAULT_FEATURE_SPECS)
+
+# Additional numerical features computed by the Pipeline but not part of the default model input.
+# Returned by 'finalised_data_pipeline_for_py' for retraining -> Opt-in for batch extraction.
+EXTENDED_FEATURE_COLUMNS = tuple(spec.name for spec in EXTENDED_FEATURE_SPECS)
+
+# Schema used when no model-specific schema is provided.
+DEFAULT_FEATURE_SCHEMA = FeatureSchema.default()
+
+# ----------------------------------------
+# ASYNC PIPELINE CONFIGURATION
+# ----------------------------------------
+
+# Per-worker concurrency limit -> Built lazily so environment variables are read after startup.
+_pipeline_semaphore: Optional[asyncio.Semaphore] = None
+
+# Retrieve (or build) the semaphore bounding concurrent async Pipeline runs.
+def get_pipeline_semaphore() -> asyncio.Semaphore:
+  """
+  Retrieve the process-wide Pipeline semaphore, building it on first use - Utility method in
+  Trotline finalised Data Pipeline. Sized by the 'PIPELINE_CONCURRENCY_LIMIT' environment
+  variable (default 64 concurrent URLs).
+
+  Returns
+  -------
+  asyncio.Semaphore
+    Semaphore limiting the number of URLs processed concurrently.
+  """
+  global _pipeline_semaphore
+
+  if _pipeline_semaphore is None:
+    _pipeline_semaphore = asyncio.Semaphore(int(os.getenv("PIPELINE_CONCURRENCY_LIMIT", "64")))
+
+  return _pipeline_semaphore
+
+# Release the WHOIS lookup threads -> Called on application shutdown.
+def shutdown_pipeline_executors() -> None:
+  """
+  Shut down the WHOIS lookup executor & client without waiting for lookups still in flight -
+  Utility method in Trotline finalised Data Pipeline.
+  """
+  shutdown_whois_lookups()
 
 # ----------------------------------------
 # FINAL PIPELINE METHODS
 # ----------------------------------------
 
 # Pipeline method for Website Application
-def finalised_data_pipeline_for_web(url: str) -> pd.Series:
+def finalised_data_pipeline_for_web(
+    url: str,
+    schema: FeatureSchema = DEFAULT_FEATURE_SCHEMA,
+    out: Optional[np.ndarray] = None,
+    return_whois_complete: bool = False
+  ) -> Union[np.ndarray, Tuple[np.ndarray, bool]]:
   """
   Combined Pipeline method for parsing, extracting and transforming necessary URL-based
   information and preparing it for final XGBoost modeling. This method wraps all general
   Pipelines operations into a single endpoint/instance to ensure consistency across
-  functionalities.
+  functionalities. Only the stages required by the schema features are run (see 'FeaturePlan').
   Used for API-based information extraction.
 
   Parameters
   ----------
   url : str
     URL-string suspected of being malicious/scam.
+  schema : FeatureSchema
+    Model input schema defining feature order & missing-value encoding.
+  out : numpy.ndarray | None
+    Preallocated float32 row (fx. a row of a batch matrix) - allocated if omitted.
+  return_whois_complete : bool
+    Whether to also report if the WHOIS lookup completed - False if the WHOIS features are
+    missing because the lookup timed out or failed.
 
   Returns
   -------
-  pandas.Series
-    Returns a finalized pandas Series-object containing numerical data for XGBoost modeling. 
+  numpy.ndarray | tuple[numpy.ndarray, bool]
+    Returns a float32 row in schema order containing numerical data for XGBoost modeling - and
+    whether the WHOIS lookup completed if 'return_whois_complete' is set.
   """
   # Validation check for URL-parameter
   if not isinstance(url, str):
     raise ValueError(f"URL must be of Type: str - Current type {type(url)}")
 
-  # Retrieve the URL-related data -> Convert to Dict-objects.
-  parsed_url_data = final_url_parser(url=url)
-  extracted_url_data = retrieve_extracted_url_data(url=url)
-  character_based_data = retrieve_character_based_data(url=url)
-  remaining_data = retrieve_remaining_data(url=url)
+  # Run the stages required by the schema features -> Shared intermediate results are computed once.
+  plan = get_feature_plan(schema.names)
+  values = plan.resolve(plan.prepare(url))
+  results = plan.collect(values)
 
-  # Concat Dict-objects into single instance.
-  results = parsed_url_data | extracted_url_data | character_based_data | remaining_data
+  # Write the model input features into the float32 row -> Booleans become binary.
+  with time_stage("fill_row"):
+    row = schema.fill_row(results, out=out)
 
-  # 'Url' key-value pair is no longer needed -> Delete the pair.
-  try:
-    del results["url"]
-  except KeyError as kerr:
-    raise kerr
+  # Schemas without WHOIS features never perform a lookup -> Always complete.
+  if return_whois_complete:
+    return row, is_whois_complete(values.get(WHOIS_RESOURCE))
 
-  # Convert Booleans to binary.
-  for key, value in results.items():
-    if isinstance(value, bool):
-      results[key] = int(value)
+  return row
+
+
+# Async Pipeline method for Website Application -> Never blocks the event loop.
+async def finalised_data_pipeline_for_web_async(
+    url: str,
+    schema: FeatureSchema = DEFAULT_FEATURE_SCHEMA,
+    out: Optional[np.ndarray] = None,
+    return_whois_complete: bool = False
+  ) -> Union[np.ndarray, Tuple[np.ndarray, bool]]:
+  """
+  Async counterpart of 'finalised_data_pipeline_for_web'. The WHOIS lookup is awaited on the
+  event loop while the CPU-light stages run inline, and the number of URLs in flight is bounded
+  by the Pipeline semaphore. Uncached WHOIS lookups are bounded by the WHOIS
+  latency budget - past it the WHOIS features are missing and the lookup completes in the background.
+  Schemas without WHOIS features never start a lookup.
+  Used for API-based information extraction.
+
+  Parameters
+  ----------
+  url : str
+    URL-string suspected of being malicious/scam.
+  schema : FeatureSchema
+    Model input schema defining feature order & missing-value encoding.
+  out : numpy.ndarray | None
+    Preallocated float32 row (fx. a row of a batch matrix) - allocated if omitted.
+  return_whois_complete : bool
+    Whether to also report if the WHOIS lookup completed - False if the WHOIS features are
+    missing because the latency budget ran out or the lookup failed.
+
+  Returns
+  -------
+  numpy.ndarray | tuple[numpy.ndarray, bool]
+    Returns a float32 row in schema order containing numerical data for XGBoost modeling - and
+    whether the WHOIS lookup completed if 'return_whois_complete' is set.
+  """
+  # Validation check for URL-parameter
+  if not isinstance(url, str):
+    raise ValueError(f"URL must be of Type: str - Current type {type(url)}")
 
-  # Convert to pd.Series-object and return the final data.
-  return pd.Series(results)
+  plan = get_feature_plan(schema.names)
+  values = plan.prepare(url, whois_budget=get_whois_budget_settings()[0])
+
+  async with get_pipeline_semaphore():
+    with track_in_flight(PIPELINE_IN_FLIGHT):
+      # Start the WHOIS stage first -> The remaining stages run while the lookup is in flight.
+      whois_future = None
+      if plan.requires(WHOIS_RESOURCE):
+        whois_resource = RESOURCE_REGISTRY[WHOIS_RESOURCE]
+        plan.resolve(values, whois_resource.dependencies)
+        whois_future = asyncio.ensure_future(whois_resource.call_async(dict(values)))
+
+      # Retrieve the remaining resources inline -> Shared intermediate results are computed once.
+      plan.resolve(values, (resource.name for resource in plan.resources if resource.name != WHOIS_RESOURCE))
+
+      # Time left waiting on the WHOIS lookup after the inline stages finished.
+      if whois_future is not None:
+        with time_stage("whois_wait"):
+          values[WHOIS_RESOURCE] = await whois_future
+
+  # Derive the schema features from the shared resources.
+  results = plan.collect(values)
+
+  # Write the model input features into the float32 row -> Booleans become binary.
+  with time_stage("fill_row"):
+    row = schema.fill_row(results, out=out)
+
+  # Schemas without WHOIS features never wait on a lookup -> Always complete.
+  if return_whois_complete:
+    return row, is_whois_complete(values.get(WHOIS_RESOURCE))
+
+  return row
 
 
 # Pipeline method for PyPi.org Package.
@@ -85,11 +235,15 @@ def finalised_data_pipeline_for_py(url: str) -> Dict[str, Any]:
   if not isinstance(url, str):
     raise ValueError(f"URL must be of Type: str - Current type {type(url)}")
 
+  # Parse & scan the URL-string once -> Shared by every Pipeline stage.
+  parsed_url = parse_url(url=url)
+  histogram = build_character_histogram(text=url)
+
   # Retrieve the URL-related data -> Convert to Dict-objects.
-  parsed_url_data = final_url_parser(url=url)
-  extracted_url_data = retrieve_extracted_url_data(url=url)
-  character_based_data = retrieve_character_based_data(url=url)
-  remaining_data = retrieve_remaining_data(url=url)
+  parsed_url_data = final_url_parser(url=url, parsed_url=parsed_url)
+  extracted_url_data = retrieve_extracted_url_data(url=url, parsed_url=parsed_url)
+  character_based_data = retrieve_character_based_data(url=url, histogram=histogram)
+  remaining_data = retrieve_remaining_data(url=url, histogram=histogram)
 
   # Concat Dict-objects into single instance.
   results = parsed_url_data | extracted_url_data | character_based_data | remaining_data
@@ -100,4 +254,70 @@ def finalised_data_pipeline_for_py(url: str) -> Dict[str, Any]:
       results[key] = int(value)
 
   # Return a Python-Dict object.
-  return results
\ No newline at end of file
+  return results
+
+
+# Pipeline method for batches of URLs (Offline re-scoring & bulk API requests).
+def finalised_data_pipeline_for_batch(
+    urls: Union[Sequence[str], pd.Series],
+    columns: Sequence[str] = FEATURE_COLUMNS
+  ) -> pd.DataFrame:
+  """
+  Combined Pipeline method for parsing, extracting and transforming necessary URL-based
+  information for an entire collection of URLs at once. Length, count and ratio features are
+  computed as vectorized column operations instead of per-URL Dict-objects. Per-URL stages (fx.
+  WHOIS) only run when one of the requested columns depends on them.
+  Used for offline re-scoring and bulk information extraction.
+
+  Parameters
+  ----------
+  urls : Sequence[str] | pandas.Series
+    Collection of URL-strings suspected of being malicious/scam.
+  columns : Sequence[str]
+    Feature columns (and their order) to be returned - defaults to 'FEATURE_COLUMNS'.
+
+  Returns
+  -------
+  pandas.DataFrame
+    Returns a feature matrix with one row per URL (input order) and the requested columns.
+    Booleans are encoded as binary and missing values as NaN. URLs longer than
+    'MAX_URL_LENGTH' produce a row of NaN values.
+  """
+  # Normalise input into a positional Series-object.
+  urls = pd.Series(list(urls), dtype=object)
+
+  # Validation check for URL-parameters
+  invalid_urls = urls.map(lambda url: not isinstance(url, str))
+  if invalid_urls.any():
+    invalid_type = type(urls[invalid_urls].iloc[0])
+    raise ValueError(f"URL must be of Type: str - Current type {invalid_type}")
+
+  # URLs beyond the supported length produce a row of missing values.
+  oversized_urls = urls.str.len() > MAX_URL_LENGTH
+  urls = urls.mask(oversized_urls, "")
+
+  # Parse every URL once -> Shared by the parsing & WHOIS stages.
+  parsed_urls = [parse_url(url=url) for url in urls]
+
+  # Retrieve the URL-related data -> Vectorized where the features allow it.
+  parsed_url_data = final_url_parser_batch(urls=urls, parsed_urls=parsed_urls)
+  character_based_data = retrieve_character_based_data_batch(urls=urls)
+
+  # WHOIS, typosquatting, entropy & keyword data remain per-URL operations -> Requested columns only.
+  vectorized_columns = set(parsed_url_data.columns) | set(character_based_data.columns)
+  per_url_plan = get_feature_plan(
+    [column for column in columns if column in FEATURE_REGISTRY and column not in vectorized_columns]
+  )
+  per_url_data = pd.DataFrame(
+    [per_url_plan.run(url, parsed_url=parsed_url) for url, parsed_url in zip(urls, parsed_urls)],
+    index=urls.index
+  )
+
+  # Concat DataFrame-objects into single instance in fixed column order.
+  results = pd.concat([parsed_url_data, per_url_data, character_based_data], axis=1)
+
+  # Convert Booleans to binary & missing values to NaN.
+  results = results.reindex(columns=list(columns)).astype("float64")
+  results.loc[oversized_urls] = float("nan")
+
+  return results
@@ -2,14 +2,39 @@
 # IMPORTS
 # ----------------------------------------
 
-import tldextract as tld
-import math
+import numpy as np
 
-from typing import Optional, Union, Dict
+from typing import TYPE_CHECKING, Optional, Union, Dict, Tuple
 from tldextract import ExtractResult
-from pyxdameraulevenshtein import damerau_levenshtein_distance as pdl_distance
 
-from src.backend.pipeline.dataset import suspicious_keywords_set
+from src.backend.pipeline.suffix_methods import get_tld_extractor
+from src.backend.pipeline.character_methods import CharacterHistogram, build_character_histogram
+from src.backend.pipeline.matching_methods import (
+  KeywordMatcher,
+  SuffixMatcher,
+  TyposquatIndex,
+  hostname_from_netloc
+)
+if TYPE_CHECKING:
+  from src.backend.pipeline.parsing_methods import ParsedURL
+from src.backend.pipeline.dataset import (
+  suspicious_domain_extensions_set,
+  suspicious_keywords_set,
+  typosquatted_domains_set
+)
+
+# ----------------------------------------
+# PIPELINE MATCHING INDEXES
+# ----------------------------------------
+
+# Deletion index over the protected brand domains -> Built once at import.
+typosquatted_domains_index = TyposquatIndex(domains=typosquatted_domains_set, max_distance=2)
+
+# Single-pass matcher over the suspicious keywords -> Compiled once at import.
+suspicious_keywords_matcher = KeywordMatcher(keywords=suspicious_keywords_set)
+
+# Label-wise suffix lookup over the suspicious domain extensions -> Built once at import.
+suspicious_extensions_matcher = SuffixMatcher(extensions=suspicious_domain_extensions_set)
 
 # ----------------------------------------
 # PIPELINE HELPER METHODS
@@ -39,7 +64,8 @@ def num_of_subdomains(hostname: str) -> int:
 def extract_hostname(url: str) -> ExtractResult:
   """
   Method for extracting domain-related information - fx. hostname, extensions, path etc. - from 
-  specified URL-string - Utility method in Trotline finalised Data Pipeline.
+  specified URL-string using the bundled, offline Public Suffix List - Utility method in Trotline
+  finalised Data Pipeline.
 
   Parameters
   ----------
@@ -51,11 +77,43 @@ def extract_hostname(url: str) -> ExtractResult:
   tldextract.ExtractResult
     Custom data-class for storing the extracted URL information.
   """
-  return tld.extract(url)
+  return get_tld_extractor()(url)
+
+# Find the protected brand the specified domain is Typosquatting using Damerau-Levenshtein Distance.
+# If the domain is off by 1 - 2 character changes -> Return the brand & distance.
+def find_typosquatted_brand(
+    hostname: Union[ExtractResult, "ParsedURL"],
+    domains: TyposquatIndex,
+    threshold: int
+  ) -> Tuple[Optional[str], Optional[int]]:
+  """
+  Utilise Damerau-Levenshtein Distance, a measurement of edit distance between 2 string sequences,
+  to find the protected brand closest to the specified domain - Utility method in Trotline
+  finalised Data Pipeline. Only brands sharing a deletion variant with the domain are compared.
+  
+  Parameters
+  ----------
+  hostname : tldextract.ExtractResult | ParsedURL
+    URL host to be checked for typosquatting.
+  domains : TyposquatIndex
+    Precomputed index over all relevant hostname-strings to check against.
+  threshold : int
+    The measured Damerau-Levenshtein Distance at which the hostname is considered typosquatted.
+
+  Returns
+  -------
+  tuple[str | None, int | None]
+    The closest brand & its distance, or (None, None) if the hostname is not typosquatted.
+  """
+  return domains.closest_match(text=hostname.domain, threshold=threshold)
 
 # Check if the specified domain is Typosquatted using Damerau-Levenshtein Distance
 # If the domain if off by 1 - 2 character changes -> Return True.
-def is_domain_typosquatted(hostname: ExtractResult, domains: list[str], threshold: int) -> bool:
+def is_domain_typosquatted(
+    hostname: Union[ExtractResult, "ParsedURL"],
+    domains: TyposquatIndex,
+    threshold: int
+  ) -> bool:
   """
   Utilise Damerau-Levenshtein Distance, a measurement of edit distance between 2 string sequences,
   to check if the specified domain is considered Typosquatted - Utility method in Trotline
@@ -63,10 +121,10 @@ def is_domain_typosquatted(hostname: ExtractResult, domains: list[str], threshol
   
   Parameters
   ----------
-  hostname : tldextract.ExtractResult
+  hostname : tldextract.ExtractResult | ParsedURL
     URL host to be checked for typosquatting.
-  domains : list[str]
-    List of all relevant hostname-strings to check against.
+  domains : TyposquatIndex
+    Precomputed index over all relevant hostname-strings to check against.
   threshold : int
     The measured Damerau-Levenshtein Distance at which the hostname is considered typosquatted.
 
@@ -75,43 +133,35 @@ def is_domain_typosquatted(hostname: ExtractResult, domains: list[str], threshol
   bool
     Whether the hostname is condered typosquatted.
   """
-  host_domain = hostname.domain
-  for domain in domains:
-    distance = pdl_distance(host_domain, domain)   # Calculate the DL-distance.
-    if distance != 0 and distance <= threshold:   # Check if distance if below threshold & not 0.
-      return True
+  brand, _ = find_typosquatted_brand(hostname=hostname, domains=domains, threshold=threshold)
 
-  return False
+  return brand is not None
 
 # Check if the specified domain ends with an exention
 # that is commonly utilized in Typosquatting attacks
-def contains_suspicious_domain_extension(domain: str, extensions: list[str]) -> bool:
+def contains_suspicious_domain_extension(domain: str, extensions: SuffixMatcher) -> bool:
   """
   Check if the specified URL-string contains any suspicious domain extensions that is commonly
   associated with Phishing attacks or general cyber scams - Utility method in Trotline
-  finalised Data Pipeline.
+  finalised Data Pipeline. User credentials and ports are ignored.
   
   Parameters
   ----------
   domain : str
-    String representation of the domain to be checked.
-  extensions : list[str]
-    List of distinct URL extensions (.ru, .xyz) to check the domain param against.
+    String representation of the domain (URL netloc) to be checked.
+  extensions : SuffixMatcher
+    Precomputed lookup over distinct URL extensions (.ru, .xyz) to check the domain param against.
 
   Returns
   -------
   bool
     Returns True if the domain ends with one of the extensions provided in the list.
   """
-  for extension in extensions:
-    if domain.endswith(extension):
-      return True
-
-  return False
+  return extensions.matches(hostname_from_netloc(domain))
 
 # Check if the specified domain includes one or more suspicious keywords
 # commonly associated with Phishing attacks.
-def contains_suspicious_keyword(text: str, keywords: list[str]) -> bool:
+def contains_suspicious_keyword(text: str, keywords: KeywordMatcher) -> bool:
   """
   Check if the specified URL-string contains any instances of suspicious keywords that are commonly
   associated with Phishing attacks or general cyber scams - Utility method in Trotline
@@ -121,65 +171,79 @@ def contains_suspicious_keyword(text: str, keywords: list[str]) -> bool:
   ----------
   text : str
     String representation of the URL to be checked. 
-  keywords : list[str]
-    List of specified keywords to check the Text param against.
+  keywords : KeywordMatcher
+    Precompiled matcher over the specified keywords to check the Text param against.
 
   Returns
   -------
   bool
     Returns True if the URL contains at least one keywords from the specified list.
   """
-  for keyword in keywords:
-    if keyword in text:
-      return True
-  return False
+  return keywords.contains(text)
 
 # Calculate the Shannon Entropy (Degree of Unpredictability) for the specified domain.
-def calculate_shannon_entropy(text: str) -> float:
+def calculate_shannon_entropy(text: str, histogram: Optional[CharacterHistogram] = None) -> float:
   """
   Calculate Shannon Entropy, the average uncertainty and/or unpredictability in a source string,
   for the specified text string - Utility method in Trotline finalised Data Pipeline.
+  Derived from the character histogram in linear time.
    
   Parameters
   ----------
   text : str
     String to calculate the information entropy on.
+  histogram : CharacterHistogram | None
+    Precomputed histogram of the text - built from the text if omitted.
 
   Returns
   -------
   float
     Returns floating-point representation of the text param's total entropy.
   """
+  if histogram is None:
+    histogram = build_character_histogram(text=text)
+  if histogram.length == 0:
+    return 0.0
 
-  probabilities = [float(text.count(char)) / len(text) for char in list(text)]
-  entropy = -sum([p * math.log2(p) for p in probabilities])
+  # Every position contributes -p * log2(p) of its character -> Weighted by character counts.
+  # Matches the per-position sum the deployed model was trained on.
+  counts = histogram.distinct_counts
+  probabilities = counts / histogram.length
+  entropy = -float(np.sum(counts * probabilities * np.log2(probabilities)))
 
   return entropy
 
 # Finalised Wrapper-method for determining Shannon Entropy + Suspicious Keywords.
 # Returns a Python Dict-object.
-def retrieve_remaining_data(url: str) -> Dict[str, Union[float, int]]:
+def retrieve_remaining_data(
+    url: str,
+    histogram: Optional[CharacterHistogram] = None
+  ) -> Dict[str, Union[float, int]]:
   """
   Wrapper method for calculating Shannon Entropy & checking if string contains a suspicious keyword
-  for specified URL - Utility method in Trotline finalised Data Pipeline.
+  - with match counts and the URL components containing them - for specified URL - Utility method
+  in Trotline finalised Data Pipeline.
   
   Parameters
   ----------
   url : str
     String representation of the URL to be checked.
+  histogram : CharacterHistogram | None
+    Precomputed histogram of the URL-string - built from the URL if omitted.
 
   Returns
   -------
   dict[str, float | int]
     A Python dictionary of relevant URL-related information.
   """
+  # Scan the URL once for every suspicious keyword occurrence.
+  keyword_data = suspicious_keywords_matcher.match_url(url=url)
+
   # Gather all information into Results-dict
   results = {
-      "domain_entropy": calculate_shannon_entropy(text=url),
-      "contains_sus_keyword": contains_suspicious_keyword(
-          text=url,
-          keywords=suspicious_keywords_set
-      )
+      "domain_entropy": calculate_shannon_entropy(text=url, histogram=histogram),
+      "contains_sus_keyword": keyword_data["nb_sus_keywords"] > 0,
   }
+  results.update(keyword_data)
 
   return results
\ No newline at end of file
@@ -0,0 +1,351 @@
+# ----------------------------------------
+# IMPORTS
+# ----------------------------------------
+
+import re
+
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+from pyxdameraulevenshtein import damerau_levenshtein_distance as pdl_distance
+
+# ----------------------------------------
+# PIPELINE MATCHING HELPERS
+# ----------------------------------------
+
+# Generate every variant of the text produced by deleting up to 'max_deletes' characters.
+def deletion_variants(text: str, max_deletes: int) -> Set[str]:
+  """
+  Generate the deletion neighbourhood of the specified text - every string obtained by removing
+  between 0 and 'max_deletes' characters - Utility method in Trotline finalised Data Pipeline.
+
+  Parameters
+  ----------
+  text : str
+    String to generate deletion variants for.
+  max_deletes : int
+    Maximum number of characters removed per variant.
+
+  Returns
+  -------
+  set[str]
+    Set of deletion variants - always includes the original text.
+  """
+  variants = {text}
+  frontier = {text}
+
+  for _ in range(max_deletes):
+    frontier = {
+      variant[:position] + variant[position + 1:]
+      for variant in frontier
+      for position in range(len(variant))
+    }
+    variants |= frontier
+
+  return variants
+
+# Convert a character trie into an equivalent regex alternation.
+# Shared prefixes are factored out, so matching cost grows with keyword length - not list size.
+def trie_to_pattern(node: Dict[str, dict]) -> str:
+  """
+  Recursively convert a character trie - nested Dict-objects where the empty key marks the end of
+  a keyword - into a regex pattern matching exactly the stored keywords - Utility method in
+  Trotline finalised Data Pipeline. Longer keywords are preferred over their prefixes.
+
+  Parameters
+  ----------
+  node : dict[str, dict]
+    Trie node to be converted.
+
+  Returns
+  -------
+  str
+    Regex pattern string for the keywords below the node.
+  """
+  branches = [
+    re.escape(char) + trie_to_pattern(child)
+    for char, child in sorted(node.items())
+    if char != ""
+  ]
+  if not branches:
+    return ""
+
+  pattern = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+  if "" in node:
+    pattern = "(?:" + pattern + ")?"
+
+  return pattern
+
+# Reduce a URL netloc to its bare, lowercase hostname.
+# Removes user credentials, ports, IPv6 brackets and the trailing root dot.
+def hostname_from_netloc(netloc: str) -> str:
+  """
+  Strip user information, port and trailing dot from the specified netloc, leaving the lowercase
+  hostname - Utility method in Trotline finalised Data Pipeline.
+
+  Parameters
+  ----------
+  netloc : str
+    Network location of a parsed URL (fx. 'user@Example.com:8080').
+
+  Returns
+  -------
+  str
+    Bare lowercase hostname (fx. 'example.com').
+  """
+  host = netloc.rpartition("@")[2]
+
+  if host.startswith("["):                          # IPv6 literal -> Keep address inside brackets.
+    host = host[1:host.find("]")] if "]" in host else host[1:]
+  else:
+    host = host.partition(":")[0]
+
+  return host.rstrip(".").lower()
+
+# Split the URL-string into the character spans of its host, path & query components.
+def url_component_spans(url: str) -> Dict[str, Tuple[int, int]]:
+  """
+  Locate the host, path and query components of the specified URL-string as (start, end) offsets
+  without copying substrings - Utility method in Trotline finalised Data Pipeline. URLs without a
+  scheme are treated as starting with the host.
+
+  Parameters
+  ----------
+  url : str
+    URL-string to be split into components.
+
+  Returns
+  -------
+  dict[str, tuple[int, int]]
+    Start & end offset of the 'host', 'path' and 'query' components.
+  """
+  scheme_end = url.find("://")
+  host_start = scheme_end + 3 if scheme_end != -1 else 0
+
+  fragment_start = url.find("#", host_start)
+  url_end = fragment_start if fragment_start != -1 else len(url)
+
+  query_start = url.find("?", host_start, url_end)
+  path_end = query_start if query_start != -1 else url_end
+
+  path_start = url.find("/", host_start, path_end)
+  host_end = path_start if path_start != -1 else path_end
+
+  return {
+    "host": (host_start, host_end),
+    "path": (host_end, path_end),
+    "query": (path_end + 1 if query_start != -1 else path_end, url_end),
+  }
+
+# ----------------------------------------
+# PIPELINE MATCHING INDEXES
+# ----------------------------------------
+
+# SymSpell-style deletion index over protected brand names.
+# Two strings within Damerau-Levenshtein (OSA) distance 'k' always share a deletion variant with
+# at most 'k' deletions on each side -> Only brands sharing a variant are compared.
+class TyposquatIndex:
+  """
+  Precomputed deletion index over a list of protected brand domains, returning the brands within
+  a Damerau-Levenshtein distance threshold without comparing against every brand - Utility class
+  in Trotline finalised Data Pipeline.
+
+  Parameters
+  ----------
+  domains : Iterable[str]
+    Protected brand domains (without public suffix) to be indexed.
+  max_distance : int
+    Largest distance threshold the index is able to answer.
+  """
+
+  def __init__(self, domains: Iterable[str], max_distance: int):
+    self.max_distance = max_distance
+    self.domains = frozenset(domain.lower() for domain in domains)
+    self.max_domain_length = max((len(domain) for domain in self.domains), default=0)
+
+    self._variants: Dict[str, Set[str]] = {}
+    for domain in self.domains:
+      for variant in deletion_variants(domain, max_distance):
+        self._variants.setdefault(variant, set()).add(domain)
+
+  def closest_match(self, text: str, threshold: int) -> Tuple[Optional[str], Optional[int]]:
+    """
+    Find the nearest indexed brand within the threshold, excluding exact matches.
+
+    Parameters
+    ----------
+    text : str
+      Domain to be checked against the indexed brands.
+    threshold : int
+      Maximum Damerau-Levenshtein distance - capped at the index 'max_distance'.
+
+    Returns
+    -------
+    tuple[str | None, int | None]
+      The closest brand and its distance, or (None, None) if no brand is within the threshold.
+    """
+    text = text.lower()
+    threshold = min(threshold, self.max_distance)
+
+    # Early exit -> Length difference alone already exceeds the threshold for every brand.
+    if not text or len(text) > self.max_domain_length + threshold:
+      return None, None
+
+    candidates: Set[str] = set()
+    for variant in deletion_variants(text, threshold):
+      candidates |= self._variants.get(variant, set())
+
+    # Verify the candidates with the DL-distance -> Keep the closest (ties broken alphabetically).
+    matches = [
+      (pdl_distance(text, candidate), candidate)
+      for candidate in candidates
+      if candidate != text and abs(len(candidate) - len(text)) <= threshold
+    ]
+    matches = [(distance, candidate) for distance, candidate in matches if distance <= threshold]
+
+    if not matches:
+      return None, None
+
+    distance, candidate = min(matches)
+    return candidate, distance
+
+# Hash-based suffix lookup over domain extensions (fx. '.ru', '.co.uk').
+# The hostname labels are walked right-to-left -> One set lookup per label of the longest extension.
+class SuffixMatcher:
+  """
+  Precomputed lookup checking whether a hostname ends with one of the specified domain extensions,
+  at a cost independent of the number of extensions - Utility class in Trotline finalised Data
+  Pipeline. Multi-label extensions are matched on whole labels only.
+
+  Parameters
+  ----------
+  extensions : Iterable[str]
+    Domain extensions with or without leading dot (fx. '.xyz', 'co.uk').
+  """
+
+  def __init__(self, extensions: Iterable[str]):
+    self.extensions = frozenset(
+      extension.strip(".").lower() for extension in extensions if extension.strip(".")
+    )
+    self.max_labels = max((extension.count(".") + 1 for extension in self.extensions), default=0)
+
+  def matches(self, hostname: str) -> bool:
+    """
+    Check whether the hostname ends with one of the extensions.
+
+    Parameters
+    ----------
+    hostname : str
+      Bare lowercase hostname (see 'hostname_from_netloc').
+
+    Returns
+    -------
+    bool
+      Returns True if the hostname has at least one label in front of a listed extension.
+    """
+    labels = hostname.rsplit(".", self.max_labels)
+
+    # Walk right-to-left -> The extension must leave at least one label in front of it.
+    for label_count in range(1, len(labels)):
+      if ".".join(labels[-label_count:]) in self.extensions:
+        return True
+
+    return False
+
+# Single-pass multi-keyword matcher compiled once from the keyword list.
+# The keywords are compiled into one trie-shaped regex -> The URL is scanned once by the regex
+# engine, and every match is expanded into all keywords sharing its start position.
+class KeywordMatcher:
+  """
+  Precompiled matcher locating every occurrence of every keyword in a URL-string with a single
+  scan - Utility class in Trotline finalised Data Pipeline. Equivalent to an Aho-Corasick
+  automaton, but executed by the native regex engine.
+
+  Parameters
+  ----------
+  keywords : Iterable[str]
+    Keywords to be matched (case-sensitive).
+  """
+
+  def __init__(self, keywords: Iterable[str]):
+    self.keywords = frozenset(keyword for keyword in keywords if keyword)
+
+    self._trie: Dict[str, dict] = {}
+    for keyword in self.keywords:
+      node = self._trie
+      for char in keyword:
+        node = node.setdefault(char, {})
+      node[""] = {}
+
+    pattern = trie_to_pattern(self._trie) or "(?!)"
+    self._search = re.compile(pattern).search
+    self._finditer = re.compile(f"(?=({pattern}))").finditer
+
+  def contains(self, text: str) -> bool:
+    """
+    Check whether the text contains at least one keyword.
+
+    Parameters
+    ----------
+    text : str
+      String to be scanned.
+
+    Returns
+    -------
+    bool
+      Returns True if any keyword occurs in the text.
+    """
+    return self._search(text) is not None
+
+  def find_all(self, text: str) -> List[Tuple[int, str]]:
+    """
+    Find every (possibly overlapping) keyword occurrence in the text.
+
+    Parameters
+    ----------
+    text : str
+      String to be scanned.
+
+    Returns
+    -------
+    list[tuple[int, str]]
+      Start offset & keyword of every occurrence, ordered by offset.
+    """
+    occurrences = []
+
+    for match in self._finditer(text):
+      # The regex reports the longest keyword per offset -> Walk the trie for shorter ones.
+      start, longest = match.start(), match.group(1)
+      node = self._trie
+      for length, char in enumerate(longest, start=1):
+        node = node[char]
+        if "" in node:
+          occurrences.append((start, longest[:length]))
+
+    return occurrences
+
+  def match_url(self, url: str) -> Dict[str, int]:
+    """
+    Scan the URL once and summarise the keyword occurrences per URL component.
+
+    Parameters
+    ----------
+    url : str
+      URL-string to be scanned.
+
+    Returns
+    -------
+    dict[str, int]
+      Total & distinct keyword counts, and whether a keyword occurs in the host, path or query.
+    """
+    occurrences = self.find_all(url)
+    spans = url_component_spans(url)
+
+    results = {
+      "nb_sus_keywords": len(occurrences),
+      "nb_distinct_sus_keywords": len({keyword for _, keyword in occurrences}),
+    }
+    for component, (start, end) in spans.items():
+      results[f"sus_keyword_in_{component}"] = any(
+        start <= offset and offset + len(keyword) <= end for offset, keyword in occurrences
+      )
+
+    return results
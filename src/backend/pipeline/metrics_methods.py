@@ -0,0 +1,565 @@
+# ----------------------------------------
+# IMPORTS
+# ----------------------------------------
+
+import bisect
+import os
+import threading
+import time
+
+from abc import ABC, abstractmethod
+from contextlib import contextmanager, nullcontext
+from typing import ContextManager, Dict, Iterator, List, Optional, Sequence, Tuple, Union
+
+# ----------------------------------------
+# PIPELINE METRIC TYPES
+# ----------------------------------------
+
+# Escape a label value for the Prometheus text format.
+def escape_label_value(value: str) -> str:
+  """
+  Escape backslashes, double quotes and newlines in a Prometheus label value - Utility method in
+  Trotline finalised Data Pipeline.
+
+  Parameters
+  ----------
+  value : str
+    Raw label value.
+
+  Returns
+  -------
+  str
+    Escaped label value.
+  """
+  return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+# Render the label set of one series (fx. '{stage="parse_url"}').
+def format_labels(label_names: Sequence[str], label_values: Sequence[str]) -> str:
+  """
+  Render label names & values as a Prometheus label set - Utility method in Trotline finalised
+  Data Pipeline.
+
+  Parameters
+  ----------
+  label_names : Sequence[str]
+    Label names.
+  label_values : Sequence[str]
+    Label values, in label name order.
+
+  Returns
+  -------
+  str
+    Label set in braces - empty string if there are no labels.
+  """
+  if not label_names:
+    return ""
+
+  return "{" + ",".join(
+    f'{name}="{escape_label_value(str(value))}"' for name, value in zip(label_names, label_values)
+  ) + "}"
+
+# Base class of every metric -> Holds the name, help text & label names.
+class Metric(ABC):
+  """
+  Named metric with optional labels, rendered in the Prometheus text format - Utility class in
+  Trotline finalised Data Pipeline. Every series is keyed by its tuple of label values.
+
+  Parameters
+  ----------
+  name : str
+    Metric name (fx. 'trotline_whois_lookups_total').
+  documentation : str
+    Help text of the metric.
+  label_names : Sequence[str]
+    Names of the labels distinguishing the series.
+  """
+
+  metric_type = "untyped"
+
+  def __init__(self, name: str, documentation: str, label_names: Sequence[str] = ()):
+    self.name = name
+    self.documentation = documentation
+    self.label_names: Tuple[str, ...] = tuple(label_names)
+    self._lock = threading.Lock()
+
+  def render(self) -> List[str]:
+    """
+    Render the metric in the Prometheus text format.
+
+    Returns
+    -------
+    list[str]
+      HELP, TYPE & sample lines of the metric.
+    """
+    return [
+      f"# HELP {self.name} {self.documentation}",
+      f"# TYPE {self.name} {self.metric_type}",
+      *self.render_samples(),
+    ]
+
+  @abstractmethod
+  def render_samples(self) -> List[str]:
+    """
+    Render the sample lines of every series of the metric.
+
+    Returns
+    -------
+    list[str]
+      Sample lines in the Prometheus text format.
+    """
+
+# Monotonically increasing count per label set (fx. WHOIS outcomes).
+class Counter(Metric):
+  """
+  Monotonically increasing counter - Utility class in Trotline finalised Data Pipeline.
+  """
+
+  metric_type = "counter"
+
+  def __init__(self, name: str, documentation: str, label_names: Sequence[str] = ()):
+    super().__init__(name, documentation, label_names)
+    self._values: Dict[Tuple[str, ...], float] = {}
+
+  def inc(self, labels: Tuple[str, ...] = (), amount: float = 1) -> None:
+    """
+    Increase the counter of the label set.
+
+    Parameters
+    ----------
+    labels : tuple[str, ...]
+      Label values, in label name order.
+    amount : float
+      Non-negative increment.
+    """
+    with self._lock:
+      self._values[labels] = self._values.get(labels, 0) + amount
+
+  def value(self, labels: Tuple[str, ...] = ()) -> float:
+    """
+    Current count of the label set.
+
+    Parameters
+    ----------
+    labels : tuple[str, ...]
+      Label values, in label name order.
+
+    Returns
+    -------
+    float
+      Current count - 0 if never increased.
+    """
+    return self._values.get(labels, 0)
+
+  def render_samples(self) -> List[str]:
+    with self._lock:
+      values = sorted(self._values.items())
+    return [f"{self.name}{format_labels(self.label_names, labels)} {value:g}" for labels, value in values]
+
+# Value that goes up & down per label set (fx. requests in flight).
+class Gauge(Metric):
+  """
+  Gauge holding a current value - Utility class in Trotline finalised Data Pipeline.
+  """
+
+  metric_type = "gauge"
+
+  def __init__(self, name: str, documentation: str, label_names: Sequence[str] = ()):
+    super().__init__(name, documentation, label_names)
+    self._values: Dict[Tuple[str, ...], float] = {}
+
+  def inc(self, labels: Tuple[str, ...] = (), amount: float = 1) -> None:
+    """
+    Increase the gauge of the label set.
+
+    Parameters
+    ----------
+    labels : tuple[str, ...]
+      Label values, in label name order.
+    amount : float
+      Increment - negative values decrease the gauge.
+    """
+    with self._lock:
+      self._values[labels] = self._values.get(labels, 0) + amount
+
+  def dec(self, labels: Tuple[str, ...] = (), amount: float = 1) -> None:
+    """
+    Decrease the gauge of the label set.
+
+    Parameters
+    ----------
+    labels : tuple[str, ...]
+      Label values, in label name order.
+    amount : float
+      Decrement.
+    """
+    self.inc(labels, -amount)
+
+  def value(self, labels: Tuple[str, ...] = ()) -> float:
+    """
+    Current value of the label set.
+
+    Parameters
+    ----------
+    labels : tuple[str, ...]
+      Label values, in label name order.
+
+    Returns
+    -------
+    float
+      Current value - 0 if never set.
+    """
+    return self._values.get(labels, 0)
+
+  @contextmanager
+  def track(self, labels: Tuple[str, ...] = ()) -> Iterator[None]:
+    """
+    Increase the gauge for the duration of the context (fx. one request in flight).
+
+    Parameters
+    ----------
+    labels : tuple[str, ...]
+      Label values, in label name order.
+    """
+    self.inc(labels)
+    try:
+      yield
+    finally:
+      self.dec(labels)
+
+  def render_samples(self) -> List[str]:
+    with self._lock:
+      values = sorted(self._values.items())
+    return [f"{self.name}{format_labels(self.label_names, labels)} {value:g}" for labels, value in values]
+
+# Cumulative distribution over fixed buckets per label set (fx. stage latencies).
+class Histogram(Metric):
+  """
+  Cumulative histogram over fixed upper bucket bounds, with running count & sum per label set -
+  Utility class in Trotline finalised Data Pipeline.
+
+  Parameters
+  ----------
+  name : str
+    Metric name (fx. 'trotline_pipeline_stage_seconds').
+  documentation : str
+    Help text of the metric.
+  bounds : Sequence[float]
+    Ascending upper bounds of the buckets - an implicit '+Inf' bucket is appended.
+  label_names : Sequence[str]
+    Names of the labels distinguishing the series.
+  """
+
+  metric_type = "histogram"
+
+  def __init__(self, name: str, documentation: str, bounds: Sequence[float], label_names: Sequence[str] = ()):
+    super().__init__(name, documentation, label_names)
+    self.bounds: Tuple[float, ...] = tuple(bounds)
+    # Flat series per label set -> One count per bucket followed by the sum of all observations.
+    self._series: Dict[Tuple[str, ...], List[float]] = {}
+    self._empty_series = [0] * (len(self.bounds) + 1) + [0.0]
+    self._bisect = bisect.bisect_left
+
+  def observe(self, value: float, labels: Tuple[str, ...] = ()) -> None:
+    """
+    Record a single observation.
+
+    Parameters
+    ----------
+    value : float
+      Observed value.
+    labels : tuple[str, ...]
+      Label values, in label name order.
+    """
+    bucket = self._bisect(self.bounds, value)
+
+    with self._lock:
+      series = self._series.get(labels)
+      if series is None:
+        series = self._series[labels] = list(self._empty_series)
+      series[bucket] += 1
+      series[-1] += value
+
+  def snapshot(self, labels: Tuple[str, ...] = ()) -> Dict[str, Union[int, float, Dict[str, int]]]:
+    """
+    Cumulative bucket counts, count & sum of all observations of the label set.
+
+    Parameters
+    ----------
+    labels : tuple[str, ...]
+      Label values, in label name order.
+
+    Returns
+    -------
+    dict[str, int | float | dict[str, int]]
+      JSON-serialisable view of the distribution.
+    """
+    with self._lock:
+      series = list(self._series.get(labels, self._empty_series))
+    counts, total = series[:-1], series[-1]
+
+    buckets, running_total = {}, 0
+    for bound, bucket_count in zip(self._bucket_labels(), counts):
+      running_total += bucket_count
+      buckets[bound] = running_total
+
+    return {"count": running_total, "sum": total, "buckets": buckets}
+
+  def render_samples(self) -> List[str]:
+    with self._lock:
+      label_sets = sorted(self._series)
+
+    lines = []
+    for labels in label_sets:
+      snapshot = self.snapshot(labels)
+      for bound, cumulative_count in snapshot["buckets"].items():
+        bucket_labels = format_labels(self.label_names + ("le",), labels + (bound,))
+        lines.append(f"{self.name}_bucket{bucket_labels} {cumulative_count}")
+      series_labels = format_labels(self.label_names, labels)
+      lines.append(f"{self.name}_sum{series_labels} {snapshot['sum']:g}")
+      lines.append(f"{self.name}_count{series_labels} {snapshot['count']}")
+
+    return lines
+
+  def _bucket_labels(self) -> List[str]:
+    return [f"{bound:g}" for bound in self.bounds] + ["+Inf"]
+
+# ----------------------------------------
+# PIPELINE METRICS REGISTRY
+# ----------------------------------------
+
+# Collection of metrics rendered together by the '/metrics' endpoint.
+class MetricsRegistry:
+  """
+  Ordered collection of metrics, rendered as one Prometheus text document - Utility class in
+  Trotline finalised Data Pipeline.
+  """
+
+  def __init__(self):
+    self._metrics: Dict[str, Metric] = {}
+
+  def register(self, metric: Metric) -> Metric:
+    """
+    Add the metric to the registry.
+
+    Parameters
+    ----------
+    metric : Metric
+      Metric to be registered.
+
+    Returns
+    -------
+    Metric
+      The registered metric.
+
+    Exceptions
+    ----------
+    ValueError
+      Raised if a metric with the same name is already registered.
+    """
+    if metric.name in self._metrics:
+      raise ValueError(f"Metric already registered - {metric.name}")
+
+    self._metrics[metric.name] = metric
+    return metric
+
+  def render(self) -> str:
+    """
+    Render every registered metric in the Prometheus text exposition format.
+
+    Returns
+    -------
+    str
+      Prometheus text document.
+    """
+    lines = [line for metric in self._metrics.values() for line in metric.render()]
+    return "\n".join(lines) + "\n"
+
+# Process-wide registry & the metrics recorded by the Pipeline and the application.
+METRICS_REGISTRY = MetricsRegistry()
+
+# Latency buckets in seconds -> 50 microseconds up to 10 seconds (WHOIS lookups).
+LATENCY_BUCKETS = (
+  0.00005, 0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10
+)
+
+PIPELINE_STAGE_SECONDS = METRICS_REGISTRY.register(Histogram(
+  "trotline_pipeline_stage_seconds", "Duration of each Pipeline stage per URL.", LATENCY_BUCKETS, ("stage",)
+))
+WHOIS_LOOKUPS_TOTAL = METRICS_REGISTRY.register(Counter(
+  "trotline_whois_lookups_total", "Live WHOIS lookups by outcome.", ("outcome",)
+))
+WHOIS_WAITS_TOTAL = METRICS_REGISTRY.register(Counter(
+  "trotline_whois_waits_total", "Requests waiting on a WHOIS lookup by result ('completed', 'budget_exceeded', 'deadline_exceeded', 'hedged').", ("result",)
+))
+MODEL_PREDICT_SECONDS = METRICS_REGISTRY.register(Histogram(
+  "trotline_model_predict_seconds", "Duration of each XGBoost prediction call.", LATENCY_BUCKETS, ("caller",)
+))
+MODEL_PREDICT_ROWS = METRICS_REGISTRY.register(Histogram(
+  "trotline_model_predict_rows", "Rows per XGBoost prediction call.", (1, 2, 4, 8, 16, 32, 64, 128, 256, 512, 1024), ("caller",)
+))
+BATCHER_BATCH_SIZE = METRICS_REGISTRY.register(Histogram(
+  "trotline_batcher_batch_size", "Rows per micro-batch of the prediction batcher.", (1, 2, 4, 8, 16, 32, 64, 128, 256)
+))
+BATCHER_WAIT_MILLISECONDS = METRICS_REGISTRY.register(Histogram(
+  "trotline_batcher_wait_milliseconds", "Time rows waited for their micro-batch.", (0.1, 0.25, 0.5, 1, 2, 5, 10, 25, 50, 100)
+))
+REQUESTS_IN_FLIGHT = METRICS_REGISTRY.register(Gauge(
+  "trotline_requests_in_flight", "Requests currently being processed.", ("endpoint",)
+))
+PIPELINE_IN_FLIGHT = METRICS_REGISTRY.register(Gauge(
+  "trotline_pipeline_in_flight", "URLs currently inside the async Pipeline.", ()
+))
+
+# ----------------------------------------
+# PIPELINE INSTRUMENTATION
+# ----------------------------------------
+
+# Whether metrics are recorded -> Resolved lazily so environment variables are read after startup.
+_metrics_enabled: Optional[bool] = None
+
+# Shared no-op context returned by the instrumentation helpers when metrics are disabled.
+_DISABLED_CONTEXT = nullcontext()
+
+# Check whether metrics are recorded in this process.
+def metrics_enabled() -> bool:
+  """
+  Check whether hot-path metrics are recorded, reading the 'METRICS_ENABLED' environment variable
+  on first use (default enabled; '0', 'false' or 'no' disable it) - Utility method in Trotline
+  finalised Data Pipeline.
+
+  Returns
+  -------
+  bool
+    Returns True if metrics are recorded.
+  """
+  global _metrics_enabled
+
+  if _metrics_enabled is None:
+    _metrics_enabled = os.getenv("METRICS_ENABLED", "1").strip().lower() not in ("0", "false", "no", "off")
+
+  return _metrics_enabled
+
+# Record the wall time of the enclosed block in a latency histogram.
+# Plain class instead of a generator-based context manager -> Keeps the hot-path overhead minimal.
+class DurationTimer:
+  """
+  Context manager observing the duration of the enclosed block in a histogram - Utility class in
+  Trotline finalised Data Pipeline.
+
+  Parameters
+  ----------
+  histogram : Histogram
+    Latency histogram receiving the duration in seconds.
+  labels : tuple[str, ...]
+    Label values, in label name order.
+  """
+
+  __slots__ = ("histogram", "labels", "started_at")
+
+  def __init__(self, histogram: Histogram, labels: Tuple[str, ...]):
+    self.histogram = histogram
+    self.labels = labels
+
+  def __enter__(self) -> None:
+    self.started_at = time.perf_counter()
+
+  def __exit__(self, *exc_info) -> None:
+    self.histogram.observe(time.perf_counter() - self.started_at, self.labels)
+
+# Time a Pipeline stage -> 'with time_stage("final_url_parser"): ...'.
+def time_stage(stage: str) -> ContextManager[None]:
+  """
+  Time the enclosed block as the specified Pipeline stage - Utility method in Trotline finalised
+  Data Pipeline. Returns a shared no-op context when metrics are disabled.
+
+  Parameters
+  ----------
+  stage : str
+    Stage name recorded as the 'stage' label.
+
+  Returns
+  -------
+  ContextManager[None]
+    Context timing the enclosed block.
+  """
+  if not metrics_enabled():
+    return _DISABLED_CONTEXT
+
+  return DurationTimer(PIPELINE_STAGE_SECONDS, (stage,))
+
+# Time an XGBoost prediction call & record its row count.
+def time_prediction(caller: str, rows: int) -> ContextManager[None]:
+  """
+  Time the enclosed XGBoost prediction call - Utility method in Trotline finalised Data Pipeline.
+  Returns a shared no-op context when metrics are disabled.
+
+  Parameters
+  ----------
+  caller : str
+    Component making the prediction (fx. 'batcher'), recorded as the 'caller' label.
+  rows : int
+    Number of rows predicted by the call.
+
+  Returns
+  -------
+  ContextManager[None]
+    Context timing the enclosed block.
+  """
+  if not metrics_enabled():
+    return _DISABLED_CONTEXT
+
+  MODEL_PREDICT_ROWS.observe(rows, (caller,))
+  return DurationTimer(MODEL_PREDICT_SECONDS, (caller,))
+
+# Count a request (or URL) as in flight for the duration of the block.
+def track_in_flight(gauge: Gauge, labels: Tuple[str, ...] = ()) -> ContextManager[None]:
+  """
+  Increase the gauge while the enclosed block runs - Utility method in Trotline finalised Data
+  Pipeline. Returns a shared no-op context when metrics are disabled.
+
+  Parameters
+  ----------
+  gauge : Gauge
+    In-flight gauge to be tracked.
+  labels : tuple[str, ...]
+    Label values, in label name order.
+
+  Returns
+  -------
+  ContextManager[None]
+    Context tracking the enclosed block.
+  """
+  if not metrics_enabled():
+    return _DISABLED_CONTEXT
+
+  return gauge.track(labels)
+
+# Count the outcome of a live WHOIS lookup.
+def record_whois_outcome(outcome: str) -> None:
+  """
+  Count a live WHOIS lookup by outcome - 'success', 'timeout', 'not_found' or 'error' - Utility
+  method in Trotline finalised Data Pipeline. Does nothing when metrics are disabled.
+
+  Parameters
+  ----------
+  outcome : str
+    Outcome of the lookup.
+  """
+  if metrics_enabled():
+    WHOIS_LOOKUPS_TOTAL.inc((outcome,))
+
+# Count how a request's wait on a WHOIS lookup ended -> Cheap no-op when metrics are disabled.
+def record_whois_wait(result: str) -> None:
+  """
+  Count a request waiting on a WHOIS lookup by result - 'completed' within the latency budget,
+  'budget_exceeded', 'deadline_exceeded' when a caller without budget gave up after the lookup
+  deadline, or 'hedged' when a second query was sent - Utility method in Trotline
+  finalised Data Pipeline. Does nothing when metrics are disabled.
+
+  Parameters
+  ----------
+  result : str
+    Result of the wait.
+  """
+  if metrics_enabled():
+    WHOIS_WAITS_TOTAL.inc((result,))
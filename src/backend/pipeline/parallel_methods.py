@@ -0,0 +1,343 @@
+# ----------------------------------------
+# IMPORTS
+# ----------------------------------------
+
+import numpy as np
+import math
+import multiprocessing
+import os
+
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing.shared_memory import SharedMemory
+from typing import Any, Callable, Dict, List, Optional, Sequence, Set, Tuple, Union
+
+from src.backend.pipeline.feature_schema import DEFAULT_FEATURE_SPECS, EXTENDED_FEATURE_SPECS, FeatureSchema
+from src.backend.pipeline.final_pipeline import (
+  DEFAULT_FEATURE_SCHEMA,
+  finalised_data_pipeline_for_py,
+  finalised_data_pipeline_for_web
+)
+from src.backend.pipeline.helper_methods import (
+  suspicious_extensions_matcher,
+  suspicious_keywords_matcher,
+  typosquatted_domains_index
+)
+from src.backend.pipeline.suffix_methods import warm_tld_extractor
+
+# ----------------------------------------
+# PARALLEL PIPELINE CONFIGURATION
+# ----------------------------------------
+
+# URLs handed to a worker per task -> Large enough to amortise the task overhead.
+DEFAULT_PARALLEL_CHUNK_SIZE = 256
+
+# Numerical features of the Python-Dict output, stored as float64 so integers round-trip exactly.
+RECORD_FEATURE_SCHEMA = FeatureSchema(DEFAULT_FEATURE_SPECS + EXTENDED_FEATURE_SPECS)
+
+# Python-Dict keys carried alongside the numerical features rather than in the shared matrix.
+RECORD_URL_KEY = "url"
+
+# ----------------------------------------
+# PARALLEL PIPELINE WORKER METHODS
+# ----------------------------------------
+
+# Process pool initializer -> Runs once per worker process, never once per chunk.
+def initialize_pipeline_worker() -> None:
+  """
+  Build the per-process Pipeline state ahead of the first chunk - Utility method in Trotline
+  finalised Data Pipeline. The suffix extractor parses the bundled suffix list, and the matching
+  indexes are built by importing 'helper_methods' (inherited as-is by forked workers).
+  """
+  warm_tld_extractor()
+
+  # Touch the import-time indexes -> Guarantees they exist before the first URL is processed.
+  typosquatted_domains_index.closest_match("warmup", threshold=1)
+  suspicious_keywords_matcher.find_all("warmup")
+  suspicious_extensions_matcher.matches("warmup.example.com")
+
+# Copy the finished rows of a chunk into the shared output matrix of the current call.
+def write_shared_rows(segment_name: str, start: int, rows: np.ndarray) -> None:
+  """
+  Copy a block of rows into the shared output segment created by the parent process, at the
+  position of its first row - Utility method in Trotline finalised Data Pipeline. The segment is
+  attached only for the copy, so a worker never keeps the segment of a finished call mapped.
+
+  Parameters
+  ----------
+  segment_name : str
+    Name of the shared memory segment.
+  start : int
+    Row of the first URL in the block.
+  rows : numpy.ndarray
+    C-contiguous block of rows with the dtype & width of the shared matrix.
+  """
+  segment = SharedMemory(name=segment_name)
+  try:
+    offset = start * rows.shape[1] * rows.itemsize
+    segment.buf[offset:offset + rows.nbytes] = memoryview(rows).cast("B")
+  finally:
+    segment.close()
+
+# Web-style task -> Fill the schema rows of one chunk, then copy them into the shared matrix.
+def extract_matrix_chunk(segment_name: str, start: int, urls: Sequence[str], schema: FeatureSchema) -> List[int]:
+  """
+  Run 'finalised_data_pipeline_for_web' over a chunk and write the float32 rows into the shared
+  matrix - Utility method in Trotline finalised Data Pipeline. URLs rejected by the Pipeline keep
+  their row of missing values.
+
+  Parameters
+  ----------
+  segment_name : str
+    Name of the shared memory segment.
+  start : int
+    Row of the first URL in the chunk.
+  urls : Sequence[str]
+    URL-strings of the chunk.
+  schema : FeatureSchema
+    Model input schema defining feature order & missing-value encoding.
+
+  Returns
+  -------
+  list[int]
+    Rows (relative to the chunk) whose WHOIS lookup timed out or failed.
+  """
+  rows = schema.new_matrix(len(urls))
+  whois_incomplete_rows: List[int] = []
+
+  for row, url in enumerate(urls):
+    try:
+      _, whois_complete = finalised_data_pipeline_for_web(url, schema=schema, out=rows[row], return_whois_complete=True)
+    except ValueError:
+      continue
+    if not whois_complete:
+      whois_incomplete_rows.append(row)
+
+  write_shared_rows(segment_name, start, rows)
+
+  return whois_incomplete_rows
+
+# Python-Dict task -> Fill the numerical features of one chunk, return the sparse non-numerical values.
+def extract_records_chunk(
+    segment_name: str,
+    start: int,
+    urls: Sequence[str]
+  ) -> Tuple[Set[str], Dict[int, Dict[str, Any]], List[int]]:
+  """
+  Run 'finalised_data_pipeline_for_py' over a chunk and write the numerical features into the shared
+  float64 matrix - Utility method in Trotline finalised Data Pipeline. Only the values the matrix
+  cannot hold (fx. 'typosquat_brand') are returned to the parent, and only when they are set.
+
+  Parameters
+  ----------
+  segment_name : str
+    Name of the shared memory segment.
+  start : int
+    Row of the first URL in the chunk.
+  urls : Sequence[str]
+    URL-strings of the chunk.
+
+  Returns
+  -------
+  tuple[set[str], dict[int, dict[str, Any]], list[int]]
+    Names of the non-numerical keys, their non-None values by row and the rows of rejected URLs.
+  """
+  rows = np.full((len(urls), len(RECORD_FEATURE_SCHEMA)), np.nan, dtype=np.float64)
+  extra_keys: Set[str] = set()
+  extra_values: Dict[int, Dict[str, Any]] = {}
+  rejected_rows: List[int] = []
+
+  for row, url in enumerate(urls):
+    try:
+      results = finalised_data_pipeline_for_py(url)
+    except ValueError:
+      rejected_rows.append(start + row)
+      continue
+
+    RECORD_FEATURE_SCHEMA.fill_row(results, out=rows[row])
+
+    extras = {
+      key: value for key, value in results.items()
+      if key != RECORD_URL_KEY and key not in RECORD_FEATURE_SCHEMA.index
+    }
+    extra_keys.update(extras)
+    extras = {key: value for key, value in extras.items() if value is not None}
+    if extras:
+      extra_values[start + row] = extras
+
+  write_shared_rows(segment_name, start, rows)
+
+  return extra_keys, extra_values, rejected_rows
+
+# ----------------------------------------
+# PARALLEL PIPELINE EXECUTOR
+# ----------------------------------------
+
+# Multi-core feature extraction -> Splits URL batches into chunks across a process pool.
+class ParallelPipelineExecutor:
+  """
+  Process pool running the Pipeline over large URL batches on every core - Utility class in
+  Trotline finalised Data Pipeline. Every worker builds its suffix extractor & matching indexes
+  once, and writes its results into a shared output matrix instead of pickling per-URL Dict-objects
+  back to the parent. Each worker keeps its own in-memory WHOIS cache (Redis is shared if set).
+
+  Parameters
+  ----------
+  max_workers : int | None
+    Number of worker processes - 'PIPELINE_WORKERS' environment variable or the CPU count if omitted.
+  chunk_size : int
+    URLs per worker task.
+  start_method : str | None
+    Multiprocessing start method ('fork', 'spawn', 'forkserver') - platform default if omitted.
+  """
+
+  def __init__(
+      self,
+      max_workers: Optional[int] = None,
+      chunk_size: int = DEFAULT_PARALLEL_CHUNK_SIZE,
+      start_method: Optional[str] = None
+    ):
+    if max_workers is None:
+      max_workers = int(os.getenv("PIPELINE_WORKERS", str(os.cpu_count() or 1)))
+    if max_workers < 1:
+      raise ValueError(f"Worker count must be at least 1 - Current value {max_workers}")
+    if chunk_size < 1:
+      raise ValueError(f"Chunk size must be at least 1 - Current value {chunk_size}")
+
+    self.max_workers = max_workers
+    self.chunk_size = chunk_size
+    self._pool = ProcessPoolExecutor(
+      max_workers=max_workers,
+      mp_context=multiprocessing.get_context(start_method),
+      initializer=initialize_pipeline_worker
+    )
+
+  def __enter__(self) -> "ParallelPipelineExecutor":
+    return self
+
+  def __exit__(self, *exc_info: Any) -> None:
+    self.close()
+
+  def close(self) -> None:
+    """
+    Shut down the worker processes.
+    """
+    self._pool.shutdown(wait=True, cancel_futures=True)
+
+  def extract_matrix(
+      self,
+      urls: Sequence[str],
+      schema: FeatureSchema = DEFAULT_FEATURE_SCHEMA,
+      return_whois_complete: bool = False
+    ) -> Union[np.ndarray, Tuple[np.ndarray, np.ndarray]]:
+    """
+    Web-style extraction - One float32 row per URL, identical to 'finalised_data_pipeline_for_web'.
+
+    Parameters
+    ----------
+    urls : Sequence[str]
+      Collection of URL-strings suspected of being malicious/scam.
+    schema : FeatureSchema
+      Model input schema defining feature order & missing-value encoding.
+    return_whois_complete : bool
+      Whether to also report per URL if its WHOIS lookup completed.
+
+    Returns
+    -------
+    numpy.ndarray | tuple[numpy.ndarray, numpy.ndarray]
+      Matrix of shape (len(urls), n_features) in input order. URLs rejected by the Pipeline (fx.
+      beyond 'MAX_URL_LENGTH') produce a row of missing values. With 'return_whois_complete', also
+      a Boolean array - False for URLs whose WHOIS lookup timed out or failed.
+    """
+    urls = self._validate(urls)
+    matrix = schema.new_matrix(len(urls))
+    whois_complete = np.ones(len(urls), dtype=bool)
+
+    if urls:
+      chunk_results = self._run(
+        matrix, urls, lambda name, start, chunk: (extract_matrix_chunk, name, start, chunk, schema)
+      )
+      for start, whois_incomplete_rows in zip(range(0, len(urls), self.chunk_size), chunk_results):
+        whois_complete[[start + row for row in whois_incomplete_rows]] = False
+
+    if return_whois_complete:
+      return matrix, whois_complete
+
+    return matrix
+
+  def extract_records(self, urls: Sequence[str]) -> List[Optional[Dict[str, Any]]]:
+    """
+    Python-Dict extraction - One Dict-object per URL, equal to 'finalised_data_pipeline_for_py'.
+
+    Parameters
+    ----------
+    urls : Sequence[str]
+      Collection of URL-strings suspected of being malicious/scam.
+
+    Returns
+    -------
+    list[dict[str, Any] | None]
+      Pipeline output per URL in input order - None for URLs rejected by the Pipeline.
+    """
+    urls = self._validate(urls)
+    matrix = np.full((len(urls), len(RECORD_FEATURE_SCHEMA)), np.nan, dtype=np.float64)
+    extra_keys: Set[str] = set()
+    extra_values: Dict[int, Dict[str, Any]] = {}
+    rejected_rows: Set[int] = set()
+
+    if urls:
+      chunk_results = self._run(
+        matrix, urls, lambda name, start, chunk: (extract_records_chunk, name, start, chunk)
+      )
+      for chunk_keys, chunk_values, chunk_rejected in chunk_results:
+        extra_keys.update(chunk_keys)
+        extra_values.update(chunk_values)
+        rejected_rows.update(chunk_rejected)
+
+    # Restore the Python types -> Integers & binary Booleans as int, missing values as None.
+    converters = [int if spec.dtype in ("int", "bool") else float for spec in RECORD_FEATURE_SCHEMA.specs]
+    records: List[Optional[Dict[str, Any]]] = []
+
+    for row, (url, values) in enumerate(zip(urls, matrix.tolist())):
+      if row in rejected_rows:
+        records.append(None)
+        continue
+
+      record: Dict[str, Any] = {RECORD_URL_KEY: url}
+      for name, convert, value in zip(RECORD_FEATURE_SCHEMA.names, converters, values):
+        record[name] = None if math.isnan(value) else convert(value)
+      for key in extra_keys:
+        record[key] = extra_values.get(row, {}).get(key)
+      records.append(record)
+
+    return records
+
+  def _validate(self, urls: Sequence[str]) -> List[str]:
+    urls = list(urls)
+
+    # Validation check for URL-parameters -> Raised before any work is dispatched.
+    for url in urls:
+      if not isinstance(url, str):
+        raise ValueError(f"URL must be of Type: str - Current type {type(url)}")
+
+    return urls
+
+  def _run(self, matrix: np.ndarray, urls: List[str], build_task: Callable[[str, int, List[str]], tuple]) -> List[Any]:
+    # Shared segment mirroring the output matrix -> Copied back once every chunk is done.
+    segment = SharedMemory(create=True, size=max(matrix.nbytes, 1))
+    try:
+      futures = [
+        self._pool.submit(*build_task(segment.name, start, urls[start:start + self.chunk_size]))
+        for start in range(0, len(urls), self.chunk_size)
+      ]
+      try:
+        results = [future.result() for future in futures]
+      finally:
+        for future in futures:
+          future.cancel()
+
+      matrix[:] = np.frombuffer(segment.buf, dtype=matrix.dtype, count=matrix.size).reshape(matrix.shape)
+    finally:
+      segment.close()
+      segment.unlink()
+
+    return results
@@ -2,11 +2,284 @@
 # IMPORTS
 # ----------------------------------------
 
-from urllib.parse import ParseResult, urlparse
-from typing import Optional, Union, Dict
+import pandas as pd
+import re
 
-from src.backend.pipeline.helper_methods import num_of_subdomains, contains_suspicious_domain_extension
-from src.backend.pipeline.dataset import suspicious_domain_extensions_set
+from dataclasses import dataclass
+from urllib.parse import ParseResult, SplitResult, urlparse, urlsplit
+from typing import List, Optional, Sequence, Union, Dict
+
+from src.backend.pipeline.helper_methods import (
+  extract_hostname,
+  num_of_subdomains,
+  suspicious_extensions_matcher
+)
+from src.backend.pipeline.matching_methods import hostname_from_netloc
+from src.backend.pipeline.dataset import tracking_query_parameters_set
+
+# ----------------------------------------
+# PIPELINE PARSED URL
+# ----------------------------------------
+
+# Compact, immutable view of a URL parsed once and shared by every Pipeline stage.
+@dataclass(frozen=True, slots=True)
+class ParsedURL:
+  """
+  Parsed representation of a URL-string, combining urllib's components with tldextract's domain
+  parts - Utility class in Trotline finalised Data Pipeline. Created once per URL by 'parse_url'
+  and passed to every Pipeline stage.
+
+  Attributes
+  ----------
+  url : str
+    The raw URL-string.
+  is_valid : bool
+    Whether urllib could parse the URL - all components are empty if not.
+  scheme : str
+    Lowercase URL scheme (fx. 'https').
+  netloc : str
+    Raw network location, including credentials & port.
+  host : str
+    Bare lowercase hostname.
+  port : int | None
+    Explicit port number, if any.
+  path : str
+    URL path.
+  query : str
+    URL query string.
+  subdomain : str
+    Subdomain part according to the public suffix list.
+  domain : str
+    Domain part according to the public suffix list.
+  suffix : str
+    Public suffix (fx. 'co.uk').
+  registered_domain : str
+    Lowercase domain + public suffix (fx. 'example.co.uk') - empty for IPs & unknown suffixes.
+  idna_host : str | None
+    ASCII (IDNA) form of the host - None if the host cannot be IDNA-encoded.
+  canonical_url : str
+    Canonical form of the URL - key for caches & deduplication (see 'canonicalize_url').
+  """
+  url: str
+  is_valid: bool
+  scheme: str
+  netloc: str
+  host: str
+  port: Optional[int]
+  path: str
+  query: str
+  subdomain: str
+  domain: str
+  suffix: str
+  registered_domain: str
+  idna_host: Optional[str]
+  canonical_url: str
+
+# Parse the URL-string once into a shared ParsedURL-object.
+def parse_url(url: str) -> ParsedURL:
+  """
+  Parse the specified URL-string with urllib & tldextract and combine the results into a single
+  ParsedURL-object - Utility method in Trotline finalised Data Pipeline.
+
+  Parameters
+  ----------
+  url : str
+    String representation of the URL to be parsed.
+
+  Returns
+  -------
+  ParsedURL
+    Parsed view of the URL shared by every Pipeline stage.
+  """
+  parsed_url = parse_url_and_handle_errors(url=url)
+  is_valid = isinstance(parsed_url, ParseResult)
+
+  # Ports outside the valid range make urllib raise on access -> Treat as missing.
+  port = None
+  if is_valid:
+    try:
+      port = parsed_url.port
+    except ValueError:
+      port = None
+
+  extracted_url = extract_hostname(url=url)
+  netloc = parsed_url.netloc if is_valid else ""
+
+  # Prefer urllib's hostname -> Fall back to tldextract for scheme-less URLs.
+  host = hostname_from_netloc(netloc) if netloc else ".".join(
+    part for part in (extracted_url.subdomain, extracted_url.domain, extracted_url.suffix) if part
+  ).lower()
+
+  try:
+    idna_host = host.encode("idna").decode("ascii") if host else None
+  except UnicodeError:
+    idna_host = None
+
+  registered_domain = (
+    f"{extracted_url.domain}.{extracted_url.suffix}".lower()
+    if extracted_url.domain and extracted_url.suffix else ""
+  )
+
+  return ParsedURL(
+    url=url,
+    is_valid=is_valid,
+    scheme=parsed_url.scheme.lower() if is_valid else "",
+    netloc=netloc,
+    host=host,
+    port=port,
+    path=(parsed_url.path or "") if is_valid else "",
+    query=(parsed_url.query or "") if is_valid else "",
+    subdomain=extracted_url.subdomain,
+    domain=extracted_url.domain,
+    suffix=extracted_url.suffix,
+    registered_domain=registered_domain,
+    idna_host=idna_host,
+    canonical_url=canonicalize_url(url=url),
+  )
+
+# ----------------------------------------
+# PIPELINE URL CANONICALIZATION
+# ----------------------------------------
+
+# Default ports per scheme -> Removed from the canonical network location.
+DEFAULT_PORTS = {"http": 80, "https": 443, "ws": 80, "wss": 443, "ftp": 21}
+
+# Percent-escapes in URL components (fx. '%7e').
+PERCENT_ESCAPE_PATTERN = re.compile(r"%([0-9A-Fa-f]{2})")
+
+# Characters that never need percent-encoding (RFC 3986 'unreserved').
+UNRESERVED_CHARACTERS = frozenset(
+  "ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789-._~"
+)
+
+# Decode escaped unreserved characters & uppercase the remaining escapes (fx. '%7e%2f' -> '~%2F').
+def normalize_percent_encoding(text: str) -> str:
+  """
+  Normalize the percent-encoding of a URL component - escaped unreserved characters are decoded,
+  all other escapes are kept with uppercase hex digits - Utility method in Trotline finalised
+  Data Pipeline.
+
+  Parameters
+  ----------
+  text : str
+    URL component (path, query parameter, ...).
+
+  Returns
+  -------
+  str
+    The component with normalized percent-encoding.
+  """
+  if "%" not in text:
+    return text
+
+  def replace_escape(match: re.Match) -> str:
+    character = chr(int(match.group(1), 16))
+    return character if character in UNRESERVED_CHARACTERS else match.group(0).upper()
+
+  return PERCENT_ESCAPE_PATTERN.sub(replace_escape, text)
+
+# Check whether the query parameter only tracks campaigns or clicks.
+def is_tracking_parameter(name: str) -> bool:
+  """
+  Check the query parameter name against the known tracking parameters - Utility method in
+  Trotline finalised Data Pipeline.
+
+  Parameters
+  ----------
+  name : str
+    Query parameter name (percent-encoding normalized).
+
+  Returns
+  -------
+  bool
+    Returns True if the parameter is a tracking parameter.
+  """
+  name = name.lower()
+  return name.startswith("utm_") or name in tracking_query_parameters_set
+
+# Rebuild the network location with a lowercase IDNA host and without the default port.
+def canonicalize_netloc(components: SplitResult, scheme: str) -> str:
+  """
+  Canonicalize the network location of a split URL - user information is kept, the host is
+  lowercased, stripped of its trailing dot and IDNA-encoded, and the scheme's default port is
+  removed - Utility method in Trotline finalised Data Pipeline.
+
+  Parameters
+  ----------
+  components : urllib.SplitResult
+    Split URL components.
+  scheme : str
+    Lowercase URL scheme.
+
+  Returns
+  -------
+  str
+    Canonical network location.
+  """
+  userinfo, _, hostport = components.netloc.rpartition("@")
+  host = hostname_from_netloc(hostport)
+
+  try:
+    port = components.port
+  except ValueError:
+    port = None
+    host = hostport.lower()                         # Invalid port -> Keep host & port as written.
+
+  if host and not hostport.startswith("["):
+    try:
+      host = host.encode("idna").decode("ascii")
+    except UnicodeError:
+      pass
+  elif hostport.startswith("["):
+    host = f"[{host}]"
+
+  netloc = f"{userinfo}@{host}" if userinfo else host
+  if port is not None and port != DEFAULT_PORTS.get(scheme):
+    netloc = f"{netloc}:{port}"
+
+  return netloc
+
+# Produce the canonical form of the URL-string -> Stable key for caches & deduplication.
+def canonicalize_url(url: str) -> str:
+  """
+  Canonicalize the URL-string, so equivalent spellings of one URL share a single key - Utility
+  method in Trotline finalised Data Pipeline. The scheme & host are lowercased, the host is
+  IDNA-encoded, default ports, tracking parameters and the fragment are removed, the
+  percent-encoding is normalized and the query parameters are sorted. URLs without a scheme stay
+  scheme-less. Features are always computed from the raw URL - never from this key.
+
+  Parameters
+  ----------
+  url : str
+    The raw URL-string.
+
+  Returns
+  -------
+  str
+    Canonical URL-string (fx. 'https://Example.com:443/login?b=2&a=1&utm_source=x' ->
+    'https://example.com/login?a=1&b=2'). URLs that cannot be split are returned stripped.
+  """
+  url = url.strip()
+  has_scheme = "://" in url
+
+  try:
+    components = urlsplit(url if has_scheme else f"//{url}")
+    scheme = components.scheme.lower()
+    netloc = canonicalize_netloc(components, scheme)
+  except ValueError:
+    return url
+
+  path = normalize_percent_encoding(components.path) or ("/" if netloc else "")
+
+  query_parameters = sorted(
+    normalize_percent_encoding(parameter)
+    for parameter in components.query.split("&")
+    if parameter and not is_tracking_parameter(normalize_percent_encoding(parameter.partition("=")[0]))
+  )
+  query = "&".join(query_parameters)
+
+  canonical_url = f"{scheme}://{netloc}{path}" if has_scheme else f"{netloc}{path}"
+  return f"{canonical_url}?{query}" if query else canonical_url
 
 # ----------------------------------------
 # PIPELINE URL-PARSING METHODS
@@ -47,7 +320,7 @@ def parse_url_and_handle_errors(url: str) -> Union[ParseResult, Dict[str, str |
 
 # Finalised Wrapper method for parsing, processing and formulating data related to the URL.
 # Returns a Python Dict-object with relevant data. 
-def final_url_parser(url: str) -> Dict[str, str | int | float]:
+def final_url_parser(url: str, parsed_url: Optional[ParsedURL] = None) -> Dict[str, str | int | float]:
   """
   Finalized parsing method used to parse suspected URL-string - split it into informative 
   subsections -, and extract section-related data for better model inference - Utility method
@@ -57,33 +330,101 @@ def final_url_parser(url: str) -> Dict[str, str | int | float]:
   ----------
   url : str
     Possibly scam URL-string to be parsed.
+  parsed_url : ParsedURL | None
+    Shared parsed view of the URL - parsed from the URL if omitted.
 
   Returns
   -------
   dict[str, str | int | float]
     A Python dictionary containing URL-related information. 
   """
-  # Handle URL errors and retrieve information.
-  parsed_url = parse_url_and_handle_errors(url=url)
+  if parsed_url is None:
+    parsed_url = parse_url(url=url)
 
-  # If the return values are NOT ParseReuslt -> Return the Dict.
-  if not isinstance(parsed_url, ParseResult):
-    return parsed_url
+  # If the URL could NOT be parsed -> Return 'None' values in dict.
+  if not parsed_url.is_valid:
+    return {
+      "url": url,
+      "length_hostname": None,
+      "length_path": None,
+      "length_query": None,
+      "is_https": None,
+      "nb_subdomains": None,
+      "contains_sus_domain_ext": None,
+    }
 
   # Extract the internal values to create Results-dict.
   parsed_hostname = parsed_url.netloc
-  parsed_path = parsed_url.path or ""
-  parsed_query = parsed_url.query or ""
 
   return {
       "url": url,
       "length_hostname": len(parsed_hostname),
-      "length_path": len(parsed_path),
-      "length_query": len(parsed_query),
-      "is_https": parsed_url.scheme.lower() == "https",
+      "length_path": len(parsed_url.path),
+      "length_query": len(parsed_url.query),
+      "is_https": parsed_url.scheme == "https",
       "nb_subdomains": num_of_subdomains(hostname=parsed_hostname),
-      "contains_sus_domain_ext": contains_suspicious_domain_extension(
-          domain=parsed_hostname,
-          extensions=suspicious_domain_extensions_set
-      )
-  }
\ No newline at end of file
+      # Scheme-less URLs have no netloc -> No extension check, as for the raw netloc.
+      "contains_sus_domain_ext": bool(parsed_hostname) and suspicious_extensions_matcher.matches(parsed_url.host)
+  }
+
+# Batch counterpart of 'final_url_parser' for entire URL collections.
+# Returns a pandas DataFrame-object with one row per URL.
+def final_url_parser_batch(
+    urls: pd.Series,
+    parsed_urls: Optional[Sequence[ParsedURL]] = None
+  ) -> pd.DataFrame:
+  """
+  Batch parsing method used to parse a collection of suspected URL-strings, and extract the
+  section-related data as whole columns - Utility method in Trotline finalised Data Pipeline.
+  URLs that cannot be parsed produce a row of missing values.
+
+  Parameters
+  ----------
+  urls : pandas.Series
+    Series of possibly scam URL-strings to be parsed.
+  parsed_urls : Sequence[ParsedURL] | None
+    Shared parsed views of the URLs (same order) - parsed from the URLs if omitted.
+
+  Returns
+  -------
+  pandas.DataFrame
+    DataFrame containing URL-related information - one row per URL, same index as the input.
+  """
+  # Parse every URL once -> Unparsable URLs are stored as missing values.
+  if parsed_urls is None:
+    parsed_urls = [parse_url(url=url) for url in urls]
+  parsed_urls = [parsed if parsed.is_valid else None for parsed in parsed_urls]
+
+  # Split the parsed sections into string columns.
+  hostnames = pd.Series(
+    [parsed.netloc if parsed else None for parsed in parsed_urls], index=urls.index, dtype=object
+  )
+  paths = pd.Series(
+    [(parsed.path or "") if parsed else None for parsed in parsed_urls], index=urls.index, dtype=object
+  )
+  queries = pd.Series(
+    [(parsed.query or "") if parsed else None for parsed in parsed_urls], index=urls.index, dtype=object
+  )
+  schemes = pd.Series(
+    [parsed.scheme if parsed else None for parsed in parsed_urls], index=urls.index, dtype=object
+  )
+
+  # Derive the length & count features using vectorized string operations.
+  return pd.DataFrame(
+    {
+      "length_hostname": hostnames.str.len(),
+      "length_path": paths.str.len(),
+      "length_query": queries.str.len(),
+      "is_https": schemes.str.lower().eq("https").where(schemes.notna()),
+      "nb_subdomains": hostnames.str.count(r"\.") - 1,
+      "contains_sus_domain_ext": pd.Series(
+        [
+          bool(parsed.netloc) and suspicious_extensions_matcher.matches(parsed.host) if parsed else None
+          for parsed in parsed_urls
+        ],
+        index=urls.index,
+        dtype=object
+      ),
+    },
+    index=urls.index
+  )
@@ -0,0 +1,414 @@
+# ----------------------------------------
+# IMPORTS
+# ----------------------------------------
+
+import numpy as np
+import hashlib
+import json
+import os
+import tempfile
+import time
+
+from pathlib import Path
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+from src.backend.pipeline.feature_schema import DEFAULT_FEATURE_SPECS, EXTENDED_FEATURE_SPECS, FeatureSchema
+from src.backend.pipeline.final_pipeline import finalised_data_pipeline_for_web
+from src.backend.pipeline.suffix_methods import PUBLIC_SUFFIX_LIST_PATH
+if TYPE_CHECKING:
+  from src.backend.pipeline.parallel_methods import ParallelPipelineExecutor
+
+# ----------------------------------------
+# FEATURE STORE CONFIGURATION
+# ----------------------------------------
+
+# Every numerical feature the Pipeline produces -> A model selects its own columns on load.
+STORE_FEATURE_SCHEMA = FeatureSchema(DEFAULT_FEATURE_SPECS + EXTENDED_FEATURE_SPECS)
+
+# Pipeline sources whose content decides the feature values -> Part of the store fingerprint.
+PIPELINE_SOURCE_MODULES = (
+  "character_methods.py",
+  "dataset.py",
+  "feature_registry.py",
+  "feature_schema.py",
+  "final_pipeline.py",
+  "helper_methods.py",
+  "matching_methods.py",
+  "parsing_methods.py",
+  "suffix_methods.py",
+  "whois_client_methods.py",
+  "whois_methods.py",
+)
+
+# Digest size of the URL keys -> 128 bits keep collisions negligible for any realistic corpus.
+URL_KEY_DTYPE = np.dtype("S16")
+
+# Row timestamps (UNIX seconds) used to detect stale rows.
+COMPUTED_AT_DTYPE = np.dtype("<f8")
+
+# Row flags marking a timed out or failed WHOIS lookup -> Recomputed by every update.
+WHOIS_INCOMPLETE_DTYPE = np.dtype("?")
+
+# URLs extracted & committed per step of an update -> Bounds the work lost on interruption.
+DEFAULT_STORE_CHUNK_SIZE = 10000
+
+# ----------------------------------------
+# FEATURE STORE HELPERS
+# ----------------------------------------
+
+# Fingerprint of the Pipeline version -> Changes whenever the feature code, datasets or suffix list change.
+def pipeline_fingerprint() -> str:
+  """
+  Hash the Pipeline sources, the bundled Public Suffix List and the feature specifications into a
+  short version fingerprint - Utility method in Trotline finalised Data Pipeline. Features stored
+  under one fingerprint are never mixed with those of another.
+
+  Returns
+  -------
+  str
+    16 hexadecimal characters identifying the Pipeline version.
+  """
+  digest = hashlib.sha256()
+  pipeline_directory = Path(__file__).parent
+
+  for module_name in PIPELINE_SOURCE_MODULES:
+    digest.update(module_name.encode("utf-8"))
+    digest.update((pipeline_directory / module_name).read_bytes())
+
+  digest.update(PUBLIC_SUFFIX_LIST_PATH.read_bytes())
+  digest.update(repr(STORE_FEATURE_SCHEMA.specs).encode("utf-8"))
+
+  return digest.hexdigest()[:16]
+
+# Hash URL-strings into fixed-width store keys.
+def hash_urls(urls: Iterable[str]) -> np.ndarray:
+  """
+  Hash each URL-string into a 16 byte BLAKE2b key - Utility method in Trotline finalised Data
+  Pipeline.
+
+  Parameters
+  ----------
+  urls : Iterable[str]
+    URL-strings to be hashed.
+
+  Returns
+  -------
+  numpy.ndarray
+    Array of 'S16' keys in input order.
+  """
+  keys = b"".join(
+    hashlib.blake2b(url.encode("utf-8", "surrogatepass"), digest_size=URL_KEY_DTYPE.itemsize).digest()
+    for url in urls
+  )
+
+  return np.frombuffer(keys, dtype=URL_KEY_DTYPE)
+
+# ----------------------------------------
+# FEATURE STORE
+# ----------------------------------------
+
+# Materialized, versioned feature rows -> Retraining reads features instead of recomputing them.
+class FeatureStore:
+  """
+  Columnar on-disk store of Pipeline feature rows keyed by URL hash, with one directory per Pipeline
+  fingerprint - Utility class in Trotline finalised Data Pipeline. Each feature column, the URL keys,
+  the row timestamps & WHOIS flags are raw little-endian files that are only ever appended to (or
+  refreshed in place), and a manifest records the number of committed rows. Reads are memory-mapped.
+  A store directory supports a single writer at a time.
+
+  Parameters
+  ----------
+  root : str | pathlib.Path
+    Directory holding the stores of every Pipeline version.
+  fingerprint : str | None
+    Pipeline version - the fingerprint of the current Pipeline if omitted.
+  """
+
+  def __init__(self, root: Union[str, Path], fingerprint: Optional[str] = None):
+    self.fingerprint = fingerprint or pipeline_fingerprint()
+    self.path = Path(root) / self.fingerprint
+    self.schema = STORE_FEATURE_SCHEMA
+    self.path.mkdir(parents=True, exist_ok=True)
+
+    manifest_path = self.path / "manifest.json"
+    if manifest_path.exists():
+      manifest = json.loads(manifest_path.read_text())
+      if tuple(manifest["columns"]) != self.schema.names:
+        raise ValueError(f"Feature store columns do not match the Pipeline - {self.path}")
+      self.rows = manifest["rows"]
+    else:
+      self.rows = 0
+      self._write_manifest()
+
+    self._sorted_keys: Optional[np.ndarray] = None
+    self._key_order: Optional[np.ndarray] = None
+
+  def __len__(self) -> int:
+    return self.rows
+
+  def __repr__(self) -> str:
+    return f"FeatureStore({self.fingerprint}, {self.rows} rows)"
+
+  def lookup(self, urls: Sequence[str]) -> np.ndarray:
+    """
+    Find the store row of every URL-string.
+
+    Parameters
+    ----------
+    urls : Sequence[str]
+      URL-strings to be looked up.
+
+    Returns
+    -------
+    numpy.ndarray
+      Row position per URL in input order - -1 for URLs not in the store.
+    """
+    return self._lookup_keys(hash_urls(urls))
+
+  def update(
+      self,
+      urls: Sequence[str],
+      max_age: Optional[float] = None,
+      executor: Optional["ParallelPipelineExecutor"] = None,
+      chunk_size: int = DEFAULT_STORE_CHUNK_SIZE
+    ) -> Dict[str, int]:
+    """
+    Extract & store the features of every URL not yet in the store, and recompute rows older than
+    'max_age' or whose WHOIS lookup timed out or failed. Work is committed chunk by chunk, so an
+    interrupted update keeps every completed chunk. URLs rejected by the Pipeline are stored as
+    rows of missing values.
+
+    Parameters
+    ----------
+    urls : Sequence[str]
+      Corpus URL-strings - duplicates are extracted once.
+    max_age : float | None
+      Age in seconds after which a stored row is recomputed - rows never expire if omitted.
+    executor : ParallelPipelineExecutor | None
+      Process pool for multi-core extraction - runs in-process if omitted.
+    chunk_size : int
+      URLs extracted & committed per step.
+
+    Returns
+    -------
+    dict[str, int]
+      Number of 'added' & 'refreshed' rows, and of those still 'whois_incomplete'.
+
+    Exceptions
+    ----------
+    ValueError
+      Raised if a URL is not of Type: str.
+    """
+    urls = list(urls)
+    for url in urls:
+      if not isinstance(url, str):
+        raise ValueError(f"URL must be of Type: str - Current type {type(url)}")
+
+    # Deduplicate by key -> Keep the first occurrence of every URL.
+    keys, first_positions = np.unique(hash_urls(urls), return_index=True)
+    input_order = np.argsort(first_positions)
+    keys, first_positions = keys[input_order], first_positions[input_order]
+    rows = self._lookup_keys(keys)
+
+    stale = np.zeros(len(rows), dtype=bool)
+    present = rows >= 0
+    if self.rows:
+      # Rows without WHOIS dates due to a failed lookup -> Retried until the lookup succeeds.
+      whois_incomplete = self._open_file("whois_incomplete", WHOIS_INCOMPLETE_DTYPE)
+      stale[present] = whois_incomplete[rows[present]]
+      del whois_incomplete
+
+      if max_age is not None:
+        computed_at = self._open_file("computed_at", COMPUTED_AT_DTYPE)
+        stale[present] |= computed_at[rows[present]] < time.time() - max_age
+        del computed_at
+
+    pending = np.flatnonzero(~present | stale)
+    counts = {"added": 0, "refreshed": 0, "whois_incomplete": 0}
+
+    for start in range(0, len(pending), chunk_size):
+      positions = pending[start:start + chunk_size]
+      features, whois_incomplete = self._extract([urls[first_positions[position]] for position in positions], executor)
+
+      is_new = rows[positions] < 0
+      self._refresh(rows[positions[~is_new]], features[~is_new], whois_incomplete[~is_new])
+      self._append(keys[positions[is_new]], features[is_new], whois_incomplete[is_new])
+
+      counts["added"] += int(is_new.sum())
+      counts["refreshed"] += int((~is_new).sum())
+      counts["whois_incomplete"] += int(whois_incomplete.sum())
+
+    return counts
+
+  def load_columns(self, columns: Optional[Sequence[str]] = None) -> Dict[str, np.ndarray]:
+    """
+    Memory-map the feature columns - Zero-copy, read-only.
+
+    Parameters
+    ----------
+    columns : Sequence[str] | None
+      Feature names to be mapped - every stored feature if omitted.
+
+    Returns
+    -------
+    dict[str, numpy.ndarray]
+      Column per feature name, in store row order.
+    """
+    return {name: self._open_file(self._column_name(name), self.schema.dtype) for name in columns or self.schema.names}
+
+  def load_matrix(self, urls: Optional[Sequence[str]] = None, columns: Optional[Sequence[str]] = None) -> np.ndarray:
+    """
+    Assemble a float32 training matrix from the memory-mapped columns.
+
+    Parameters
+    ----------
+    urls : Sequence[str] | None
+      URL-strings selecting (and ordering) the rows - every stored row if omitted.
+    columns : Sequence[str] | None
+      Feature names in model input order (fx. 'booster.feature_names') - every stored feature if omitted.
+
+    Returns
+    -------
+    numpy.ndarray
+      Matrix of shape (rows, columns), ready for 'xgboost.DMatrix'.
+
+    Exceptions
+    ----------
+    ValueError
+      Raised if a URL is not in the store - run 'update' first.
+    """
+    columns = list(columns or self.schema.names)
+    unknown_columns = [name for name in columns if name not in self.schema.index]
+    if unknown_columns:
+      raise ValueError(f"Features not produced by the Pipeline - {unknown_columns}")
+
+    rows = None
+    if urls is not None:
+      rows = self.lookup(urls)
+      if (rows < 0).any():
+        raise ValueError(f"{int((rows < 0).sum())} URLs are not in the feature store - run 'update' first")
+
+    matrix = np.empty((self.rows if rows is None else len(rows), len(columns)), dtype=self.schema.dtype)
+    for position, column in enumerate(self.load_columns(columns).values()):
+      matrix[:, position] = column if rows is None else column[rows]
+
+    return matrix
+
+  def stats(self) -> Dict[str, object]:
+    """
+    Retrieve the store size & location.
+
+    Returns
+    -------
+    dict[str, object]
+      Fingerprint, path, row, WHOIS-incomplete row & column counts and size on disk in bytes.
+    """
+    return {
+      "fingerprint": self.fingerprint,
+      "path": str(self.path),
+      "rows": self.rows,
+      "whois_incomplete": int(self._open_file("whois_incomplete", WHOIS_INCOMPLETE_DTYPE).sum()),
+      "columns": len(self.schema),
+      "bytes": sum(file.stat().st_size for file in self.path.iterdir() if file.is_file()),
+    }
+
+  def _column_name(self, name: str) -> str:
+    return f"feature.{name}"
+
+  def _open_file(self, name: str, dtype: np.dtype, mode: str = "r") -> np.ndarray:
+    # Only committed rows are mapped -> Bytes of an interrupted append are ignored.
+    if not self.rows:
+      return np.empty(0, dtype=dtype)
+    return np.memmap(self.path / f"{name}.bin", dtype=dtype, mode=mode, shape=(self.rows,))
+
+  def _lookup_keys(self, keys: np.ndarray) -> np.ndarray:
+    if not self.rows or not len(keys):
+      return np.full(len(keys), -1, dtype=np.int64)
+
+    # Sorted key index -> Built once per store instance, kept up to date by '_append'.
+    if self._sorted_keys is None:
+      stored_keys = np.array(self._open_file("keys", URL_KEY_DTYPE))
+      self._key_order = np.argsort(stored_keys, kind="stable")
+      self._sorted_keys = stored_keys[self._key_order]
+
+    positions = np.searchsorted(self._sorted_keys, keys).clip(max=self.rows - 1)
+    found = self._sorted_keys[positions] == keys
+
+    return np.where(found, self._key_order[positions], -1)
+
+  def _extract(self, urls: List[str], executor: Optional["ParallelPipelineExecutor"]) -> Tuple[np.ndarray, np.ndarray]:
+    if executor is not None:
+      features, whois_complete = executor.extract_matrix(urls, schema=self.schema, return_whois_complete=True)
+      return features, ~whois_complete
+
+    features = self.schema.new_matrix(len(urls))
+    whois_incomplete = np.zeros(len(urls), dtype=WHOIS_INCOMPLETE_DTYPE)
+    for row, url in enumerate(urls):
+      try:
+        _, whois_complete = finalised_data_pipeline_for_web(
+          url, schema=self.schema, out=features[row], return_whois_complete=True
+        )
+      except ValueError:
+        continue
+      whois_incomplete[row] = not whois_complete
+
+    return features, whois_incomplete
+
+  def _append(self, keys: np.ndarray, features: np.ndarray, whois_incomplete: np.ndarray) -> None:
+    if not len(keys):
+      return
+
+    blocks = {
+      "keys": keys,
+      "computed_at": np.full(len(keys), time.time(), dtype=COMPUTED_AT_DTYPE),
+      "whois_incomplete": whois_incomplete.astype(WHOIS_INCOMPLETE_DTYPE),
+    }
+    for position, name in enumerate(self.schema.names):
+      blocks[self._column_name(name)] = np.ascontiguousarray(features[:, position])
+
+    # Append behind the committed rows -> Discards the leftovers of an interrupted append first.
+    for name, block in blocks.items():
+      with open(self.path / f"{name}.bin", "ab") as column_file:
+        column_file.truncate(self.rows * block.itemsize)
+        column_file.write(block.tobytes())
+        column_file.flush()
+        os.fsync(column_file.fileno())
+
+    # Commit -> The manifest only moves once every column holds the new rows.
+    self.rows += len(keys)
+    self._write_manifest()
+    self._sorted_keys = None
+    self._key_order = None
+
+  def _refresh(self, rows: np.ndarray, features: np.ndarray, whois_incomplete: np.ndarray) -> None:
+    if not len(rows):
+      return
+
+    for position, name in enumerate(self.schema.names):
+      column = self._open_file(self._column_name(name), self.schema.dtype, mode="r+")
+      column[rows] = features[:, position]
+      column.flush()
+      del column
+
+    computed_at = self._open_file("computed_at", COMPUTED_AT_DTYPE, mode="r+")
+    computed_at[rows] = time.time()
+    computed_at.flush()
+    del computed_at
+
+    whois_flags = self._open_file("whois_incomplete", WHOIS_INCOMPLETE_DTYPE, mode="r+")
+    whois_flags[rows] = whois_incomplete
+    whois_flags.flush()
+    del whois_flags
+
+  def _write_manifest(self) -> None:
+    manifest = {
+      "fingerprint": self.fingerprint,
+      "columns": list(self.schema.names),
+      "dtype": np.dtype(self.schema.dtype).str,
+      "rows": self.rows,
+    }
+
+    file_descriptor, temporary_name = tempfile.mkstemp(dir=self.path, suffix=".part")
+    with os.fdopen(file_descriptor, "w") as manifest_file:
+      json.dump(manifest, manifest_file)
+    os.replace(temporary_name, self.path / "manifest.json")
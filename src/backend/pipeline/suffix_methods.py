@@ -0,0 +1,101 @@
+# ----------------------------------------
+# IMPORTS
+# ----------------------------------------
+
+import tldextract as tld
+import requests
+import os
+import sys
+
+from pathlib import Path
+from typing import Optional
+
+# ----------------------------------------
+# PIPELINE PUBLIC SUFFIX LIST
+# ----------------------------------------
+
+# Pinned Public Suffix List snapshot shipped with the Pipeline -> Never fetched at runtime.
+PUBLIC_SUFFIX_LIST_PATH = Path(__file__).parent / "data" / "public_suffix_list.dat"
+PUBLIC_SUFFIX_LIST_URL = "https://publicsuffix.org/list/public_suffix_list.dat"
+
+# Shared suffix extractor -> Built once, at application startup or on first use.
+_tld_extractor: Optional[tld.TLDExtract] = None
+
+# Retrieve (or build) the offline suffix extractor.
+def get_tld_extractor() -> tld.TLDExtract:
+  """
+  Retrieve the process-wide tldextract extractor, building it on first use from the bundled Public
+  Suffix List snapshot - Utility method in Trotline finalised Data Pipeline. No network requests
+  are made and no disk cache is written.
+
+  Returns
+  -------
+  tldextract.TLDExtract
+    Extractor backed by the bundled suffix list.
+  """
+  global _tld_extractor
+
+  if _tld_extractor is None:
+    _tld_extractor = tld.TLDExtract(
+      suffix_list_urls=(PUBLIC_SUFFIX_LIST_PATH.as_uri(),),
+      cache_dir=None,
+      fallback_to_snapshot=False
+    )
+
+  return _tld_extractor
+
+# Build the extractor & load the suffix list ahead of the first request.
+def warm_tld_extractor() -> tld.TLDExtract:
+  """
+  Build the suffix extractor and force the bundled suffix list to be parsed, so the first
+  extraction does not pay the initialization cost - Called on application startup.
+
+  Returns
+  -------
+  tldextract.TLDExtract
+    The warmed-up extractor.
+  """
+  tld_extractor = get_tld_extractor()
+  tld_extractor("warmup.example.com")
+
+  return tld_extractor
+
+# Replace the bundled snapshot with the latest published Public Suffix List -> Build step.
+def refresh_public_suffix_list(url: str = PUBLIC_SUFFIX_LIST_URL, path: Path = PUBLIC_SUFFIX_LIST_PATH) -> Path:
+  """
+  Download the latest Public Suffix List and atomically replace the bundled snapshot. Intended to
+  be run as a build step - 'python -m src.backend.pipeline.suffix_methods' - never at runtime.
+
+  Parameters
+  ----------
+  url : str
+    Location of the published Public Suffix List.
+  path : pathlib.Path
+    Location of the bundled snapshot to be replaced.
+
+  Returns
+  -------
+  pathlib.Path
+    Location of the refreshed snapshot.
+
+  Exceptions
+  ----------
+  ValueError
+    Raised if the downloaded document does not look like a Public Suffix List.
+  """
+  response = requests.get(url, timeout=30)
+  response.raise_for_status()
+
+  # Sanity check -> Refuse to replace the snapshot with an error page or truncated download.
+  if "===BEGIN ICANN DOMAINS===" not in response.text or "===END PRIVATE DOMAINS===" not in response.text:
+    raise ValueError(f"Downloaded document is not a complete Public Suffix List - {url}")
+
+  temporary_path = path.with_suffix(".tmp")
+  temporary_path.write_text(response.text, encoding="utf-8")
+  os.replace(temporary_path, path)
+
+  return path
+
+if __name__ == "__main__":
+  refreshed_path = refresh_public_suffix_list(*sys.argv[1:2])
+  print(f"Public Suffix List snapshot refreshed -> {refreshed_path}", file=sys.stderr)
@@ -0,0 +1,522 @@
+# ----------------------------------------
+# IMPORTS
+# ----------------------------------------
+
+import asyncio
+import os
+import re
+import threading
+import weakref
+
+from concurrent.futures import Future
+from dateutil import parser as date_parser
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Mapping, Optional
+from whois.exceptions import FailedParsingWhoisOutputError, WhoisDomainNotFoundError
+
+from src.backend.pipeline.dataset import whois_query_formats_dict, whois_servers_dict
+
+# ----------------------------------------
+# NATIVE WHOIS CLIENT CONSTANTS
+# ----------------------------------------
+
+# Root WHOIS server -> Refers to the registry of any top-level domain missing from the server map.
+IANA_WHOIS_SERVER = "whois.iana.org"
+
+# Standard WHOIS port (RFC 3912).
+WHOIS_PORT = 43
+
+# Upper bound on a single WHOIS response -> Guards against misbehaving servers.
+MAX_RESPONSE_BYTES = 256 * 1024
+
+# Keys (lowercase, without trailing dots) that carry the registration & expiration dates.
+CREATION_DATE_KEYS = frozenset({
+  "creation date", "created", "created on", "created date", "registered", "registered on",
+  "registration date", "registration time", "domain registration date", "domain record activated",
+  "commencement date", "domain name commencement date",
+})
+EXPIRATION_DATE_KEYS = frozenset({
+  "registry expiry date", "registrar registration expiration date", "expiration date", "expiry date",
+  "expires", "expires on", "expire date", "expiration time", "paid-till", "renewal date",
+  "domain expiration date", "record expires on",
+})
+
+# 'key: value' lines of a WHOIS response -> Keys may be padded with dots (fx. 'Created on.....:').
+RESPONSE_FIELD_PATTERN = re.compile(r"^\s*([A-Za-z][A-Za-z \-]*?)[\s.]*:\s*(.+?)\s*$", re.MULTILINE)
+
+# Referral to a more specific WHOIS server (IANA 'refer', thin registry 'Registrar WHOIS Server').
+REFERRAL_PATTERN = re.compile(
+  r"^\s*(?:refer|whois|whois server|registrar whois server|referralserver)\s*:\s*(?:r?whois://)?([A-Za-z0-9.\-]+)",
+  re.IGNORECASE | re.MULTILINE
+)
+
+# Responses stating that the domain is not registered -> Registry phrases at the start of a line
+# (after comment markers), so field values & disclaimers mentioning 'not found' never match.
+NOT_FOUND_PATTERN = re.compile(
+  r"^[%#>\s]*(?:error:\d+:\s*)?(?:no match for|no matching objects? found|no data found|no entries found|"
+  r"no object found|domain not found|not found\.?\s*$|status:\s*(?:free|available)\s*$)",
+  re.IGNORECASE | re.MULTILINE
+)
+
+# Timezone names registries append to dates -> Never resolved to the local timezone.
+WHOIS_TIMEZONES = {"UTC": timezone.utc, "GMT": timezone.utc, "Z": timezone.utc}
+
+# Fixed date layouts tried before the general date parser.
+DATE_FORMATS = ("%d-%b-%Y", "%Y.%m.%d", "%Y/%m/%d", "%d.%m.%Y", "%Y.%m.%d %H:%M:%S", "%d/%m/%Y")
+
+# ----------------------------------------
+# NATIVE WHOIS RESPONSE PARSING
+# ----------------------------------------
+
+# Convert a WHOIS date value into a datetime-object.
+def parse_whois_date(value: str) -> Optional[datetime]:
+  """
+  Parse a registry date value - ISO 8601, the common fixed layouts, or anything the general date
+  parser understands - Utility method in Trotline finalised Data Pipeline.
+
+  Parameters
+  ----------
+  value : str
+    Date value of a WHOIS response field.
+
+  Returns
+  -------
+  datetime | None
+    Parsed datetime (naive if the registry omits the timezone) - None if the value is not a date.
+  """
+  value = value.strip()
+
+  try:
+    return datetime.fromisoformat(value)
+  except ValueError:
+    pass
+
+  for date_format in DATE_FORMATS:
+    try:
+      return datetime.strptime(value, date_format)
+    except ValueError:
+      continue
+
+  try:
+    return date_parser.parse(value, tzinfos=WHOIS_TIMEZONES)
+  except (ValueError, OverflowError):
+    return None
+
+# Extract the registration & expiration dates from a WHOIS response.
+def parse_whois_response(response: str) -> Dict[str, Optional[datetime]]:
+  """
+  Find the first registration & expiration date fields of a WHOIS response - Utility method in
+  Trotline finalised Data Pipeline.
+
+  Parameters
+  ----------
+  response : str
+    Decoded WHOIS response.
+
+  Returns
+  -------
+  dict[str, datetime | None]
+    'creation_date' & 'expiration_date' - the same keys as a 'python-whois' record.
+  """
+  record: Dict[str, Optional[datetime]] = {"creation_date": None, "expiration_date": None}
+
+  for key, value in RESPONSE_FIELD_PATTERN.findall(response):
+    key = key.strip().lower()
+    if key in CREATION_DATE_KEYS and record["creation_date"] is None:
+      record["creation_date"] = parse_whois_date(value)
+    elif key in EXPIRATION_DATE_KEYS and record["expiration_date"] is None:
+      record["expiration_date"] = parse_whois_date(value)
+
+  return record
+
+# Find the WHOIS server a response refers the query to.
+def find_whois_referral(response: str, current_server: str) -> Optional[str]:
+  """
+  Find a referral to another WHOIS server in the response - Utility method in Trotline finalised
+  Data Pipeline.
+
+  Parameters
+  ----------
+  response : str
+    Decoded WHOIS response.
+  current_server : str
+    Server that produced the response - never referred to again.
+
+  Returns
+  -------
+  str | None
+    Hostname of the referred server - None if the response holds no referral.
+  """
+  for server in REFERRAL_PATTERN.findall(response):
+    server = server.strip(".").lower()
+    if server and server != current_server.lower():
+      return server
+
+  return None
+
+# ----------------------------------------
+# NATIVE WHOIS CLIENT
+# ----------------------------------------
+
+# Asyncio port-43 WHOIS client -> Thousands of lookups in flight on one event loop.
+class AsyncWhoisClient:
+  """
+  Non-blocking WHOIS client speaking the port-43 protocol directly - Utility class in Trotline
+  finalised Data Pipeline. Servers are taken from the bundled TLD map (IANA for the rest) and
+  referrals are followed until the registration dates are found. Connections are limited per
+  server and in total, and every lookup is bounded by a deadline.
+  A client belongs to the event loop it is first used on.
+
+  Parameters
+  ----------
+  servers : Mapping[str, str]
+    WHOIS server per top-level (or multi-label) domain suffix.
+  query_formats : Mapping[str, str]
+    Query syntax per server - the bare domain for servers not listed.
+  per_server_limit : int
+    Maximum concurrent connections to a single server.
+  max_connections : int
+    Maximum concurrent connections overall.
+  deadline : float
+    Seconds a complete lookup, referrals included, may take.
+  max_referrals : int
+    Maximum number of referrals followed per lookup.
+  port : int
+    WHOIS port - fx. the port of a local stand-in server.
+  fallback_server : str
+    Server asked for top-level domains missing from the server map.
+  """
+
+  def __init__(
+      self,
+      servers: Mapping[str, str] = whois_servers_dict,
+      query_formats: Mapping[str, str] = whois_query_formats_dict,
+      per_server_limit: int = 4,
+      max_connections: int = 1024,
+      deadline: float = 2.0,
+      max_referrals: int = 2,
+      port: int = WHOIS_PORT,
+      fallback_server: str = IANA_WHOIS_SERVER
+    ):
+    self.servers = dict(servers)
+    self.query_formats = dict(query_formats)
+    self.per_server_limit = per_server_limit
+    self.deadline = deadline
+    self.max_referrals = max_referrals
+    self.port = port
+    self.fallback_server = fallback_server
+    self.max_suffix_labels = max((suffix.count(".") + 1 for suffix in self.servers), default=1)
+
+    self._connections = asyncio.Semaphore(max_connections)
+    self._server_limits: Dict[str, asyncio.Semaphore] = {}
+
+  def server_for(self, domain: str) -> str:
+    """
+    WHOIS server responsible for the domain - the longest matching suffix of the server map.
+
+    Parameters
+    ----------
+    domain : str
+      Registered domain (ASCII).
+
+    Returns
+    -------
+    str
+      Hostname of the WHOIS server.
+    """
+    labels = domain.lower().rstrip(".").split(".")
+
+    for label_count in range(min(self.max_suffix_labels, len(labels) - 1), 0, -1):
+      server = self.servers.get(".".join(labels[-label_count:]))
+      if server:
+        return server
+
+    return self.fallback_server
+
+  async def query(self, server: str, text: str) -> str:
+    """
+    Send one query to a WHOIS server and read the complete response.
+
+    Parameters
+    ----------
+    server : str
+      Hostname of the WHOIS server.
+    text : str
+      Query line (without line terminator).
+
+    Returns
+    -------
+    str
+      Decoded response - undecodable bytes are replaced.
+    """
+    server_limit = self._server_limits.get(server)
+    if server_limit is None:
+      server_limit = self._server_limits[server] = asyncio.Semaphore(self.per_server_limit)
+
+    async with self._connections, server_limit:
+      reader, writer = await asyncio.open_connection(server, self.port)
+      try:
+        writer.write(text.encode("ascii") + b"\r\n")
+        await writer.drain()
+
+        chunks: List[bytes] = []
+        received = 0
+        while received < MAX_RESPONSE_BYTES:
+          chunk = await reader.read(65536)
+          if not chunk:
+            break
+          chunks.append(chunk)
+          received += len(chunk)
+      finally:
+        writer.close()
+
+    return b"".join(chunks).decode("utf-8", errors="replace")
+
+  async def lookup(self, domain: str) -> Dict[str, Any]:
+    """
+    Look up the registration record of a domain, following referrals until both dates are found.
+
+    Parameters
+    ----------
+    domain : str
+      Registered domain (domain + public suffix) - internationalised domains are IDNA-encoded.
+
+    Returns
+    -------
+    dict[str, Any]
+      'creation_date' & 'expiration_date' (None if not published) and the answering 'whois_server'.
+
+    Exceptions
+    ----------
+    WhoisDomainNotFoundError
+      Raised if the registry reports the domain as not registered.
+    FailedParsingWhoisOutputError
+      Raised if no response holds a registration or expiration date.
+    TimeoutError
+      Raised if the lookup exceeds the deadline.
+    UnicodeError
+      Raised if the domain cannot be IDNA-encoded.
+    OSError
+      Raised on connection failures.
+    """
+    ascii_domain = domain.encode("idna").decode("ascii")
+    server = self.server_for(ascii_domain)
+    record: Dict[str, Any] = {"creation_date": None, "expiration_date": None, "whois_server": server}
+
+    async with asyncio.timeout(self.deadline):
+      for _ in range(self.max_referrals + 1):
+        query_format = self.query_formats.get(server, "{domain}")
+        response = await self.query(server, query_format.format(domain=ascii_domain))
+
+        # The IANA root only refers -> Its own 'created' field belongs to the TLD.
+        if server != self.fallback_server:
+          if NOT_FOUND_PATTERN.search(response) and record["creation_date"] is None:
+            raise WhoisDomainNotFoundError(f"No match for {ascii_domain} at {server}")
+
+          # Keep the dates already found -> A registrar only fills the gaps of its registry.
+          for key, value in parse_whois_response(response).items():
+            if record[key] is None:
+              record[key] = value
+          record["whois_server"] = server
+
+          if record["creation_date"] is not None and record["expiration_date"] is not None:
+            break
+
+        referral = find_whois_referral(response, server)
+        if referral is None:
+          break
+        server = referral
+
+    # No registry answer the dates could be read from -> A failure, never a missing record.
+    if record["creation_date"] is None and record["expiration_date"] is None:
+      raise FailedParsingWhoisOutputError(f"No registration dates for {ascii_domain} at {record['whois_server']}")
+
+    return record
+
+  async def lookup_many(self, domains: List[str]) -> List[Any]:
+    """
+    Look up many domains concurrently.
+
+    Parameters
+    ----------
+    domains : list[str]
+      Registered domains to be looked up.
+
+    Returns
+    -------
+    list[Any]
+      Record per domain in input order - the raised exception for failed lookups.
+    """
+    return await asyncio.gather(*(self.lookup(domain) for domain in domains), return_exceptions=True)
+
+# ----------------------------------------
+# NATIVE WHOIS CLIENT RUNNER
+# ----------------------------------------
+
+# Event loop thread hosting the native client -> Lets thread-based callers submit lookups.
+class WhoisClientRunner:
+  """
+  Background thread running an event loop with a native WHOIS client, so thread-based Pipeline
+  callers can submit lookups without blocking a thread per query - Utility class in Trotline
+  finalised Data Pipeline.
+
+  Parameters
+  ----------
+  **client_options : Any
+    Options passed to 'AsyncWhoisClient'.
+  """
+
+  def __init__(self, **client_options: Any):
+    self._loop = asyncio.new_event_loop()
+    self._thread = threading.Thread(target=self._loop.run_forever, name="trotline-whois-client", daemon=True)
+    self._thread.start()
+
+    async def build_client() -> AsyncWhoisClient:
+      return AsyncWhoisClient(**client_options)
+
+    self.client = asyncio.run_coroutine_threadsafe(build_client(), self._loop).result()
+
+  def submit(self, domain: str) -> Future:
+    """
+    Start a lookup on the client event loop.
+
+    Parameters
+    ----------
+    domain : str
+      Registered domain to be looked up.
+
+    Returns
+    -------
+    concurrent.futures.Future
+      Future of the lookup record (see 'AsyncWhoisClient.lookup').
+    """
+    return asyncio.run_coroutine_threadsafe(self.client.lookup(domain), self._loop)
+
+  def close(self) -> None:
+    """
+    Stop the event loop & its thread - lookups in flight are abandoned.
+    """
+    self._loop.call_soon_threadsafe(self._loop.stop)
+    self._thread.join(timeout=1)
+
+# Deadline of a single lookup -> Resolved lazily from the environment.
+_whois_query_deadline: Optional[float] = None
+
+# Read the deadline bounding a single WHOIS lookup.
+def get_whois_query_deadline() -> float:
+  """
+  Retrieve the seconds a single WHOIS lookup, referrals included, may take - read from the
+  'WHOIS_QUERY_DEADLINE_MS' environment variable on first use (default 2000) - Utility method in
+  Trotline finalised Data Pipeline.
+
+  Returns
+  -------
+  float
+    Lookup deadline in seconds.
+  """
+  global _whois_query_deadline
+
+  if _whois_query_deadline is None:
+    _whois_query_deadline = float(os.getenv("WHOIS_QUERY_DEADLINE_MS", "2000")) / 1000
+
+  return _whois_query_deadline
+
+# Shared client runner -> Built lazily so environment variables are read after startup.
+_whois_client_runner: Optional[WhoisClientRunner] = None
+_whois_client_runner_lock = threading.Lock()
+
+# Native clients of the event loops awaiting lookups directly -> Released with their loop.
+_loop_whois_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, AsyncWhoisClient]" = weakref.WeakKeyDictionary()
+
+# Read the native WHOIS client options.
+def get_whois_client_options() -> Dict[str, Any]:
+  """
+  Retrieve the options of the native WHOIS client from environment variables - Utility method in
+  Trotline finalised Data Pipeline.
+
+  Environment
+  -----------
+  WHOIS_SERVER_CONCURRENCY : int
+    Maximum concurrent connections per WHOIS server (default 4).
+  WHOIS_MAX_CONNECTIONS : int
+    Maximum concurrent WHOIS connections overall (default 1024).
+  WHOIS_QUERY_DEADLINE_MS : float
+    Milliseconds a lookup, referrals included, may take (default 2000).
+
+  Returns
+  -------
+  dict[str, Any]
+    Options passed to 'AsyncWhoisClient'.
+  """
+  return {
+    "per_server_limit": int(os.getenv("WHOIS_SERVER_CONCURRENCY", "4")),
+    "max_connections": int(os.getenv("WHOIS_MAX_CONNECTIONS", "1024")),
+    "deadline": get_whois_query_deadline(),
+  }
+
+# Retrieve (or build) the native WHOIS client runner.
+def get_whois_client_runner() -> WhoisClientRunner:
+  """
+  Retrieve the process-wide native WHOIS client for thread-based callers, building it on first
+  use with 'get_whois_client_options' - Utility method in Trotline finalised Data Pipeline.
+
+  Returns
+  -------
+  WhoisClientRunner
+    The running native client.
+  """
+  global _whois_client_runner
+
+  with _whois_client_runner_lock:
+    if _whois_client_runner is None:
+      _whois_client_runner = WhoisClientRunner(**get_whois_client_options())
+
+  return _whois_client_runner
+
+# Retrieve (or build) the native WHOIS client of the running event loop.
+def get_async_whois_client() -> AsyncWhoisClient:
+  """
+  Retrieve the native WHOIS client of the running event loop, building it on first use with
+  'get_whois_client_options' - Utility method in Trotline finalised Data Pipeline. Lookups are
+  awaited on the calling loop itself, without a thread in between.
+
+  Returns
+  -------
+  AsyncWhoisClient
+    Native client bound to the running event loop.
+
+  Exceptions
+  ----------
+  RuntimeError
+    Raised if called outside of a running event loop.
+  """
+  loop = asyncio.get_running_loop()
+
+  client = _loop_whois_clients.get(loop)
+  if client is None:
+    client = _loop_whois_clients[loop] = AsyncWhoisClient(**get_whois_client_options())
+
+  return client
+
+# Stop the native WHOIS client -> Called on application shutdown.
+def shutdown_whois_client() -> None:
+  """
+  Stop the native WHOIS client runner if it was started - Utility method in Trotline finalised
+  Data Pipeline.
+  """
+  global _whois_client_runner
+
+  with _whois_client_runner_lock:
+    if _whois_client_runner is not None:
+      _whois_client_runner.close()
+      _whois_client_runner = None
+
+# Forked workers start without the client thread of the parent process.
+def _reset_whois_client_after_fork() -> None:
+  global _whois_client_runner, _whois_client_runner_lock
+
+  _whois_client_runner = None
+  _whois_client_runner_lock = threading.Lock()
+  _loop_whois_clients.clear()
+
+os.register_at_fork(after_in_child=_reset_whois_client_after_fork)
@@ -2,17 +2,570 @@
 # IMPORTS
 # ----------------------------------------
 
-import tldextract as tld
 import whois
-import datetime
+import asyncio
+import os
+import threading
 
-from tldextract import ExtractResult
-from datetime import timezone
-from typing import Optional, Union, Dict, Tuple
-from whois.exceptions import WhoisError, WhoisCommandFailedError, WhoisDomainNotFoundError
+from concurrent.futures import Future, ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from datetime import datetime, timezone
+from typing import List, Optional, Set, Union, Dict, Tuple
+from whois.exceptions import WhoisError, WhoisDomainNotFoundError
 
-from src.backend.pipeline.helper_methods import extract_hostname, is_domain_typosquatted
-from src.backend.pipeline.dataset import typosquatted_domains_set
+from src.backend.pipeline.helper_methods import find_typosquatted_brand, typosquatted_domains_index
+from src.backend.pipeline.parsing_methods import ParsedURL, parse_url
+from src.backend.pipeline.cache_methods import TieredTTLCache
+from src.backend.pipeline.whois_client_methods import (
+  get_async_whois_client,
+  get_whois_client_runner,
+  get_whois_query_deadline,
+  shutdown_whois_client
+)
+from src.backend.pipeline.metrics_methods import record_whois_outcome, record_whois_wait, time_stage
+
+# ----------------------------------------
+# PIPELINE WHOIS CACHE
+# ----------------------------------------
+
+# Shared WHOIS cache instance -> Built lazily so environment variables are read after startup.
+_whois_cache: Optional[TieredTTLCache] = None
+
+# Retrieve (or build) the WHOIS cache keyed by registered domain.
+def get_whois_cache() -> TieredTTLCache:
+  """
+  Retrieve the process-wide WHOIS cache, building it on first use from environment variables -
+  Utility method in Trotline finalised Data Pipeline.
+
+  Environment
+  -----------
+  WHOIS_CACHE_SIZE : int
+    Maximum number of registered domains held in-process (default 50000).
+  WHOIS_CACHE_TTL : float
+    Seconds a successful lookup is reused (default 86400 - one day).
+  WHOIS_CACHE_NEGATIVE_TTL : float
+    Seconds a failed lookup - (None, None) - is reused (default 900).
+  REDIS_URL : str
+    Optional Redis connection URL for the tier shared between workers.
+  REDIS_TIMEOUT_MS : float
+    Milliseconds a Redis call may take before it counts as a miss (default 250).
+
+  Returns
+  -------
+  TieredTTLCache
+    The WHOIS cache instance.
+  """
+  global _whois_cache
+
+  if _whois_cache is None:
+    _whois_cache = TieredTTLCache(
+      namespace="whois",
+      max_size=int(os.getenv("WHOIS_CACHE_SIZE", "50000")),
+      ttl=float(os.getenv("WHOIS_CACHE_TTL", "86400")),
+      negative_ttl=float(os.getenv("WHOIS_CACHE_NEGATIVE_TTL", "900")),
+      redis_url=os.getenv("REDIS_URL"),
+      redis_timeout=float(os.getenv("REDIS_TIMEOUT_MS", "250")) / 1000
+    )
+
+  return _whois_cache
+
+# ----------------------------------------
+# PIPELINE WHOIS LATENCY BUDGET
+# ----------------------------------------
+
+# Missing WHOIS dates of a lookup that has not completed -> Told apart from the (None, None) of a
+# domain without WHOIS record, so results computed without them are not reused for long.
+class IncompleteWhoisDates(tuple):
+  """
+  (None, None) WHOIS dates returned in place of a lookup that has not completed - Utility class in
+  Trotline finalised Data Pipeline. Behaves like any other pair of missing dates.
+  """
+  __slots__ = ()
+
+# Returned when the latency budget ran out -> The lookup completes in the background.
+WHOIS_DATES_PENDING = IncompleteWhoisDates((None, None))
+
+# Returned when the lookup timed out or failed -> Worth repeating once the negative TTL expired.
+WHOIS_DATES_FAILED = IncompleteWhoisDates((None, None))
+
+# Check whether WHOIS dates come from a completed lookup.
+def is_whois_complete(whois_dates: Tuple[int | None, int | None]) -> bool:
+  """
+  Check whether the WHOIS dates are the result of a completed lookup - Utility method in Trotline
+  finalised Data Pipeline.
+
+  Parameters
+  ----------
+  whois_dates : tuple[int | None, int | None]
+    WHOIS dates returned by 'get_whois_info'.
+
+  Returns
+  -------
+  bool
+    Returns False if the dates are missing because the lookup has not completed or failed.
+  """
+  return not isinstance(whois_dates, IncompleteWhoisDates)
+
+# Encode WHOIS dates as a WHOIS cache entry -> Failed lookups keep a marker.
+def to_whois_cache_entry(whois_dates: Tuple[int | None, int | None]) -> List[Union[int, str, None]]:
+  """
+  Convert WHOIS dates into a JSON-serialisable WHOIS cache entry - Utility method in Trotline
+  finalised Data Pipeline. Failed lookups carry a third 'failed' element, so a cached failure is
+  still told apart from a domain without WHOIS record.
+
+  Parameters
+  ----------
+  whois_dates : tuple[int | None, int | None]
+    WHOIS dates returned by 'lookup_whois_dates'.
+
+  Returns
+  -------
+  list[int | str | None]
+    Cache entry of the dates.
+  """
+  if is_whois_complete(whois_dates):
+    return list(whois_dates)
+
+  return [None, None, "failed"]
+
+# Decode a WHOIS cache entry into WHOIS dates.
+def from_whois_cache_entry(entry: List[Union[int, str, None]]) -> Tuple[int | None, int | None]:
+  """
+  Convert a WHOIS cache entry back into WHOIS dates - Utility method in Trotline finalised Data
+  Pipeline.
+
+  Parameters
+  ----------
+  entry : list[int | str | None]
+    Cache entry written by 'to_whois_cache_entry'.
+
+  Returns
+  -------
+  tuple[int | None, int | None]
+    The WHOIS dates - 'WHOIS_DATES_FAILED' for cached failures.
+  """
+  if len(entry) > 2:
+    return WHOIS_DATES_FAILED
+
+  return tuple(entry)
+
+# Latency budget & hedge delay of request-path lookups -> Resolved lazily from environment variables.
+_whois_budget_settings: Optional[Tuple[Optional[float], Optional[float]]] = None
+
+# Selected WHOIS client ('python-whois' or the native 'asyncio' client) -> Resolved lazily.
+_whois_client_name: Optional[str] = None
+
+# Background executor running live lookups -> Keeps running after a request stops waiting.
+_whois_lookup_executor: Optional[ThreadPoolExecutor] = None
+
+# Live lookups in flight per registered domain -> Concurrent requests share a single lookup.
+_whois_lookups: Dict[str, "WhoisLookup"] = {}
+_whois_lookups_lock = threading.Lock()
+
+# Native queries running on request event loops -> Referenced until done (loops hold tasks weakly).
+_whois_query_tasks: Set["asyncio.Task[None]"] = set()
+
+# Forked workers (fx. the parallel executor) start without the lookups of the parent process.
+def _reset_whois_lookups_after_fork() -> None:
+  global _whois_lookups_lock, _whois_lookup_executor
+
+  _whois_lookups.clear()
+  _whois_lookups_lock = threading.Lock()
+  _whois_lookup_executor = None
+  _whois_query_tasks.clear()
+
+os.register_at_fork(after_in_child=_reset_whois_lookups_after_fork)
+
+# Read the request-path WHOIS budget settings.
+def get_whois_budget_settings() -> Tuple[Optional[float], Optional[float]]:
+  """
+  Retrieve the latency budget & hedge delay applied to WHOIS lookups on the request path, reading
+  the environment variables on first use - Utility method in Trotline finalised Data Pipeline.
+
+  Environment
+  -----------
+  WHOIS_LATENCY_BUDGET_MS : float
+    Milliseconds a request waits for an uncached lookup (default 500) - 0 waits for completion.
+  WHOIS_HEDGE_DELAY_MS : float
+    Milliseconds after which a second query for the same domain is sent (default 0 - disabled).
+
+  Returns
+  -------
+  tuple[float | None, float | None]
+    Latency budget & hedge delay in seconds - None if disabled.
+  """
+  global _whois_budget_settings
+
+  if _whois_budget_settings is None:
+    budget = float(os.getenv("WHOIS_LATENCY_BUDGET_MS", "500")) / 1000
+    hedge_delay = float(os.getenv("WHOIS_HEDGE_DELAY_MS", "0")) / 1000
+    _whois_budget_settings = (budget if budget > 0 else None, hedge_delay if hedge_delay > 0 else None)
+
+  return _whois_budget_settings
+
+# Read which WHOIS client performs live lookups.
+def get_whois_client_name() -> str:
+  """
+  Retrieve the WHOIS client selected by the 'WHOIS_CLIENT' environment variable on first use -
+  'python-whois' (default, blocking) or 'asyncio' (native port-43 client) - Utility method in
+  Trotline finalised Data Pipeline.
+
+  Returns
+  -------
+  str
+    Name of the selected client.
+
+  Exceptions
+  ----------
+  ValueError
+    Raised if the variable names an unknown client.
+  """
+  global _whois_client_name
+
+  if _whois_client_name is None:
+    client_name = os.getenv("WHOIS_CLIENT", "python-whois").strip().lower()
+    if client_name not in ("python-whois", "asyncio"):
+      raise ValueError(f"Unknown WHOIS client - {client_name} (expected 'python-whois' or 'asyncio')")
+    _whois_client_name = client_name
+
+  return _whois_client_name
+
+# Retrieve (or build) the executor running live lookups in the background.
+def get_whois_lookup_executor() -> ThreadPoolExecutor:
+  """
+  Retrieve the process-wide background lookup executor, building it on first use - Utility method
+  in Trotline finalised Data Pipeline. Sized by the 'WHOIS_LOOKUP_WORKERS' environment variable
+  (default 32 threads).
+
+  Returns
+  -------
+  concurrent.futures.ThreadPoolExecutor
+    Executor dedicated to live WHOIS queries.
+  """
+  global _whois_lookup_executor
+
+  if _whois_lookup_executor is None:
+    _whois_lookup_executor = ThreadPoolExecutor(
+      max_workers=int(os.getenv("WHOIS_LOOKUP_WORKERS", "32")),
+      thread_name_prefix="trotline-whois-lookup"
+    )
+
+  return _whois_lookup_executor
+
+# Release the background lookup threads -> Called on application shutdown.
+def shutdown_whois_lookups() -> None:
+  """
+  Shut down the background lookup executor & the native client without waiting for queries still
+  in flight - Utility method in Trotline finalised Data Pipeline. Lookups still in flight are failed,
+  so no caller keeps waiting on a query that was cancelled.
+  """
+  global _whois_lookup_executor
+
+  if _whois_lookup_executor is not None:
+    _whois_lookup_executor.shutdown(wait=False, cancel_futures=True)
+    _whois_lookup_executor = None
+
+  shutdown_whois_client()
+
+  # Queued & native queries never complete now -> Resolve & unregister their lookups.
+  with _whois_lookups_lock:
+    pending_lookups = [lookup for lookup in _whois_lookups.values() if not lookup.resolved]
+    for lookup in pending_lookups:
+      lookup.resolved = True
+    _whois_lookups.clear()
+
+  for lookup in pending_lookups:
+    lookup.result.set_exception(RuntimeError(f"WHOIS lookup of {lookup.domain} cancelled by shutdown"))
+
+# A live lookup of one registered domain, shared by every request waiting on it.
+class WhoisLookup:
+  """
+  Live WHOIS lookup of a registered domain, possibly backed by a hedged second query - Utility class
+  in Trotline finalised Data Pipeline. The first query with dates resolves the lookup (a failed
+  query only does so once no other query is outstanding) and fills the WHOIS cache.
+
+  Parameters
+  ----------
+  domain : str
+    Registered domain to be looked up.
+  """
+
+  __slots__ = ("domain", "result", "queries", "hedged", "resolved")
+
+  def __init__(self, domain: str):
+    self.domain = domain
+    self.result: "Future[Tuple[int | None, int | None]]" = Future()
+    self.queries = 0
+    self.hedged = False
+    self.resolved = False
+
+# Join the lookup in flight for the domain, or register a new one.
+def join_whois_lookup(domain: str) -> Tuple[WhoisLookup, bool]:
+  """
+  Retrieve the live lookup of the domain, registering a new one if none is in flight - Utility
+  method in Trotline finalised Data Pipeline.
+
+  Parameters
+  ----------
+  domain : str
+    Registered domain to be looked up.
+
+  Returns
+  -------
+  tuple[WhoisLookup, bool]
+    The lookup, and whether it was just registered (the caller must start its first query).
+  """
+  with _whois_lookups_lock:
+    lookup = _whois_lookups.get(domain)
+    if lookup is not None:
+      return lookup, False
+
+    lookup = _whois_lookups[domain] = WhoisLookup(domain)
+    lookup.queries = 1
+
+    return lookup, True
+
+# Send a hedged second query for a lookup still in flight.
+def hedge_whois_lookup(lookup: WhoisLookup) -> bool:
+  """
+  Send a second query for the domain of a slow lookup - at most once per lookup - Utility method in
+  Trotline finalised Data Pipeline.
+
+  Parameters
+  ----------
+  lookup : WhoisLookup
+    Lookup still in flight.
+
+  Returns
+  -------
+  bool
+    Returns True if a second query was sent.
+  """
+  with _whois_lookups_lock:
+    if lookup.hedged or lookup.resolved:
+      return False
+    lookup.hedged = True
+    lookup.queries += 1
+
+  start_whois_query(lookup)
+
+  return True
+
+# Start a live query of a lookup in the background.
+def start_whois_query(lookup: WhoisLookup) -> None:
+  """
+  Start a live query for the lookup domain with the selected WHOIS client - Utility method in
+  Trotline finalised Data Pipeline. 'python-whois' queries occupy a background executor thread.
+  Native queries started on an event loop run on that loop; otherwise they run on the client
+  runner thread, and only their completion is handed to the executor.
+
+  Parameters
+  ----------
+  lookup : WhoisLookup
+    Lookup the query belongs to.
+  """
+  lookup_executor = get_whois_lookup_executor()
+
+  # Runs on the client thread -> The executor may have been shut down since the query started.
+  def complete_whois_query(record_future: Future) -> None:
+    try:
+      lookup_executor.submit(run_whois_query, lookup, record_future)
+    except RuntimeError:
+      pass                                                    # Lookup already failed by the shutdown.
+
+  if get_whois_client_name() != "asyncio":
+    lookup_executor.submit(run_whois_query, lookup)
+    return
+
+  try:
+    loop = asyncio.get_running_loop()
+  except RuntimeError:
+    get_whois_client_runner().submit(lookup.domain).add_done_callback(complete_whois_query)
+    return
+
+  query_task = loop.create_task(run_whois_query_async(lookup))
+  _whois_query_tasks.add(query_task)
+  query_task.add_done_callback(_whois_query_tasks.discard)
+
+# Run one live query of a lookup -> Resolves the lookup and fills the WHOIS cache.
+def run_whois_query(lookup: WhoisLookup, record_future: Optional[Future] = None) -> None:
+  """
+  Query the WHOIS registry for the lookup domain and resolve the shared lookup - Utility method in
+  Trotline finalised Data Pipeline. Runs on the background executor.
+
+  Parameters
+  ----------
+  lookup : WhoisLookup
+    Lookup the query belongs to.
+  record_future : concurrent.futures.Future | None
+    Completed record lookup of the native WHOIS client - queried with 'python-whois' if omitted.
+  """
+  whois_dates, query_error = None, None
+  try:
+    whois_dates = lookup_whois_dates(domain=lookup.domain, record_future=record_future)
+  except Exception as err:
+    query_error = err
+
+  resolve_whois_lookup(lookup, whois_dates, query_error)
+
+# Run one native query of a lookup on the event loop -> Resolves the lookup and fills the WHOIS cache.
+async def run_whois_query_async(lookup: WhoisLookup) -> None:
+  """
+  Async counterpart of 'run_whois_query' for the native client - Utility method in Trotline
+  finalised Data Pipeline. The lookup is resolved on the background executor if the WHOIS cache
+  has a Redis tier, so filling it never blocks the event loop.
+
+  Parameters
+  ----------
+  lookup : WhoisLookup
+    Lookup the query belongs to.
+  """
+  whois_dates, query_error = None, None
+  try:
+    whois_dates = await lookup_whois_dates_async(domain=lookup.domain)
+  except Exception as err:
+    query_error = err
+
+  if not get_whois_cache().shared:
+    resolve_whois_lookup(lookup, whois_dates, query_error)
+    return
+
+  try:
+    await asyncio.get_running_loop().run_in_executor(
+      get_whois_lookup_executor(), resolve_whois_lookup, lookup, whois_dates, query_error
+    )
+  except RuntimeError:
+    pass                                                      # Lookup already failed by the shutdown.
+
+# Resolve a lookup with the outcome of one of its queries.
+def resolve_whois_lookup(
+    lookup: WhoisLookup,
+    whois_dates: Optional[Tuple[int | None, int | None]],
+    query_error: Optional[Exception]
+  ) -> None:
+  """
+  Resolve the shared lookup with the outcome of a query and fill the WHOIS cache - Utility method
+  in Trotline finalised Data Pipeline. A failed query is ignored while another query of the
+  lookup is outstanding.
+
+  Parameters
+  ----------
+  lookup : WhoisLookup
+    Lookup the query belongs to.
+  whois_dates : tuple[int | None, int | None] | None
+    Dates returned by the query - None if it raised.
+  query_error : Exception | None
+    Exception raised by the query.
+  """
+  failed = query_error is not None or whois_dates == (None, None)
+
+  with _whois_lookups_lock:
+    lookup.queries -= 1
+    # A failed query defers to an outstanding (hedged) query -> It may still return dates.
+    if lookup.resolved or (failed and lookup.queries):
+      return
+    lookup.resolved = True
+
+  try:
+    if query_error is not None:
+      lookup.result.set_exception(query_error)
+    else:
+      lookup.result.set_result(whois_dates)
+      get_whois_cache().set(lookup.domain, to_whois_cache_entry(whois_dates), negative=failed)
+  finally:
+    # Unregister only after the cache is filled -> Later requests hit the cache instead.
+    with _whois_lookups_lock:
+      if _whois_lookups.get(lookup.domain) is lookup:
+        del _whois_lookups[lookup.domain]
+
+# Wait for a lookup within the latency budget, hedging slow queries.
+def wait_for_whois_lookup(
+    lookup: WhoisLookup,
+    budget: float,
+    hedge_delay: Optional[float]
+  ) -> Tuple[int | None, int | None]:
+  """
+  Wait for the lookup result at most 'budget' seconds, sending a hedged second query after
+  'hedge_delay' seconds - Utility method in Trotline finalised Data Pipeline. An abandoned lookup
+  keeps running in the background and fills the WHOIS cache for later requests.
+
+  Parameters
+  ----------
+  lookup : WhoisLookup
+    Lookup in flight.
+  budget : float
+    Latency budget in seconds.
+  hedge_delay : float | None
+    Seconds before a second query is sent - never hedged if None.
+
+  Returns
+  -------
+  tuple[int | None, int | None]
+    The lookup result, or 'WHOIS_DATES_PENDING' - missing values - if the budget ran out.
+  """
+  remaining_budget = budget
+
+  try:
+    if hedge_delay is not None and hedge_delay < budget:
+      try:
+        return lookup.result.result(timeout=hedge_delay)
+      except FutureTimeoutError:
+        if hedge_whois_lookup(lookup):
+          record_whois_wait("hedged")
+        remaining_budget -= hedge_delay
+
+    whois_dates = lookup.result.result(timeout=remaining_budget)
+    record_whois_wait("completed")
+
+    return whois_dates
+  except FutureTimeoutError:
+    record_whois_wait("budget_exceeded")
+    return WHOIS_DATES_PENDING
+
+# Await a lookup within the latency budget on the event loop, hedging slow queries.
+async def wait_for_whois_lookup_async(
+    lookup: WhoisLookup,
+    budget: float,
+    hedge_delay: Optional[float]
+  ) -> Tuple[int | None, int | None]:
+  """
+  Async counterpart of 'wait_for_whois_lookup' - Utility method in Trotline finalised Data
+  Pipeline. The lookup is awaited on the event loop instead of blocking an executor thread, and
+  giving up on it never cancels the lookup itself.
+
+  Parameters
+  ----------
+  lookup : WhoisLookup
+    Lookup in flight.
+  budget : float
+    Latency budget in seconds.
+  hedge_delay : float | None
+    Seconds before a second query is sent - never hedged if None.
+
+  Returns
+  -------
+  tuple[int | None, int | None]
+    The lookup result, or 'WHOIS_DATES_PENDING' - missing values - if the budget ran out.
+  """
+  # Shared by every waiter -> Each wait shields it, so a timeout only cancels the shield.
+  lookup_result = asyncio.wrap_future(lookup.result)
+  remaining_budget = budget
+
+  try:
+    if hedge_delay is not None and hedge_delay < budget:
+      try:
+        return await asyncio.wait_for(asyncio.shield(lookup_result), timeout=hedge_delay)
+      except asyncio.TimeoutError:
+        if hedge_whois_lookup(lookup):
+          record_whois_wait("hedged")
+        remaining_budget -= hedge_delay
+
+    whois_dates = await asyncio.wait_for(asyncio.shield(lookup_result), timeout=remaining_budget)
+    record_whois_wait("completed")
+
+    return whois_dates
+  except asyncio.TimeoutError:
+    record_whois_wait("budget_exceeded")
+    return WHOIS_DATES_PENDING
 
 # ----------------------------------------
 # PIPELINE WHOIS METHODS
@@ -20,16 +573,22 @@ from src.backend.pipeline.dataset import typosquatted_domains_set
 
 # Extract the necessary WHOIS documentation regarding the specified URL domain.
 # Currently returns the days since Registration & days until Expiration.
-def get_whois_info(text: ExtractResult) -> Tuple[int | None, int | None]:
+def get_whois_info(text: ParsedURL, budget: Optional[float] = None) -> Tuple[int | None, int | None]:
   """
   Check the parsed URL-result information against the WHOIS registry - online URL database for
   storing essential demographic data regarding websites -, and extract the necessary information.
+  Results are cached per registered domain, failed lookups for a shorter period. Callers with a
+  budget (or the native client) share one live lookup per domain.
   Utility method in Trotline finalised Data Pipeline.
   
   Parameters
   ----------
-  text : tldextract.ExtractResult
-    The tldextract-based Result-class containing URL-related information and data.
+  text : ParsedURL
+    The shared parsed view of the URL containing its registered domain.
+  budget : float | None
+    Seconds to wait for an uncached lookup - the lookup continues in the background past it, and
+    'WHOIS_DATES_PENDING' is returned. Waits for completion (at most 'WHOIS_QUERY_DEADLINE_MS')
+    if omitted.
 
   Returns
   -------
@@ -37,34 +596,221 @@ def get_whois_info(text: ExtractResult) -> Tuple[int | None, int | None]:
     Returns two distinct, optional integer values representing the days since WHOIS registration
     and days until WHOIS expiration.
   """
-  # Retrieve the full URL from ExtractResult.
-  text = f"{text.subdomain}.{text.domain}.{text.suffix}"
+  # WHOIS records belong to the registered domain -> Use it as lookup & cache key.
+  registered_domain = text.registered_domain
+  if not registered_domain:
+    return None, None
+
+  whois_cache = get_whois_cache()
+  found, cached_dates = whois_cache.get(registered_domain)
+  if found:
+    return from_whois_cache_entry(cached_dates)
+
+  # Blocking client without budget (fx. batch extraction) -> Query inline, skipping the lookup
+  # registry unless a request-path lookup of the domain is already in flight.
+  if budget is None and get_whois_client_name() == "python-whois" and registered_domain not in _whois_lookups:
+    whois_dates = lookup_whois_dates(domain=registered_domain)
+    whois_cache.set(registered_domain, to_whois_cache_entry(whois_dates), negative=whois_dates == (None, None))
+    return whois_dates
+
+  lookup, registered = join_whois_lookup(registered_domain)
+  if registered:
+    start_whois_query(lookup)
+
+  # No budget -> Wait for the lookup to complete, at most for the lookup deadline.
+  if budget is None:
+    try:
+      return lookup.result.result(timeout=get_whois_query_deadline())
+    except FutureTimeoutError:
+      record_whois_wait("deadline_exceeded")
+      return WHOIS_DATES_PENDING
+
+  return wait_for_whois_lookup(lookup, budget, get_whois_budget_settings()[1])
+
+# Async counterpart of 'get_whois_info' -> Awaited by the async Pipeline on the event loop.
+async def get_whois_info_async(text: ParsedURL, budget: Optional[float] = None) -> Tuple[int | None, int | None]:
+  """
+  Async counterpart of 'get_whois_info' - Utility method in Trotline finalised Data Pipeline.
+  Waiting on the shared lookup never occupies a thread, so the number of requests waiting is not
+  bounded by an executor. The Redis tier of the WHOIS cache is read off the event loop.
+
+  Parameters
+  ----------
+  text : ParsedURL
+    The shared parsed view of the URL containing its registered domain.
+  budget : float | None
+    Seconds to wait for an uncached lookup - the lookup continues in the background past it, and
+    'WHOIS_DATES_PENDING' is returned. Waits for completion (at most 'WHOIS_QUERY_DEADLINE_MS')
+    if omitted.
+
+  Returns
+  -------
+  tuple[int | None, int | None]
+    Days since WHOIS registration and days until WHOIS expiration.
+  """
+  registered_domain = text.registered_domain
+  if not registered_domain:
+    return None, None
+
+  whois_cache = get_whois_cache()
+  found, cached_dates = whois_cache.get_local(registered_domain)
+  if not found:
+    if whois_cache.shared:
+      loop = asyncio.get_running_loop()
+      found, cached_dates = await loop.run_in_executor(None, whois_cache.get_shared, registered_domain)
+    else:
+      found, cached_dates = whois_cache.get_shared(registered_domain)
+  if found:
+    return from_whois_cache_entry(cached_dates)
+
+  lookup, registered = join_whois_lookup(registered_domain)
+  if registered:
+    start_whois_query(lookup)
+
+  # No budget -> Wait for the lookup to complete, at most for the lookup deadline.
+  if budget is None:
+    try:
+      return await asyncio.wait_for(
+        asyncio.shield(asyncio.wrap_future(lookup.result)), timeout=get_whois_query_deadline()
+      )
+    except asyncio.TimeoutError:
+      record_whois_wait("deadline_exceeded")
+      return WHOIS_DATES_PENDING
+
+  return await wait_for_whois_lookup_async(lookup, budget, get_whois_budget_settings()[1])
+
+# Perform the live WHOIS lookup for a registered domain - Bypasses the WHOIS cache.
+def lookup_whois_dates(domain: str, record_future: Optional[Future] = None) -> Tuple[int | None, int | None]:
+  """
+  Query the WHOIS registry for the specified registered domain and convert the registration &
+  expiration dates into day counts - Utility method in Trotline finalised Data Pipeline.
 
+  Parameters
+  ----------
+  domain : str
+    Registered domain (domain + public suffix) to be looked up.
+  record_future : concurrent.futures.Future | None
+    Completed record lookup of the native WHOIS client - queried with 'python-whois' if omitted.
+
+  Returns
+  -------
+  tuple[int | None, int | None]
+    Days since WHOIS registration and days until WHOIS expiration - (None, None) for domains
+    without record, 'WHOIS_DATES_FAILED' if the lookup timed out or failed.
+  """
   try:
-    text.encode("idna")                                               # Attempt to encode = IDNA.
+    if record_future is None:
+      domain.encode("idna")                                           # Attempt to encode = IDNA.
 
-    whois_information_dict = whois.whois(text, timeout=1)             # Extract WHOIS information.
+      # Extract WHOIS information -> Socket errors are raised, so timeouts can be told apart.
+      whois_information_dict = whois.whois(domain, timeout=1, ignore_socket_errors=False)
+    else:
+      whois_information_dict = record_future.result()
+  except (WhoisError, UnicodeError, OSError) as err:
+    return whois_dates_for_error(err)
 
-    current_time = datetime.now(timezone.utc)
+  return whois_record_to_dates(whois_information_dict)
 
-    registration_date = whois_information_dict.get("creation_date")   # Get registration date
-    expiration_date = whois_information_dict.get("expiration_date")   # Get expiration date
+# Perform the live WHOIS lookup with the native client of the running event loop.
+async def lookup_whois_dates_async(domain: str) -> Tuple[int | None, int | None]:
+  """
+  Async counterpart of 'lookup_whois_dates' - Utility method in Trotline finalised Data Pipeline.
+  The native client query is awaited on the running event loop, so lookups in flight are bounded
+  by the client connection limits rather than a thread pool.
 
-    if isinstance(registration_date, list):                           # Check if dates are list-objects
-      registration_date = registration_date[0]
-    if isinstance(expiration_date, list):
-      expiration_date = expiration_date[0]
+  Parameters
+  ----------
+  domain : str
+    Registered domain (domain + public suffix) to be looked up.
 
-    days_since_whois_regis = (current_time - registration_date).days if registration_date else 0
-    days_until_whois_expir = (expiration_date - current_time).days if expiration_date else 0
+  Returns
+  -------
+  tuple[int | None, int | None]
+    Days since WHOIS registration and days until WHOIS expiration - (None, None) for domains
+    without record, 'WHOIS_DATES_FAILED' if the lookup timed out or failed.
+  """
+  try:
+    whois_information_dict = await get_async_whois_client().lookup(domain)
+  except (WhoisError, UnicodeError, OSError) as err:
+    return whois_dates_for_error(err)
+
+  return whois_record_to_dates(whois_information_dict)
+
+# Convert the dates of a WHOIS record into day counts.
+def whois_record_to_dates(whois_information_dict: Dict) -> Tuple[int, int]:
+  """
+  Convert the registration & expiration dates of a WHOIS record ('python-whois' or native) into
+  day counts - Utility method in Trotline finalised Data Pipeline.
+
+  Parameters
+  ----------
+  whois_information_dict : dict
+    WHOIS record holding 'creation_date' & 'expiration_date'.
+
+  Returns
+  -------
+  tuple[int, int]
+    Days since WHOIS registration and days until WHOIS expiration - 0 for missing dates.
+  """
+  current_time = datetime.now(timezone.utc)
+
+  registration_date = whois_information_dict.get("creation_date")     # Get registration date
+  expiration_date = whois_information_dict.get("expiration_date")     # Get expiration date
+
+  if isinstance(registration_date, list):                             # Check if dates are list-objects
+    registration_date = registration_date[0]
+  if isinstance(expiration_date, list):
+    expiration_date = expiration_date[0]
+
+  if registration_date and registration_date.tzinfo is None:          # Registries may omit timezone
+    registration_date = registration_date.replace(tzinfo=timezone.utc)
+  if expiration_date and expiration_date.tzinfo is None:
+    expiration_date = expiration_date.replace(tzinfo=timezone.utc)
+
+  days_since_whois_regis = (current_time - registration_date).days if registration_date else 0
+  days_until_whois_expir = (expiration_date - current_time).days if expiration_date else 0
+
+  record_whois_outcome("success")
 
-    return days_since_whois_regis, days_until_whois_expir
-  except (WhoisCommandFailedError, WhoisDomainNotFoundError, WhoisError, UnicodeError, ConnectionResetError):
+  return days_since_whois_regis, days_until_whois_expir
+
+# Convert the error of a failed WHOIS lookup into WHOIS dates.
+def whois_dates_for_error(err: Exception) -> Tuple[int | None, int | None]:
+  """
+  Map the error raised by a WHOIS lookup onto the dates it stands for, recording its outcome -
+  Utility method in Trotline finalised Data Pipeline.
+
+  Parameters
+  ----------
+  err : Exception
+    Error raised by 'python-whois' or the native client.
+
+  Returns
+  -------
+  tuple[int | None, int | None]
+    (None, None) for unregistered domains & domains that cannot be IDNA-encoded (permanent),
+    'WHOIS_DATES_FAILED' for timeouts & other failures.
+  """
+  if isinstance(err, WhoisDomainNotFoundError):
+    record_whois_outcome("not_found")
     return None, None
-  
+  if isinstance(err, TimeoutError):
+    record_whois_outcome("timeout")
+    return WHOIS_DATES_FAILED
+  if isinstance(err, UnicodeError):                                   # Permanent -> Never repeated.
+    record_whois_outcome("error")
+    return None, None
+
+  record_whois_outcome("error")
+  return WHOIS_DATES_FAILED
+
 # Wrapper method for extracting, processing and formulating WHOIS Data correctly.
 # Returns a Python Dict.
-def retrieve_extracted_url_data(url: str) -> Dict[str, Union[float | None, int | None]]:
+def retrieve_extracted_url_data(
+    url: str,
+    parsed_url: Optional[ParsedURL] = None,
+    whois_budget: Optional[float] = None
+  ) -> Dict[str, Union[float, int, str, None]]:
   """
   Method for extracting the specified URL's WHOIS registry data and information - 
   Utility method in Trotline finalised Data Pipeline.
@@ -73,28 +819,42 @@ def retrieve_extracted_url_data(url: str) -> Dict[str, Union[float | None, int |
   ----------
   url : str
     Suspected URL-string to check against the WHOIS registry.
+  parsed_url : ParsedURL | None
+    Shared parsed view of the URL - parsed from the URL if omitted.
+  whois_budget : float | None
+    Seconds to wait for an uncached WHOIS lookup - WHOIS features are missing past it. Waits for
+    completion if omitted.
 
   Returns
   -------
-  dict[str, union[float | None, int | None]]
-    Dictionary containing WHOIS-related and typosquatting data. 
+  dict[str, union[float, int, str, None]]
+    Dictionary containing WHOIS-related and typosquatting data - including the closest protected
+    brand and its distance when the domain is typosquatted.
   """
   # Parse the URL to retreive critical information.
-  extracted_url = extract_hostname(url=url)
+  if parsed_url is None:
+    parsed_url = parse_url(url=url)
 
   # Retrieve WHOIS information.
-  reg_date, exp_date = get_whois_info(text=extracted_url)
+  with time_stage("whois"):
+    reg_date, exp_date = get_whois_info(text=parsed_url, budget=whois_budget)
+
+  # Find the closest protected brand within the typosquatting threshold.
+  with time_stage("typosquatting"):
+    typosquat_brand, typosquat_distance = find_typosquatted_brand(
+        hostname=parsed_url,
+        domains=typosquatted_domains_index,
+        threshold=2
+    )
 
   # Gather all information into Results-dict
   results = {
-      "is_typosquatted": is_domain_typosquatted(
-          hostname=extracted_url,
-          domains=typosquatted_domains_set,
-          threshold=2
-      ),
+      "is_typosquatted": typosquat_brand is not None,
       "whois_valid": bool(reg_date and exp_date),
       "days_since_whois_reg": reg_date,
       "days_until_whois_exp": exp_date,
+      "typosquat_distance": typosquat_distance,
+      "typosquat_brand": typosquat_brand,
   }
 
   return results
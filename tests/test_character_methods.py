@@ -0,0 +1,71 @@
+# ----------------------------------------
+# IMPORTS
+# ----------------------------------------
+
+import math
+import pandas as pd
+import pytest
+
+from src.backend.pipeline.character_methods import (
+  MAX_URL_LENGTH,
+  build_character_histogram,
+  retrieve_character_based_data,
+  retrieve_character_based_data_batch,
+  special_characters_map
+)
+from src.backend.pipeline.helper_methods import calculate_shannon_entropy
+
+# ----------------------------------------
+# CHARACTER STATISTICS TESTS
+# ----------------------------------------
+
+# ASCII, non-ASCII (BMP & astral) and degenerate URL-strings.
+CHARACTER_CORPUS = [
+  "",
+  "a",
+  "aaaaaaaaaa",
+  "https://example.com/",
+  "https://paypal.com.secure-login.xyz/authenticate?id=1&confirmation=yes#top",
+  "http://user:p@ss@192.168.0.1:8080/a_b~c/%7E%2F;x=1,y=2|z*'q'$ end",
+  "https://über.de/straße?q=日本語&emoji=🎣🎣",
+  "www.www.wwwexample.com/www",
+  "0123456789" * 20,
+  "https://example.com/" + "a/b-c.d" * 500,
+]
+
+# Per-position entropy sum the histogram-based entropy replaced -> Quadratic in the URL length.
+def per_position_entropy(text: str) -> float:
+  probabilities = [float(text.count(char)) / len(text) for char in list(text)]
+  return -sum([p * math.log2(p) for p in probabilities])
+
+@pytest.mark.parametrize("text", CHARACTER_CORPUS)
+def test_entropy_matches_per_position_sum(text):
+  assert calculate_shannon_entropy(text=text) == pytest.approx(per_position_entropy(text), rel=1e-12, abs=1e-12)
+  assert calculate_shannon_entropy(text=text, histogram=build_character_histogram(text)) == calculate_shannon_entropy(text=text)
+
+@pytest.mark.parametrize("text", CHARACTER_CORPUS)
+def test_character_counts_match_naive_counts(text):
+  results = retrieve_character_based_data(url=text)
+
+  for name, char in special_characters_map.items():
+    assert results[name] == text.count(char)
+  assert results["nb_digits"] == sum(char in "0123456789" for char in text)
+  assert results["nb_www"] == text.count("www")
+  assert results["url_length"] == len(text)
+
+def test_character_batch_matches_single_url():
+  urls = pd.Series([text for text in CHARACTER_CORPUS if text])
+
+  batch_results = retrieve_character_based_data_batch(urls=urls)
+  single_results = pd.DataFrame([retrieve_character_based_data(url=url) for url in urls])
+
+  pd.testing.assert_frame_equal(
+    batch_results[single_results.columns].astype("float64"),
+    single_results.astype("float64")
+  )
+
+def test_histogram_rejects_oversized_url():
+  build_character_histogram("a" * MAX_URL_LENGTH)
+
+  with pytest.raises(ValueError):
+    build_character_histogram("a" * (MAX_URL_LENGTH + 1))
@@ -0,0 +1,141 @@
+# ----------------------------------------
+# IMPORTS
+# ----------------------------------------
+
+import random
+import string
+import pytest
+
+from typing import Dict, Iterable, List, Optional, Tuple
+from pyxdameraulevenshtein import damerau_levenshtein_distance as pdl_distance
+
+from src.backend.pipeline.dataset import suspicious_keywords_set, typosquatted_domains_set
+from src.backend.pipeline.helper_methods import suspicious_keywords_matcher, typosquatted_domains_index
+from src.backend.pipeline.matching_methods import KeywordMatcher, url_component_spans
+
+# ----------------------------------------
+# TYPOSQUATTING INDEX TESTS
+# ----------------------------------------
+
+# Linear Damerau-Levenshtein scan the deletion index replaced -> Closest brand, ties alphabetical.
+def linear_closest_match(text: str, threshold: int) -> Tuple[Optional[str], Optional[int]]:
+  matches = [
+    (distance, brand)
+    for brand in typosquatted_domains_set
+    for distance in [pdl_distance(text, brand.lower())]
+    if 0 < distance <= threshold
+  ]
+  if not matches:
+    return None, None
+
+  distance, brand = min(matches)
+  return brand, distance
+
+# Every brand & its single-edit variants, plus seeded 1 - 3 edit variants & unrelated strings.
+def typosquat_corpus() -> List[str]:
+  corpus = ["", "a", "xn--80ak6aa92e", "example", "localhost", "a" * 40]
+
+  for brand in sorted(typosquatted_domains_set):
+    corpus.append(brand)                                                                # Exact match
+    for position in range(len(brand) + 1):
+      corpus.append(brand[:position] + "z" + brand[position:])                          # Insertion
+      if position < len(brand):
+        corpus.append(brand[:position] + brand[position + 1:])                         # Deletion
+        corpus.append(brand[:position] + "x" + brand[position + 1:])                   # Substitution
+      if position < len(brand) - 1:
+        corpus.append(brand[:position] + brand[position + 1] + brand[position] + brand[position + 2:])
+
+  generator = random.Random(5)
+  alphabet = string.ascii_lowercase + string.digits + "-"
+  brands = sorted(typosquatted_domains_set)
+  for _ in range(500):
+    variant = list(generator.choice(brands))
+    for _ in range(generator.randint(1, 3)):
+      position = generator.randrange(len(variant) + 1)
+      edit = generator.choice(("insert", "delete", "substitute", "transpose"))
+      if edit == "insert":
+        variant.insert(position, generator.choice(alphabet))
+      elif position < len(variant) - 1 and edit == "transpose":
+        variant[position], variant[position + 1] = variant[position + 1], variant[position]
+      elif position < len(variant) and edit == "delete":
+        del variant[position]
+      elif position < len(variant):
+        variant[position] = generator.choice(alphabet)
+    corpus.append("".join(variant))
+
+  return corpus
+
+@pytest.mark.parametrize("threshold", [1, 2])
+def test_typosquat_index_matches_linear_scan(threshold):
+  mismatches = []
+  for text in typosquat_corpus():
+    indexed_match = typosquatted_domains_index.closest_match(text=text, threshold=threshold)
+    if indexed_match != linear_closest_match(text, threshold):
+      mismatches.append((text, indexed_match, linear_closest_match(text, threshold)))
+
+  assert mismatches == []
+
+# ----------------------------------------
+# KEYWORD MATCHER TESTS
+# ----------------------------------------
+
+# URLs with overlapping, nested & repeated keywords (fx. 'auth' in 'authenticate', 'id' in 'identity').
+KEYWORD_CORPUS = [
+  "",
+  "https://example.com/",
+  "https://paypal.com.secure-login.xyz/authenticate?id=1&confirmation=yes",
+  "http://bank-banking-bankbank.com/identity/verify/account",
+  "https://login.microsoftonline.com.auth.ru/signin?redirect=/password/reset#update",
+  "wallet-walletwallet.io/crypto/exchange/claim-bonus?invoice=0001&order=2",
+  "HTTPS://PAYPAL.COM/LOGIN",
+  "https://xn--pypal-4ve.com/idid/ididid?didi=id",
+  "http://192.168.0.1:8080/admin/../billing/checkout;jsessionid=abc?expired=1&failed=true",
+  "https://docs.example.org/unlocked/notices/importantly/downloaded-installers",
+]
+
+# Naive per-keyword scan the single-pass matcher replaced -> Overlapping occurrences are counted.
+def naive_keyword_occurrences(text: str, keywords: Iterable[str]) -> List[Tuple[int, str]]:
+  return sorted(
+    (offset, keyword)
+    for keyword in keywords
+    if keyword
+    for offset in range(len(text) - len(keyword) + 1)
+    if text.startswith(keyword, offset)
+  )
+
+# Naive URL summary -> Component flags from the keywords contained in each component slice.
+def naive_match_url(url: str, keywords: Iterable[str]) -> Dict[str, int]:
+  occurrences = naive_keyword_occurrences(url, keywords)
+  results = {
+    "nb_sus_keywords": len(occurrences),
+    "nb_distinct_sus_keywords": len({keyword for _, keyword in occurrences}),
+  }
+  for component, (start, end) in url_component_spans(url).items():
+    results[f"sus_keyword_in_{component}"] = any(keyword in url[start:end] for keyword in keywords if keyword)
+
+  return results
+
+@pytest.mark.parametrize("url", KEYWORD_CORPUS)
+def test_keyword_matcher_matches_naive_scan(url):
+  assert sorted(suspicious_keywords_matcher.find_all(url)) == naive_keyword_occurrences(url, suspicious_keywords_set)
+  assert suspicious_keywords_matcher.contains(url) == any(keyword in url for keyword in suspicious_keywords_set)
+  assert suspicious_keywords_matcher.match_url(url) == naive_match_url(url, suspicious_keywords_set)
+
+@pytest.mark.parametrize("keywords, text", [
+  (["a", "aa", "aaa"], "aaaaa"),
+  (["ab", "abc", "bc", "c"], "abcabcab"),
+  (["he", "she", "his", "hers"], "ushershishe"),
+  (["a.b", "c+", "(x)", "[y]", "z?"], "a.bc++(x)[y]z?aXb"),
+  (["ü", "über", "straße"], "https://über.de/straße"),
+])
+def test_keyword_matcher_counts_overlapping_keywords(keywords, text):
+  matcher = KeywordMatcher(keywords=keywords)
+
+  assert matcher.find_all(text) == naive_keyword_occurrences(text, keywords)
+  assert matcher.match_url(text) == naive_match_url(text, keywords)
+
+def test_keyword_matcher_without_keywords():
+  matcher = KeywordMatcher(keywords=["", ""])
+
+  assert not matcher.contains("anything")
+  assert matcher.find_all("anything") == []
@@ -0,0 +1,56 @@
+# ----------------------------------------
+# IMPORTS
+# ----------------------------------------
+
+import pytest
+
+from src.backend.pipeline.parsing_methods import canonicalize_url
+
+# ----------------------------------------
+# URL CANONICALIZATION TESTS
+# ----------------------------------------
+
+CANONICAL_URL_CASES = [
+  # Scheme & host case, default path
+  ("HTTPS://Example.COM", "https://example.com/"),
+  ("HTTPS://Example.COM/Login", "https://example.com/Login"),
+  (" http://example.com/path ", "http://example.com/path"),
+  # IDNA
+  ("http://bücher.de/straße", "http://xn--bcher-kva.de/straße"),
+  ("http://BÜCHER.de", "http://xn--bcher-kva.de/"),
+  ("http://xn--bcher-kva.de/", "http://xn--bcher-kva.de/"),
+  # Default ports
+  ("http://example.com:80/", "http://example.com/"),
+  ("https://example.com:443/", "https://example.com/"),
+  ("https://example.com:80/", "https://example.com:80/"),
+  ("http://example.com:8080/", "http://example.com:8080/"),
+  ("http://user:pw@Example.com:80/x", "http://user:pw@example.com/x"),
+  ("http://[::1]:80/", "http://[::1]/"),
+  # Percent-encoding case & unreserved escapes
+  ("http://example.com/%7e%41", "http://example.com/~A"),
+  ("http://example.com/a%2fb%7Ec", "http://example.com/a%2Fb~c"),
+  ("http://example.com/a%20b?q=%e2%82%ac", "http://example.com/a%20b?q=%E2%82%AC"),
+  # Tracking parameters & query order
+  ("https://Example.com:443/login?b=2&a=1&utm_source=x", "https://example.com/login?a=1&b=2"),
+  ("http://example.com/?utm_medium=a&UTM_CAMPAIGN=b&fbclid=z&gclid=1&id=3", "http://example.com/?id=3"),
+  ("http://example.com/?%75tm_source=x&id=3", "http://example.com/?id=3"),
+  ("http://example.com/?utm_source", "http://example.com/"),
+  ("http://example.com/?a=1&&b=2", "http://example.com/?a=1&b=2"),
+  # Fragments
+  ("http://example.com/path#section", "http://example.com/path"),
+  ("http://example.com/?a=1#utm_source=x", "http://example.com/?a=1"),
+  # Scheme-less URLs stay scheme-less
+  ("Example.com/Path?b=2&a=1#x", "example.com/Path?a=1&b=2"),
+  ("example.com:443/", "example.com:443/"),
+]
+
+@pytest.mark.parametrize("url, canonical_url", CANONICAL_URL_CASES)
+def test_canonicalize_url(url, canonical_url):
+  assert canonicalize_url(url) == canonical_url
+
+@pytest.mark.parametrize("url, canonical_url", CANONICAL_URL_CASES)
+def test_canonicalize_url_is_idempotent(url, canonical_url):
+  assert canonicalize_url(canonical_url) == canonical_url
+
+def test_canonicalize_url_keeps_unsplittable_urls():
+  assert canonicalize_url(" http://[::1/path ") == "http://[::1/path"
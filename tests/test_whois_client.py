@@ -0,0 +1,201 @@
+# ----------------------------------------
+# IMPORTS
+# ----------------------------------------
+
+import asyncio
+import contextlib
+import pytest
+
+from datetime import datetime, timezone
+from typing import AsyncIterator, Awaitable, Callable, List
+from whois.exceptions import FailedParsingWhoisOutputError, WhoisDomainNotFoundError
+
+from src.backend.pipeline.whois_client_methods import AsyncWhoisClient, parse_whois_response
+
+# ----------------------------------------
+# STAND-IN WHOIS SERVER
+# ----------------------------------------
+
+# Registry response of a registered domain.
+REGISTERED_RESPONSE = (
+  "Domain Name: EXAMPLE.COM\r\n"
+  "Creation Date: 1995-08-14T04:00:00Z\r\n"
+  "Registry Expiry Date: 2030-08-13T04:00:00Z\r\n"
+)
+
+# Serve WHOIS queries on 127.0.0.1 with the specified handler.
+@contextlib.asynccontextmanager
+async def whois_server(handler: Callable[[str], Awaitable[str]]) -> AsyncIterator[int]:
+  """
+  Run a stand-in port-43 server on 127.0.0.1 answering every query line with 'handler' - yields
+  the port it listens on.
+  """
+  async def serve(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+    try:
+      query = (await reader.readline()).decode("ascii").strip()
+      writer.write((await handler(query)).encode("utf-8"))
+      await writer.drain()
+    finally:
+      writer.close()
+
+  server = await asyncio.start_server(serve, "127.0.0.1", 0)
+  try:
+    yield server.sockets[0].getsockname()[1]
+  finally:
+    server.close()
+
+# Native client asking the stand-in server for '.com' domains.
+def build_client(port: int, **client_options) -> AsyncWhoisClient:
+  return AsyncWhoisClient(
+    servers={"com": "127.0.0.1"},
+    query_formats={"localhost": "registrar {domain}"},
+    port=port,
+    **client_options
+  )
+
+# ----------------------------------------
+# NATIVE WHOIS CLIENT TESTS
+# ----------------------------------------
+
+def test_lookup_follows_referral_to_registrar():
+  queries: List[str] = []
+
+  # The registry refers to the registrar, which alone publishes the creation date.
+  async def handler(query: str) -> str:
+    queries.append(query)
+    if query.startswith("registrar "):
+      return "Domain Name: example.com\r\nCreated On: 1995-08-14\r\n"
+    return "Registry Expiry Date: 2030-08-13T04:00:00Z\r\nRegistrar WHOIS Server: localhost\r\n"
+
+  async def lookup():
+    async with whois_server(handler) as port:
+      return await build_client(port).lookup("example.com")
+
+  record = asyncio.run(lookup())
+
+  assert queries == ["example.com", "registrar example.com"]
+  assert record["creation_date"] == datetime(1995, 8, 14)
+  assert record["expiration_date"] == datetime(2030, 8, 13, 4, tzinfo=timezone.utc)
+  assert record["whois_server"] == "localhost"
+
+def test_lookup_stops_at_registry_with_both_dates():
+  queries: List[str] = []
+
+  async def handler(query: str) -> str:
+    queries.append(query)
+    return REGISTERED_RESPONSE + "Registrar WHOIS Server: localhost\r\n"
+
+  async def lookup():
+    async with whois_server(handler) as port:
+      return await build_client(port).lookup("example.com")
+
+  record = asyncio.run(lookup())
+
+  assert queries == ["example.com"]
+  assert record["whois_server"] == "127.0.0.1"
+
+@pytest.mark.parametrize("response", [
+  'No match for "UNREGISTERED.COM".\r\n',
+  "%ERROR:101: no entries found\r\n",
+  "%% No matching objects found\r\n",
+  "NOT FOUND\r\n",
+  "Status: free\r\n",
+])
+def test_lookup_raises_not_found(response):
+  async def handler(query: str) -> str:
+    return response
+
+  async def lookup():
+    async with whois_server(handler) as port:
+      return await build_client(port).lookup("unregistered.com")
+
+  with pytest.raises(WhoisDomainNotFoundError):
+    asyncio.run(lookup())
+
+def test_lookup_ignores_not_found_outside_registry_phrases():
+  # Disclaimers & field values mentioning 'not found' belong to registered domains.
+  async def handler(query: str) -> str:
+    return REGISTERED_RESPONSE + "Registrar URL: http://registrar.example/notfound\r\n% Object not found? Contact us.\r\n"
+
+  async def lookup():
+    async with whois_server(handler) as port:
+      return await build_client(port).lookup("example.com")
+
+  record = asyncio.run(lookup())
+
+  assert record["creation_date"] == datetime(1995, 8, 14, 4, tzinfo=timezone.utc)
+
+def test_lookup_fails_on_unparseable_response():
+  async def handler(query: str) -> str:
+    return "Query rate exceeded - try again later\r\n"
+
+  async def lookup():
+    async with whois_server(handler) as port:
+      return await build_client(port).lookup("example.com")
+
+  with pytest.raises(FailedParsingWhoisOutputError):
+    asyncio.run(lookup())
+
+def test_lookup_raises_timeout_past_deadline():
+  async def handler(query: str) -> str:
+    await asyncio.sleep(5)
+    return REGISTERED_RESPONSE
+
+  async def lookup():
+    async with whois_server(handler) as port:
+      return await build_client(port, deadline=0.1).lookup("example.com")
+
+  with pytest.raises(TimeoutError):
+    asyncio.run(lookup())
+
+def test_lookup_many_respects_per_server_limit():
+  connections = {"open": 0, "peak": 0}
+
+  async def handler(query: str) -> str:
+    connections["open"] += 1
+    connections["peak"] = max(connections["peak"], connections["open"])
+    await asyncio.sleep(0.05)
+    connections["open"] -= 1
+    return REGISTERED_RESPONSE
+
+  async def lookup_many():
+    async with whois_server(handler) as port:
+      return await build_client(port, per_server_limit=2).lookup_many([f"site{i}.com" for i in range(8)])
+
+  records = asyncio.run(lookup_many())
+
+  assert all(isinstance(record, dict) for record in records)
+  assert connections["peak"] == 2
+
+# ----------------------------------------
+# WHOIS RESPONSE PARSING TESTS
+# ----------------------------------------
+
+@pytest.mark.parametrize("line, expected", [
+  ("Creation Date: 1995-08-14T04:00:00Z", datetime(1995, 8, 14, 4, tzinfo=timezone.utc)),
+  ("Creation Date: 1995-08-14T04:00:00.0Z", datetime(1995, 8, 14, 4, tzinfo=timezone.utc)),
+  ("created: 1995-08-14", datetime(1995, 8, 14)),
+  ("Created On: 14-Aug-1995", datetime(1995, 8, 14)),
+  ("Registered: 1995.08.14", datetime(1995, 8, 14)),
+  ("Registration Date: 1995/08/14", datetime(1995, 8, 14)),
+  ("registered on: 14.08.1995", datetime(1995, 8, 14)),
+  ("Registration Time: 1995.08.14 04:00:00", datetime(1995, 8, 14, 4)),
+  ("Created on..............: 14/08/1995", datetime(1995, 8, 14)),
+  ("Creation Date: 1995-08-14 04:00:00 UTC", datetime(1995, 8, 14, 4, tzinfo=timezone.utc)),
+  ("Creation Date: Mon Aug 14 04:00:00 GMT 1995", datetime(1995, 8, 14, 4, tzinfo=timezone.utc)),
+])
+def test_parse_whois_response_date_formats(line, expected):
+  record = parse_whois_response(f"Domain Name: example.com\r\n{line}\r\n")
+
+  assert record["creation_date"] == expected
+  assert record["expiration_date"] is None
+
+def test_parse_whois_response_keeps_first_dates():
+  record = parse_whois_response(
+    REGISTERED_RESPONSE
+    + "paid-till: 2031-01-01T00:00:00Z\r\n"
+    + "Creation Date: not a date\r\n"
+  )
+
+  assert record["creation_date"] == datetime(1995, 8, 14, 4, tzinfo=timezone.utc)
+  assert record["expiration_date"] == datetime(2030, 8, 13, 4, tzinfo=timezone.utc)